@@ -6,11 +6,46 @@ This module contains various agent implementations:
 - ReactAgent: Agent with reasoning capabilities
 - ToolAgent: Agent with tool execution capabilities
 - HybridAgent: Agent that can switch between single and multi-agent modes
+- Trace: Compact record of an agent run
+- TaskGraph: Subtasks and their dependencies, for multi-agent mode
+
+The classes are imported lazily on first attribute access (PEP 562), so
+importing this package does not pull in every agent implementation.
 """
 
-from anus.core.agent.base_agent import BaseAgent
-from anus.core.agent.react_agent import ReactAgent
-from anus.core.agent.tool_agent import ToolAgent
-from anus.core.agent.hybrid_agent import HybridAgent
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from anus.core.agent.base_agent import BaseAgent
+    from anus.core.agent.react_agent import ReactAgent
+    from anus.core.agent.tool_agent import ToolAgent
+    from anus.core.agent.hybrid_agent import HybridAgent
+    from anus.core.agent.trace import Trace, TraceLevel
+    from anus.core.agent.task_graph import Subtask, TaskGraph
+
+_LAZY_ATTRIBUTES = {
+    "BaseAgent": "anus.core.agent.base_agent",
+    "ReactAgent": "anus.core.agent.react_agent",
+    "ToolAgent": "anus.core.agent.tool_agent",
+    "HybridAgent": "anus.core.agent.hybrid_agent",
+    "Trace": "anus.core.agent.trace",
+    "TraceLevel": "anus.core.agent.trace",
+    "Subtask": "anus.core.agent.task_graph",
+    "TaskGraph": "anus.core.agent.task_graph",
+}
+
+__all__ = ["BaseAgent", "ReactAgent", "ToolAgent", "HybridAgent", "Trace", "TraceLevel", "Subtask", "TaskGraph"]
+
+def __getattr__(name: str) -> Any:
+    """Import an agent class on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-__all__ = ["BaseAgent", "ReactAgent", "ToolAgent", "HybridAgent"]
\ No newline at end of file
+def __dir__() -> List[str]:
+    """List the lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,13 +3,22 @@ Base Agent module that defines the core agent functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Iterator, Optional
+
+from anus.core.agent.streaming import astream_run
+from anus.core.hooks import HookRegistry
+from anus.core.utils.async_utils import iterate_sync, run_sync
 
 class BaseAgent(ABC):
     """
     Abstract base class for all agent implementations.
     
-    Defines the common interface that all agents must implement.
+    Defines the common interface that all agents must implement. Agents
+    implement the asynchronous `aexecute`; the synchronous `execute` is a thin
+    wrapper that runs it to completion. `aexecute_stream` and
+    `execute_stream` run the same code but yield events as the run goes.
+    Hooks registered with `add_hook` are called at each step of a run; see
+    `anus.core.hooks`.
     """
     
     def __init__(
@@ -26,8 +35,39 @@ class BaseAgent(ABC):
         """
         self.name = name or "anus-agent"
         self.config = kwargs
+        self.hooks = HookRegistry()
+    
+    def add_hook(self, hook: Any) -> None:
+        """
+        Register a hook to be called during runs of this agent.
+        
+        Args:
+            hook: An object with any of the methods in `HOOK_EVENTS`.
+        """
+        self.hooks.add(hook)
+    
+    def remove_hook(self, hook: Any) -> None:
+        """
+        Unregister a hook.
+        
+        Args:
+            hook: A previously registered hook.
+        """
+        self.hooks.remove(hook)
     
     @abstractmethod
+    async def aexecute(self, task: str) -> Dict[str, Any]:
+        """
+        Execute a task asynchronously and return the result.
+        
+        Args:
+            task: The task to execute.
+            
+        Returns:
+            A dictionary containing the execution result and metadata.
+        """
+        pass
+    
     def execute(self, task: str) -> Dict[str, Any]:
         """
         Execute a task and return the result.
@@ -38,7 +78,35 @@ class BaseAgent(ABC):
         Returns:
             A dictionary containing the execution result and metadata.
         """
-        pass
+        return run_sync(self.aexecute(task))
+    
+    async def aexecute_stream(self, task: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a task asynchronously, yielding events as they happen.
+        
+        Stopping the iteration early cancels the run.
+        
+        Args:
+            task: The task to execute.
+            
+        Yields:
+            Thought, token, action and observation events, then a "final"
+            event carrying the answer and the full result.
+        """
+        async for event in astream_run(lambda: self.aexecute(task)):
+            yield event
+    
+    def execute_stream(self, task: str) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a task, yielding events as they happen.
+        
+        Args:
+            task: The task to execute.
+            
+        Yields:
+            The events described in `aexecute_stream`.
+        """
+        yield from iterate_sync(self.aexecute_stream(task))
     
     def __str__(self) -> str:
         """Return a string representation of the agent."""
@@ -0,0 +1,206 @@
+"""
+Context window module that keeps the prompt of an agent run within budget.
+
+Every thought, action and observation of a run is added to the window with
+its token count, so the size of the prompt is always known without
+re-counting the history. When the window grows past its budget, the oldest
+entries are compacted by truncating, summarizing or dropping them, while
+the most recent ones are always kept intact.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from anus.core.agent.termination import estimate_tokens
+
+class CompactionStrategy:
+    """Ways to shrink the older part of a context window."""
+    
+    # Cut each old entry down to a few tokens
+    TRUNCATE = "truncate"
+    # Replace all old entries with one summary entry
+    SUMMARIZE = "summarize"
+    # Remove old entries, oldest first
+    DROP = "drop"
+    
+    ALL = (TRUNCATE, SUMMARIZE, DROP)
+
+SUMMARY_HEADER = "Summary of earlier steps:"
+
+def summarize_entries(texts: List[str], max_lines: int = 20) -> str:
+    """
+    Summarize entries by keeping the start of the first line of each.
+    
+    Lines of an earlier summary are carried over, and only the most recent
+    `max_lines` lines are kept.
+    
+    Args:
+        texts: The texts to summarize, oldest first.
+        max_lines: Maximum number of lines in the summary.
+        
+    Returns:
+        The summary text.
+    """
+    lines = []
+    for text in texts:
+        if text.startswith(SUMMARY_HEADER):
+            lines.extend(text.split("\n")[1:])
+            continue
+        line = text.strip().split("\n", 1)[0]
+        lines.append(line if len(line) <= 80 else line[:77] + "...")
+    return "\n".join([SUMMARY_HEADER] + lines[-max_lines:])
+
+class _Entry:
+    """A message in the window and its token count."""
+    
+    __slots__ = ("role", "text", "tokens", "compacted")
+    
+    def __init__(self, role: str, text: str, tokens: int, compacted: bool = False):
+        self.role = role
+        self.text = text
+        self.tokens = tokens
+        self.compacted = compacted
+
+class ContextWindow:
+    """
+    A token-budgeted history of chat messages for one agent run.
+    
+    Adding an entry costs O(1), and compaction is amortized O(1) per entry,
+    because entries that were already compacted are not visited again.
+    """
+    
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        strategy: str = CompactionStrategy.TRUNCATE,
+        keep_recent: int = 4,
+        truncate_tokens: int = 32,
+        summarizer: Optional[Callable[[List[str]], str]] = None
+    ):
+        """
+        Initialize a ContextWindow instance.
+        
+        Args:
+            max_tokens: Token budget of the window, or None for no limit.
+            strategy: One of the CompactionStrategy values.
+            keep_recent: Number of most recent entries never compacted.
+            truncate_tokens: Size old entries are cut to by truncation.
+            summarizer: Function turning old entry texts into a summary.
+                Defaults to `summarize_entries`.
+        """
+        if strategy not in CompactionStrategy.ALL:
+            raise ValueError(f"Unknown compaction strategy: {strategy}")
+        self.max_tokens = max_tokens
+        self.strategy = strategy
+        self.keep_recent = keep_recent
+        self.truncate_tokens = truncate_tokens
+        self.summarizer = summarizer or summarize_entries
+        self.tokens = 0
+        self.tokens_saved = 0
+        self.compactions = 0
+        self._entries: Deque[_Entry] = deque()
+        # Number of leading entries that are already compacted
+        self._compacted = 0
+    
+    def __len__(self) -> int:
+        """Return the number of entries in the window."""
+        return len(self._entries)
+    
+    def append(self, role: str, text: str) -> None:
+        """
+        Add a message, compacting older entries if the budget is exceeded.
+        
+        Args:
+            role: The chat role of the message.
+            text: The message text.
+        """
+        tokens = estimate_tokens(text)
+        self._entries.append(_Entry(role, text, tokens))
+        self.tokens += tokens
+        if self.max_tokens is not None and self.tokens > self.max_tokens:
+            self.compact()
+    
+    def compact(self) -> int:
+        """
+        Compact older entries until the window fits its budget, if possible.
+        
+        Returns:
+            The number of tokens saved.
+        """
+        before = self.tokens
+        if self.strategy == CompactionStrategy.SUMMARIZE:
+            self._summarize()
+        elif self.strategy == CompactionStrategy.TRUNCATE:
+            self._truncate()
+        # Dropping is also the fallback when the other strategies fall short
+        self._drop()
+        
+        saved = before - self.tokens
+        if saved > 0:
+            self.tokens_saved += saved
+            self.compactions += 1
+        return saved
+    
+    def _over_budget(self) -> bool:
+        """Return True if the window exceeds its budget."""
+        return self.max_tokens is not None and self.tokens > self.max_tokens
+    
+    def _truncate(self) -> None:
+        """Truncate old entries, oldest first, until the window fits."""
+        entries = self._entries
+        limit = self.truncate_tokens * 4
+        while self._over_budget() and self._compacted < len(entries) - self.keep_recent:
+            entry = entries[self._compacted]
+            if len(entry.text) > limit:
+                entry.text = entry.text[:limit] + "..."
+                tokens = estimate_tokens(entry.text)
+                self.tokens -= entry.tokens - tokens
+                entry.tokens = tokens
+            entry.compacted = True
+            self._compacted += 1
+    
+    def _summarize(self) -> None:
+        """Replace all old entries, including any earlier summary, with one summary."""
+        entries = self._entries
+        old = len(entries) - self.keep_recent
+        if old <= 0 or (old == 1 and entries[0].compacted):
+            return
+        removed = [entries.popleft() for _ in range(old)]
+        removed_tokens = sum(entry.tokens for entry in removed)
+        summary = self.summarizer([entry.text for entry in removed])
+        tokens = estimate_tokens(summary)
+        if tokens >= removed_tokens:
+            # Summarizing would not help; put the entries back untouched
+            entries.extendleft(reversed(removed))
+            return
+        entries.appendleft(_Entry("system", summary, tokens, compacted=True))
+        self.tokens += tokens - removed_tokens
+        self._compacted = 1
+    
+    def _drop(self) -> None:
+        """Drop old entries, oldest first, until the window fits."""
+        entries = self._entries
+        while self._over_budget() and len(entries) > self.keep_recent:
+            entry = entries.popleft()
+            self.tokens -= entry.tokens
+            if self._compacted:
+                self._compacted -= 1
+    
+    def messages(self) -> List[Dict[str, str]]:
+        """
+        Return the window as chat messages.
+        
+        Returns:
+            A list of messages with "role" and "content" keys, oldest first.
+        """
+        return [{"role": entry.role, "content": entry.text} for entry in self._entries]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report the size of the window and what compaction saved.
+        
+        Returns:
+            A dictionary with the current "tokens", the "tokens_saved" and the
+            number of "compactions".
+        """
+        return {"tokens": self.tokens, "tokens_saved": self.tokens_saved, "compactions": self.compactions}
@@ -4,17 +4,25 @@ Hybrid Agent module that combines single and multi-agent capabilities.
 This agent can dynamically switch between single and multi-agent modes based on task complexity.
 """
 
+import asyncio
 import logging
-import re
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Callable, Dict, Any, List, Optional
 
+from anus.core.agent.task_graph import Subtask, TaskGraph, is_failed, plan_task, run_graph
 from anus.core.agent.tool_agent import ToolAgent
 
+logger = logging.getLogger(__name__)
+
 class HybridAgent(ToolAgent):
     """
     A hybrid agent that can switch between single and multi-agent modes.
     
     This agent assesses task complexity and chooses the appropriate mode.
+    In multi-agent mode, the planner breaks the task into a TaskGraph of
+    subtasks for the researcher and the executor, independent subtasks run
+    in parallel, and the critic reviews the merged result. The default
+    planner, `plan_task`, splits the task by its wording rather than asking
+    an agent.
     """
     
     def __init__(
@@ -22,6 +30,10 @@ class HybridAgent(ToolAgent):
         name: Optional[str] = None,
         max_iterations: int = 10,
         tools: Optional[List[str]] = None,
+        mode: str = "auto",
+        max_workers: Optional[int] = None,
+        role_timeout: Optional[float] = None,
+        planner: Optional[Callable[[str], TaskGraph]] = None,
         **kwargs
     ):
         """
@@ -31,18 +43,57 @@ class HybridAgent(ToolAgent):
             name: Optional name for the agent.
             max_iterations: Maximum number of thought-action cycles to perform.
             tools: Optional list of tool names to load.
+            mode: "single", "multi", or "auto" to choose by task complexity.
+            max_workers: Maximum number of subtasks run concurrently in
+                multi-agent mode. Defaults to one worker per role.
+            role_timeout: Optional time limit in seconds for each subtask in
+                multi-agent mode, measured from when the subtask starts running.
+            planner: Function that breaks a task into a TaskGraph. Defaults
+                to `plan_task`. Subtasks name the role that runs them;
+                unknown roles go to the executor.
             **kwargs: Additional configuration options for the agent.
         """
         super().__init__(name=name, max_iterations=max_iterations, tools=tools, **kwargs)
-        self.mode = "auto"
+        self.mode = mode
+        self.role_timeout = role_timeout
+        self.planner = planner or plan_task
         
         # Specialized agents for multi-agent mode
+        role_options = {
+            "tools": tools,
+            "tool_cache": self.tool_cache,
+            "trace_level": self.trace_level,
+            "registry": self.registry,
+            "llm": self.llm
+        }
         self.specialized_agents = {
-            "researcher": ToolAgent(name="researcher", tools=tools),
-            "planner": ToolAgent(name="planner", tools=tools),
-            "executor": ToolAgent(name="executor", tools=tools),
-            "critic": ToolAgent(name="critic", tools=tools)
+            "researcher": ToolAgent(name="researcher", **role_options),
+            "executor": ToolAgent(name="executor", **role_options),
+            "critic": ToolAgent(name="critic", **role_options)
         }
+        self.max_workers = max_workers or len(self.specialized_agents)
+    
+    def add_hook(self, hook: Any) -> None:
+        """
+        Register a hook on this agent and on its specialized agents.
+        
+        Args:
+            hook: An object with any of the methods in `HOOK_EVENTS`.
+        """
+        super().add_hook(hook)
+        for agent in self.specialized_agents.values():
+            agent.add_hook(hook)
+    
+    def remove_hook(self, hook: Any) -> None:
+        """
+        Unregister a hook from this agent and its specialized agents.
+        
+        Args:
+            hook: A previously registered hook.
+        """
+        super().remove_hook(hook)
+        for agent in self.specialized_agents.values():
+            agent.remove_hook(hook)
     
     def _assess_complexity(self, task: str) -> float:
         """
@@ -69,53 +120,110 @@ class HybridAgent(ToolAgent):
         
         return complexity
     
-    def execute(self, task: str) -> Dict[str, Any]:
+    async def aexecute(
+        self,
+        task: str,
+        run_id: Optional[str] = None,
+        mode: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Execute a task using single or multi-agent mode based on complexity.
         
         Args:
             task: The task to execute.
+            run_id: Id to checkpoint the run under in single-agent mode; see
+                `ToolAgent.aexecute`. Multi-agent runs are not checkpointed.
+            mode: "single", "multi" or "auto" for this task. Defaults to the
+                agent's mode.
             
         Returns:
             A dictionary containing the execution result and metadata.
         """
-        # Assess task complexity
-        complexity = self._assess_complexity(task)
-        
         # Determine execution mode
-        if self.mode == "auto":
-            mode = "multi" if complexity > 0.5 else "single"
-        else:
-            mode = self.mode
+        mode = mode or self.mode
+        if mode == "auto":
+            mode = "multi" if self._assess_complexity(task) > 0.5 else "single"
         
         # Execute based on selected mode
         if mode == "single":
-            return super().execute(task)
+            return await super().aexecute(task, run_id)
         else:
-            return self._execute_multi_agent(task)
+            return await self._aexecute_multi_agent(task)
     
-    def _execute_multi_agent(self, task: str) -> Dict[str, Any]:
+    async def _arun_subtask(self, subtask: Subtask, inputs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run a subtask on the agent for its role.
+        
+        Args:
+            subtask: The subtask to run.
+            inputs: The results of the subtasks it depends on, by id.
+            
+        Returns:
+            The result of the role agent, or a result with the status
+            "timed_out" if the subtask exceeded the role timeout. The role
+            agent's run is cancelled in that case, not left running.
+        """
+        agent = self.specialized_agents.get(subtask.role) or self.specialized_agents["executor"]
+        agent_task = f"As a {agent.name}, {subtask.description}"
+        if inputs:
+            agent_task += "\n\nInputs:\n" + "\n".join(
+                f"- {dependency}: {result.get('answer', '')}" for dependency, result in inputs.items()
+            )
+        try:
+            return await asyncio.wait_for(agent.aexecute(agent_task), self.role_timeout)
+        except asyncio.TimeoutError:
+            return {"status": "timed_out", "error": f"Subtask {subtask.id} timed out after {self.role_timeout} seconds"}
+    
+    async def _aexecute_multi_agent(self, task: str) -> Dict[str, Any]:
         """
         Execute a task using multiple specialized agents.
         
+        The planner breaks the task into subtasks. Each subtask starts once
+        the subtasks it depends on have succeeded and receives their
+        results, with at most max_workers subtasks running at a time.
+        Subtasks whose inputs failed are skipped, while independent branches
+        carry on. The results of the final subtasks are merged into the
+        answer, which the critic then reviews.
+        
         Args:
             task: The task to execute.
             
         Returns:
-            A dictionary containing the execution result and metadata.
+            A dictionary containing the execution result and metadata, with
+            the subtask results by id under "agent_results" and the critic's
+            result under "review".
         """
-        # Simple implementation of multi-agent execution
-        results = {}
+        graph = self.planner(task)
+        results = await run_graph(graph, self._arun_subtask, self.max_workers)
         
-        # Have each agent process the task
-        for role, agent in self.specialized_agents.items():
-            agent_task = f"As a {role}, {task}"
-            results[role] = agent.execute(agent_task)
+        failed = [subtask_id for subtask_id, result in results.items() if is_failed(result)]
+        for subtask_id in failed:
+            if results[subtask_id]["status"] in ("error", "timed_out"):
+                logger.error("Subtask %s failed: %s", subtask_id, results[subtask_id]["error"])
         
-        # Combine results
-        return {
+        # Merge the results of the subtasks nothing else builds on
+        answers = [
+            f"{subtask_id}: {results[subtask_id].get('answer', '')}"
+            for subtask_id in graph.sinks() if not is_failed(results[subtask_id])
+        ]
+        answer = "\n".join(answers) if answers else f"Multi-agent execution failed for: {task}"
+        
+        result = {
             "task": task,
-            "answer": f"Multi-agent execution of: {task}",
+            "answer": answer,
             "mode": "multi",
+            "plan": graph.to_list(),
             "agent_results": results
-        }
\ No newline at end of file
+        }
+        if answers:
+            # Kept apart from the subtask results, whose ids the planner picks
+            critic = Subtask("critic", f"Review the result of: {task}\n\n{answer}", role="critic")
+            try:
+                result["review"] = await self._arun_subtask(critic, {})
+            except Exception as e:
+                logger.error("Critic review failed: %s", e)
+                result["review"] = {"status": "error", "error": str(e)}
+        if failed:
+            result["status"] = "error"
+            result["failed_subtasks"] = failed
+        return result
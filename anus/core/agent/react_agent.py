@@ -5,9 +5,32 @@ This module implements the ReAct (Reasoning + Action) methodology
 for agents that can reason about their actions.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 import logging
+import time
+import uuid
 from anus.core.agent.base_agent import BaseAgent
+from anus.core.agent.termination import ANSWERED_REASONS, FINAL_ANSWER_ACTION, RunBudget, StopReason
+from anus.core.agent.context_window import CompactionStrategy, ContextWindow
+from anus.core.agent.streaming import current_listener
+from anus.core.agent.trace import Trace, TraceLevel
+from anus.core.utils.async_utils import run_sync
+
+if TYPE_CHECKING:
+    from anus.core.checkpoint import CheckpointStore
+    from anus.core.llm.base import LLMClient
+    from anus.core.memory import MemoryStore
+
+logger = logging.getLogger(__name__)
+
+# Thought recorded for each simulated reasoning step
+THOUGHT_TEMPLATE = "Thinking about how to {task} (iteration {iteration})"
+
+# System prompt for reasoning steps when the agent has a model client
+THOUGHT_PROMPT = (
+    "You are an agent solving a task step by step. "
+    "Briefly reason about what to do next, given the task and the latest observation."
+)
 
 class ReactAgent(BaseAgent):
     """
@@ -17,12 +40,34 @@ class ReactAgent(BaseAgent):
     - Reasoning about the task
     - Taking actions
     - Observing the results
+    
+    The loop ends as soon as the agent takes a final-answer action, or when
+    it starts repeating itself or runs out of iterations, time or tokens.
+    
+    The run's thoughts, actions and observations are returned as a Trace in
+    the result's `context`; `trace_level` controls how much of it is kept.
+    With an `llm` client, each thought comes from the model; without one,
+    thoughts are simulated, and the prompt is built from a ContextWindow
+    that keeps the run's history within `context_max_tokens` by compacting
+    older steps with `context_strategy`. With a `memory` store, the agent recalls items
+    related to each task before starting and remembers each answered task.
+    With a `checkpoints` store, every completed iteration is logged, and
+    `aresume` continues an interrupted run from its last logged iteration.
     """
     
     def __init__(
         self, 
         name: Optional[str] = None, 
         max_iterations: int = 10,
+        max_time: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        trace_level: str = TraceLevel.FULL,
+        llm: Optional["LLMClient"] = None,
+        memory: Optional["MemoryStore"] = None,
+        memory_top_k: int = 3,
+        context_max_tokens: Optional[int] = None,
+        context_strategy: str = CompactionStrategy.TRUNCATE,
+        checkpoints: Optional["CheckpointStore"] = None,
         **kwargs
     ):
         """
@@ -31,46 +76,422 @@ class ReactAgent(BaseAgent):
         Args:
             name: Optional name for the agent.
             max_iterations: Maximum number of thought-action cycles to perform.
+            max_time: Optional wall-time budget per task in seconds.
+            max_tokens: Optional token budget per task.
+            trace_level: How much of each run to record, one of the
+                TraceLevel values.
+            llm: Optional model client used for reasoning steps.
+            memory: Optional memory store shared across tasks.
+            memory_top_k: Number of related items recalled per task.
+            context_max_tokens: Optional token budget of the run history
+                sent to the model.
+            context_strategy: How the history is compacted when it exceeds
+                its budget, one of the CompactionStrategy values.
+            checkpoints: Optional store to log each completed iteration in.
             **kwargs: Additional configuration options for the agent.
         """
         super().__init__(name=name, **kwargs)
         self.max_iterations = max_iterations
+        self.max_time = max_time
+        self.max_tokens = max_tokens
+        self.trace_level = trace_level
+        self.llm = llm
+        self.memory = memory
+        self.memory_top_k = memory_top_k
+        self.context_max_tokens = context_max_tokens
+        self.context_strategy = context_strategy
+        self.checkpoints = checkpoints
     
-    def execute(self, task: str) -> Dict[str, Any]:
+    def _new_budget(self) -> RunBudget:
         """
-        Execute a task using the ReAct methodology.
+        Create the budget for a new task run.
+        
+        Returns:
+            A RunBudget using this agent's limits.
+        """
+        return RunBudget(self.max_iterations, max_time=self.max_time, max_tokens=self.max_tokens)
+    
+    def _new_trace(self, task: str) -> Trace:
+        """
+        Create the trace for a new task run.
+        
+        Args:
+            task: The task being executed.
+            
+        Returns:
+            An empty Trace using this agent's trace level.
+        """
+        return Trace(
+            task,
+            level=self.trace_level,
+            thought_template=THOUGHT_TEMPLATE,
+            agent=self.name,
+            listener=current_listener(),
+            window=self._new_window()
+        )
+    
+    def _new_window(self) -> Optional[ContextWindow]:
+        """
+        Create the context window for a new task run.
+        
+        Returns:
+            A ContextWindow, or None if the agent has no model to prompt.
+        """
+        if self.llm is None:
+            return None
+        return ContextWindow(max_tokens=self.context_max_tokens, strategy=self.context_strategy)
+    
+    def _start_run(self, task: str, run_id: Optional[str] = None) -> Tuple[Trace, RunBudget]:
+        """
+        Set up a new task run, or restore an interrupted one.
         
         Args:
             task: The task to execute.
+            run_id: Id to checkpoint the run under. Defaults to a new id.
             
         Returns:
-            A dictionary containing the execution result and metadata.
+            The trace and the budget of the run.
         """
-        context = {
-            "task": task,
-            "thoughts": [],
-            "actions": [],
-            "observations": []
-        }
+        trace = self._new_trace(task)
+        self._recall(trace)
+        budget = self._new_budget()
+        if self.checkpoints is not None:
+            self._restore(trace, budget, run_id or uuid.uuid4().hex)
+        if self.hooks:
+            self.hooks.emit("on_task_start", {"agent": self.name, "task": task, "timestamp": budget.started})
+        return trace, budget
+    
+    def _restore(self, trace: Trace, budget: RunBudget, run_id: str) -> None:
+        """
+        Log the start of a run and replay the iterations it already completed.
         
-        # Simulate the ReAct loop
-        for i in range(self.max_iterations):
-            # Simulate thinking
-            thought = f"Thinking about how to {task} (iteration {i})"
-            context["thoughts"].append(thought)
+        Args:
+            trace: The new trace of the run.
+            budget: The new budget of the run.
+            run_id: Id of the run.
+        """
+        trace["run_id"] = run_id
+        steps = self.checkpoints.begin_run(run_id, self.name, trace.task)
+        for step in steps:
+            trace.record_thought(step["thought"])
+            trace.record_action(step["action"])
+            observation = step.get("observation")
+            if observation is not None:
+                trace.record_observation(observation)
+                # Rebuilds the loop detection state
+                budget.is_repeat(step["action"], observation)
+            budget.iterations = step["iteration"] + 1
+            budget.tokens = step["tokens"]
+        if steps:
+            trace["resumed_from"] = budget.iterations
+    
+    def _checkpoint(
+        self,
+        trace: Trace,
+        budget: RunBudget,
+        iteration: int,
+        thought: Optional[str],
+        action: Dict[str, Any],
+        observation: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Log a completed iteration.
+        
+        Args:
+            trace: The trace of the run.
+            budget: The budget of the run.
+            iteration: The zero-based iteration number.
+            thought: The thought as recorded, None for a simulated one.
+            action: The action taken.
+            observation: The observation, unless the action ended the run.
+        """
+        step = {"iteration": iteration, "thought": thought, "action": action, "tokens": budget.tokens}
+        if observation is not None:
+            step["observation"] = observation
+        self.checkpoints.append_step(trace["run_id"], iteration, step)
+    
+    def _end_iteration(self, trace: Trace, iteration: int, started: float) -> None:
+        """
+        Report a finished thought-action cycle to the hooks.
+        
+        Args:
+            trace: The trace of the run.
+            iteration: The zero-based iteration number.
+            started: Monotonic time the iteration started at.
+        """
+        now = time.monotonic()
+        self.hooks.emit("on_iteration", {
+            "agent": self.name,
+            "task": trace.task,
+            "iteration": iteration,
+            "timestamp": now,
+            "duration": now - started
+        })
+    
+    def _end_run(self, trace: Trace, budget: RunBudget, answer: str, stop_reason: str) -> None:
+        """
+        Finish the trace of a run and remember its answer.
+        
+        Args:
+            trace: The trace of the run.
+            budget: The budget of the run.
+            answer: The answer the run produced.
+            stop_reason: The StopReason that ended the run.
+        """
+        # Stop streaming records, and report and release the context window
+        trace.listener = None
+        if trace.window is not None:
+            trace["context_window"] = trace.window.stats()
+            trace.window = None
+        self._remember(trace.task, answer, stop_reason)
+        if self.checkpoints is not None:
+            self.checkpoints.finish_run(trace["run_id"], {
+                "answer": answer,
+                "stop_reason": stop_reason,
+                "iterations": budget.iterations
+            })
+        
+        if self.hooks:
+            now = time.monotonic()
+            answered = stop_reason in ANSWERED_REASONS
+            self.hooks.emit("on_task_end", {
+                "agent": self.name,
+                "task": trace.task,
+                "status": "success" if answered else "incomplete",
+                "stop_reason": stop_reason,
+                "iterations": budget.iterations,
+                "timestamp": now,
+                "duration": now - budget.started
+            })
+    
+    def _recall(self, trace: Trace) -> None:
+        """
+        Look up items related to the task in memory and add them to the trace.
+        
+        Args:
+            trace: The trace of the current run.
+        """
+        if self.memory is None:
+            return
+        trace["memories"] = [item["text"] for item in self.memory.search(trace.task, self.memory_top_k)]
+    
+    def _remember(self, task: str, answer: str, stop_reason: str) -> None:
+        """
+        Store an answered task in memory.
+        
+        Args:
+            task: The task that was executed.
+            answer: The answer the run produced.
+            stop_reason: The StopReason that ended the run.
+        """
+        if self.memory is None or stop_reason not in ANSWERED_REASONS:
+            return
+        self.memory.add(f"{task}\n{answer}", {"task": task, "answer": answer, "agent": self.name})
+    
+    def _thought_messages(self, trace: Trace) -> List[Dict[str, str]]:
+        """
+        Build the model prompt for the next reasoning step.
+        
+        Args:
+            trace: The trace of the current run.
             
-            # Simulate action
-            action = {"name": "dummy_action", "input": {"query": f"Action for {task}"}}
-            context["actions"].append(action)
+        Returns:
+            A list of chat messages.
+        """
+        messages = [{"role": "system", "content": THOUGHT_PROMPT}]
+        memories = trace.extra.get("memories")
+        if memories:
+            messages.append({"role": "system", "content": "Related past tasks:\n" + "\n\n".join(memories)})
+        messages.append({"role": "user", "content": trace.task})
+        if trace.window is not None:
+            messages.extend(trace.window.messages())
+        elif trace.last_observation is not None:
+            messages.append({"role": "user", "content": f"Observation: {trace.last_observation}"})
+        return messages
+    
+    def _emit_llm_call(self, started: float, status: str, tokens: Optional[int]) -> None:
+        """
+        Report a finished model call to the hooks.
+        
+        Args:
+            started: Monotonic time the call started at.
+            status: "success" or "error".
+            tokens: Tokens the call used, if reported.
+        """
+        now = time.monotonic()
+        self.hooks.emit("on_llm_call", {
+            "agent": self.name,
+            "status": status,
+            "tokens": tokens,
+            "timestamp": now,
+            "duration": now - started
+        })
+    
+    async def _athink(self, trace: Trace, budget: RunBudget, iteration: int) -> Optional[str]:
+        """
+        Record the thought for an iteration.
+        
+        With a model client the thought is requested from the model. A
+        simulated thought's text is only built here when the token budget
+        needs to be charged for it; otherwise the trace renders it when it
+        is read.
+        
+        Args:
+            trace: The trace of the current run.
+            budget: The budget of the current run.
+            iteration: The zero-based iteration number.
             
-            # Simulate observation
-            observation = {"status": "success", "result": f"Observation for {task} (iteration {i})"}
-            context["observations"].append(observation)
+        Returns:
+            The thought as recorded: the model's text, or None for a
+            simulated thought.
+        """
+        if self.llm is not None:
+            on_token = None
+            if trace.listener is not None:
+                listener, agent = trace.listener, self.name
+                on_token = lambda text: listener({"type": "token", "agent": agent, "text": text})
+            started = time.monotonic()
+            try:
+                response = await self.llm.acomplete(self._thought_messages(trace), on_token=on_token)
+            except Exception as e:
+                logger.error("Agent %s failed to get a thought from the model: %s", self.name, e)
+                if self.hooks:
+                    self._emit_llm_call(started, "error", None)
+            else:
+                thought = response["text"]
+                tokens = response.get("usage", {}).get("total_tokens")
+                if self.hooks:
+                    self._emit_llm_call(started, "success", tokens)
+                if tokens is None:
+                    budget.add_tokens(thought)
+                else:
+                    budget.tokens += tokens
+                trace.record_thought(thought)
+                return thought
+        
+        if budget.max_tokens is not None:
+            budget.add_tokens(THOUGHT_TEMPLATE.format(task=trace.task, iteration=iteration))
+        trace.record_thought(None)
+        return None
+    
+    def _next_action(self, task: str, context: Trace) -> Dict[str, Any]:
+        """
+        Decide on the next action to take.
+        
+        Args:
+            task: The task being executed.
+            context: The trace of the run so far.
+            
+        Returns:
+            An action dictionary with "name" and "input" keys.
+        """
+        # Simulate deciding that a successful observation answers the task
+        last = context.last_observation
+        if last is not None and last.get("status") == "success":
+            return {"name": FINAL_ANSWER_ACTION, "input": {"answer": f"I have completed the task: {task}"}}
+        return {"name": "dummy_action", "input": {"query": f"Action for {task}"}}
+    
+    async def aexecute(self, task: str, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute a task using the ReAct methodology.
+        
+        Args:
+            task: The task to execute.
+            run_id: Id to checkpoint the run under, if the agent has a
+                checkpoint store. If the store holds an interrupted run with
+                this id, the run continues after its last logged iteration.
+            
+        Returns:
+            A dictionary containing the execution result and metadata, including
+            the `stop_reason` that ended the run.
+        """
+        context, budget = self._start_run(task, run_id)
+        checkpoints = self.checkpoints
+        answer = f"I was unable to complete the task: {task}"
+        hooks = self.hooks
+        # Checked once per run so that iterations pay nothing when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Simulate the ReAct loop
+        while True:
+            stop_reason = budget.exhausted()
+            if stop_reason is not None:
+                break
+            i = budget.iterations
+            budget.iterations += 1
+            started = time.monotonic() if hooks else 0.0
+            try:
+                # Simulate thinking
+                thought = await self._athink(context, budget, i)
+                
+                # Simulate action
+                action = self._next_action(task, context)
+                context.record_action(action)
+                if debug:
+                    logger.debug("Agent %s iteration %d: %s", self.name, i, action["name"])
+                if action["name"] == FINAL_ANSWER_ACTION:
+                    if checkpoints is not None:
+                        self._checkpoint(context, budget, i, thought, action)
+                    answer = action["input"]["answer"]
+                    stop_reason = StopReason.FINAL_ANSWER
+                    break
+                
+                # Simulate observation
+                observation = {"status": "success", "result": f"Observation for {task} (iteration {i})"}
+                context.record_observation(observation)
+                budget.add_tokens(observation["result"])
+                if checkpoints is not None:
+                    self._checkpoint(context, budget, i, thought, action, observation)
+                
+                if budget.is_repeat(action, observation):
+                    stop_reason = StopReason.LOOP_DETECTED
+                    break
+            finally:
+                if hooks:
+                    self._end_iteration(context, i, started)
+        
+        self._end_run(context, budget, answer, stop_reason)
         
         # Generate answer
         return {
             "task": task,
-            "answer": f"I have completed the task: {task}",
-            "iterations": self.max_iterations,
+            "answer": answer,
+            "iterations": budget.iterations,
+            "stop_reason": stop_reason,
             "context": context
-        }
\ No newline at end of file
+        }
+    
+    async def aresume(self, run_id: str) -> Dict[str, Any]:
+        """
+        Continue an interrupted run from its last completed iteration.
+        
+        Args:
+            run_id: Id of the run, e.g. from the `run_id` of its trace or
+                from `CheckpointStore.unfinished_runs`.
+            
+        Returns:
+            The result of the run, as returned by `aexecute`.
+            
+        Raises:
+            RuntimeError: If the agent has no checkpoint store.
+            KeyError: If the run is unknown.
+            ValueError: If the run has already finished.
+        """
+        if self.checkpoints is None:
+            raise RuntimeError(f"Agent {self.name} has no checkpoint store")
+        run = self.checkpoints.get_run(run_id)
+        if run is None:
+            raise KeyError(f"Unknown run: {run_id}")
+        return await self.aexecute(run["task"], run_id=run_id)
+    
+    def resume(self, run_id: str) -> Dict[str, Any]:
+        """
+        Continue an interrupted run and return the result.
+        
+        Args:
+            run_id: Id of the run.
+            
+        Returns:
+            The result of the run, as returned by `aexecute`.
+        """
+        return run_sync(self.aresume(run_id))
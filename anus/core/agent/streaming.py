@@ -0,0 +1,83 @@
+"""
+Streaming module that turns agent runs into event streams.
+
+While a run is being streamed, its traces report every thought, action
+and observation to a listener as soon as they are recorded. The listener
+lives in a context variable, so it follows the run into the tasks it
+spawns, such as the roles of a multi-agent run, and costs nothing when
+no one is streaming.
+
+Events are dictionaries with a "type" key:
+- {"type": "thought", "agent", "iteration", "text"}
+- {"type": "token", "agent", "text"}: part of a thought streamed by the model
+- {"type": "action", "agent", "name", "input"}
+- {"type": "observation", "agent", "observation"}
+- {"type": "final", "answer", "result"}: always the last event
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+EventListener = Callable[[Dict[str, Any]], None]
+
+_listener: ContextVar[Optional[EventListener]] = ContextVar("anus_event_listener", default=None)
+
+def current_listener() -> Optional[EventListener]:
+    """
+    Return the listener of the run being streamed in the current context.
+    
+    Returns:
+        The listener, or None if the current run is not being streamed.
+    """
+    return _listener.get()
+
+async def astream_run(run: Callable[[], Awaitable[Dict[str, Any]]]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run a task and yield its events as they happen.
+    
+    If the consumer stops iterating early, the run is cancelled.
+    
+    Args:
+        run: Creates the awaitable that executes the task and returns its
+            result dictionary.
+            
+    Yields:
+        Event dictionaries, ending with a "final" event.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    
+    def listener(event: Dict[str, Any]) -> None:
+        # Model clients report tokens from their worker threads
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            queue.put_nowait(event)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+    
+    async def runner() -> Dict[str, Any]:
+        # Set inside the task, so the listener does not leak to the caller
+        _listener.set(listener)
+        try:
+            return await run()
+        finally:
+            loop.call_soon(queue.put_nowait, done)
+    
+    task = asyncio.ensure_future(runner())
+    try:
+        while True:
+            event = await queue.get()
+            if event is done:
+                break
+            yield event
+        result = await task
+        yield {"type": "final", "answer": result.get("answer"), "result": result}
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,308 @@
+"""
+Task graph module for the ANUS framework.
+
+A TaskGraph breaks a task into subtasks, each assigned to a role and
+depending on the subtasks whose results it needs. `plan_task` builds one
+from the wording of a task; `run_graph` executes a graph, running every
+subtask whose inputs are ready at once, up to a concurrency limit.
+"""
+
+import asyncio
+import re
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Sequence
+
+# Result statuses that count as a failed subtask
+FAILED_STATUSES = frozenset({"error", "timed_out", "cancelled", "skipped"})
+
+# Verbs that start an independent step when two clauses are joined by "and"
+ACTION_VERBS = frozenset({
+    "analyze", "build", "calculate", "check", "collect", "compare", "create",
+    "describe", "design", "develop", "draft", "evaluate", "explain", "find",
+    "gather", "generate", "identify", "implement", "investigate", "list",
+    "outline", "plan", "research", "review", "summarize", "synthesize",
+    "test", "translate", "write"
+})
+
+# Separators between steps that must run one after the other
+_SEQUENTIAL_PATTERN = re.compile(r"\s*(?:;|\n|,?\s+(?:and\s+)?then\s+)\s*", re.IGNORECASE)
+# Separators between steps that may run side by side
+_PARALLEL_PATTERN = re.compile(r"\s*,?\s+and\s+|\s*,\s+", re.IGNORECASE)
+# Leading list markers such as "1." or "-"
+_LIST_MARKER_PATTERN = re.compile(r"^\s*(?:\d+[.)]|[-*])\s+")
+
+class Subtask:
+    """A unit of work in a TaskGraph."""
+    
+    __slots__ = ("id", "description", "role", "depends_on")
+    
+    def __init__(self, id: str, description: str, role: str = "executor", depends_on: Sequence[str] = ()):
+        """
+        Initialize a Subtask instance.
+        
+        Args:
+            id: Identifier of the subtask, unique within its graph.
+            description: What the subtask should do.
+            role: The specialized agent that runs it.
+            depends_on: Ids of the subtasks whose results it needs.
+        """
+        self.id = id
+        self.description = description
+        self.role = role
+        self.depends_on = tuple(depends_on)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the subtask as a plain dictionary.
+        
+        Returns:
+            A dictionary with the "id", "description", "role" and
+            "depends_on" of the subtask.
+        """
+        return {"id": self.id, "description": self.description, "role": self.role, "depends_on": list(self.depends_on)}
+    
+    def __repr__(self) -> str:
+        """Return a short description of the subtask."""
+        return f"Subtask({self.id!r}, role={self.role!r}, depends_on={list(self.depends_on)!r})"
+
+class TaskGraph:
+    """
+    A set of subtasks and the dependencies between them.
+    
+    The graph is checked when it is built: every dependency must name a
+    subtask of the graph, and dependencies may not form a cycle.
+    """
+    
+    def __init__(self, subtasks: Iterable[Subtask]):
+        """
+        Initialize a TaskGraph instance.
+        
+        Args:
+            subtasks: The subtasks of the graph.
+            
+        Raises:
+            ValueError: If ids repeat, a dependency is unknown, or the
+                dependencies form a cycle.
+        """
+        self.subtasks: Dict[str, Subtask] = {}
+        for subtask in subtasks:
+            if subtask.id in self.subtasks:
+                raise ValueError(f"Duplicate subtask id: {subtask.id}")
+            self.subtasks[subtask.id] = subtask
+        
+        self.dependents: Dict[str, List[str]] = {subtask_id: [] for subtask_id in self.subtasks}
+        for subtask in self.subtasks.values():
+            for dependency in subtask.depends_on:
+                if dependency not in self.subtasks:
+                    raise ValueError(f"Subtask {subtask.id} depends on unknown subtask {dependency}")
+                self.dependents[dependency].append(subtask.id)
+        self.order = self._topological_order()
+    
+    @classmethod
+    def from_list(cls, items: Iterable[Dict[str, Any]]) -> "TaskGraph":
+        """
+        Build a graph from plain dictionaries, e.g. a plan in JSON.
+        
+        Args:
+            items: Dictionaries as returned by `Subtask.to_dict`; "role" and
+                "depends_on" are optional.
+                
+        Returns:
+            A TaskGraph.
+        """
+        return cls(
+            Subtask(str(item["id"]), item["description"], item.get("role", "executor"), item.get("depends_on", ()))
+            for item in items
+        )
+    
+    def _topological_order(self) -> List[str]:
+        """
+        Order the subtasks so that each comes after its dependencies.
+        
+        Returns:
+            Subtask ids in dependency order, keeping the given order among
+            independent subtasks.
+            
+        Raises:
+            ValueError: If the dependencies form a cycle.
+        """
+        remaining = {subtask_id: len(subtask.depends_on) for subtask_id, subtask in self.subtasks.items()}
+        ready = deque(subtask_id for subtask_id, count in remaining.items() if count == 0)
+        order = []
+        while ready:
+            subtask_id = ready.popleft()
+            order.append(subtask_id)
+            for dependent in self.dependents[subtask_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.subtasks):
+            cycle = sorted(subtask_id for subtask_id, count in remaining.items() if count)
+            raise ValueError(f"Subtask dependencies form a cycle: {', '.join(cycle)}")
+        return order
+    
+    def __iter__(self) -> Iterator[Subtask]:
+        """Iterate over the subtasks in dependency order."""
+        return (self.subtasks[subtask_id] for subtask_id in self.order)
+    
+    def __len__(self) -> int:
+        """Return the number of subtasks."""
+        return len(self.subtasks)
+    
+    def __getitem__(self, subtask_id: str) -> Subtask:
+        """Return the subtask with an id."""
+        return self.subtasks[subtask_id]
+    
+    def sinks(self) -> List[str]:
+        """
+        Return the subtasks no other subtask depends on.
+        
+        Returns:
+            Their ids in dependency order; their results make up the result
+            of the whole graph.
+        """
+        return [subtask_id for subtask_id in self.order if not self.dependents[subtask_id]]
+    
+    def to_list(self) -> List[Dict[str, Any]]:
+        """
+        Return the graph as plain dictionaries.
+        
+        Returns:
+            One dictionary per subtask, in dependency order.
+        """
+        return [subtask.to_dict() for subtask in self]
+
+def _split_steps(task: str) -> List[List[str]]:
+    """
+    Split a task into stages of steps.
+    
+    Args:
+        task: The task to split.
+        
+    Returns:
+        The stages in order; the steps of a stage are independent.
+    """
+    stages = []
+    for stage in _SEQUENTIAL_PATTERN.split(task.strip()):
+        stage = _LIST_MARKER_PATTERN.sub("", stage).strip(" .")
+        if not stage:
+            continue
+        parts = [part.strip(" .") for part in _PARALLEL_PATTERN.split(stage)]
+        # Only split clauses that each start a new action, so that
+        # "compare apples and oranges" stays a single step
+        if len(parts) > 1 and all(part.split(maxsplit=1)[0].lower() in ACTION_VERBS for part in parts if part):
+            stages.append([part for part in parts if part])
+        else:
+            stages.append([stage])
+    return stages
+
+def plan_task(task: str) -> TaskGraph:
+    """
+    Break a task into a graph of subtasks from its wording.
+    
+    A research subtask comes first. Each step of the task then becomes an
+    executor subtask: steps joined by "then", ";" or new lines run one
+    after the other, while actions joined by "and" or commas run side by
+    side.
+    
+    Args:
+        task: The task to plan.
+        
+    Returns:
+        A TaskGraph for the task.
+    """
+    subtasks = [Subtask("research", f"Research the background of: {task}", role="researcher")]
+    previous = ["research"]
+    number = 0
+    for stage in _split_steps(task) or [[task]]:
+        current = []
+        for step in stage:
+            number += 1
+            subtask_id = f"step-{number}"
+            subtasks.append(Subtask(subtask_id, step, role="executor", depends_on=previous))
+            current.append(subtask_id)
+        previous = current
+    return TaskGraph(subtasks)
+
+def is_failed(result: Dict[str, Any]) -> bool:
+    """
+    Tell whether a subtask result counts as a failure.
+    
+    Args:
+        result: The result of a subtask.
+        
+    Returns:
+        True if the subtask errored, timed out, was cancelled or was skipped.
+    """
+    return result.get("status") in FAILED_STATUSES
+
+async def run_graph(
+    graph: TaskGraph,
+    run_subtask: Callable[[Subtask, Dict[str, Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+    max_concurrency: int = 4
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Execute a task graph.
+    
+    A subtask starts as soon as all of its dependencies have succeeded, with
+    at most `max_concurrency` subtasks running at a time. When a subtask
+    fails, every subtask that depends on it, directly or not, is skipped;
+    independent branches keep running.
+    
+    Args:
+        graph: The graph to execute.
+        run_subtask: Coroutine function called with a subtask and the
+            results of its dependencies, by id. Exceptions it raises count
+            as failures.
+        max_concurrency: Maximum number of subtasks running at once.
+        
+    Returns:
+        The result of every subtask, by id, in dependency order. Skipped
+        subtasks have the status "skipped".
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    remaining = {subtask.id: len(subtask.depends_on) for subtask in graph}
+    ready = deque(subtask_id for subtask_id in graph.order if remaining[subtask_id] == 0)
+    running: Dict[asyncio.Future, str] = {}
+    
+    def skip_dependents(failed_id: str) -> None:
+        stack = [(dependent, failed_id) for dependent in graph.dependents[failed_id]]
+        while stack:
+            subtask_id, cause = stack.pop()
+            if subtask_id in results:
+                continue
+            results[subtask_id] = {"status": "skipped", "error": f"Skipped because subtask {cause} failed"}
+            stack.extend((dependent, subtask_id) for dependent in graph.dependents[subtask_id])
+    
+    try:
+        while ready or running:
+            while ready and len(running) < max_concurrency:
+                subtask = graph[ready.popleft()]
+                inputs = {dependency: results[dependency] for dependency in subtask.depends_on}
+                running[asyncio.ensure_future(run_subtask(subtask, inputs))] = subtask.id
+            
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                subtask_id = running.pop(future)
+                if future.cancelled():
+                    result = {"status": "cancelled", "error": f"Subtask {subtask_id} was cancelled"}
+                elif future.exception() is not None:
+                    result = {"status": "error", "error": str(future.exception())}
+                else:
+                    result = future.result()
+                results[subtask_id] = result
+                
+                if is_failed(result):
+                    skip_dependents(subtask_id)
+                    continue
+                for dependent in graph.dependents[subtask_id]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0 and dependent not in results:
+                        ready.append(dependent)
+    finally:
+        for future in running:
+            future.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    
+    return {subtask_id: results[subtask_id] for subtask_id in graph.order}
@@ -0,0 +1,136 @@
+"""
+Termination module that decides when an agent loop should stop.
+
+Agents stop as soon as they have an answer instead of always running
+`max_iterations` cycles. The budget tracked here also catches runs that
+repeat themselves or overrun their time or token allowance.
+"""
+
+import time
+from typing import Any, Dict, Optional, Set
+
+# Name of the action an agent takes to return its final answer
+FINAL_ANSWER_ACTION = "final_answer"
+
+class StopReason:
+    """Conditions that can end an agent run."""
+    
+    FINAL_ANSWER = "final_answer"
+    TOOL_SUCCESS = "tool_success"
+    LOOP_DETECTED = "loop_detected"
+    MAX_ITERATIONS = "max_iterations"
+    TIME_BUDGET = "time_budget"
+    TOKEN_BUDGET = "token_budget"
+
+# Stop reasons of runs that produced an answer
+ANSWERED_REASONS = frozenset({StopReason.FINAL_ANSWER, StopReason.TOOL_SUCCESS})
+
+def run_status(result: Dict[str, Any]) -> str:
+    """
+    Classify the result of a run.
+    
+    Args:
+        result: A result returned by an agent or the orchestrator.
+        
+    Returns:
+        The result's own "status" if it has one, such as "error" for a
+        failed multi-agent run; otherwise "success" if the run answered the
+        task and "incomplete" if a budget or a loop ended it first.
+    """
+    status = result.get("status")
+    if status is not None:
+        return status
+    stop_reason = result.get("stop_reason")
+    return "success" if stop_reason is None or stop_reason in ANSWERED_REASONS else "incomplete"
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of model tokens in a piece of text.
+    
+    Args:
+        text: The text to measure.
+        
+    Returns:
+        An approximate token count, using the common four characters per
+        token rule of thumb.
+    """
+    return len(text) // 4 + 1
+
+class RunBudget:
+    """
+    Tracks the iteration, wall-time and token budgets of a single task run.
+    
+    It also remembers every action/observation pair seen so far so that a run
+    that keeps repeating itself can be stopped.
+    """
+    
+    __slots__ = ("max_iterations", "max_time", "max_tokens", "iterations", "tokens", "started", "_seen")
+    
+    def __init__(
+        self,
+        max_iterations: int,
+        max_time: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ):
+        """
+        Initialize a RunBudget instance.
+        
+        Args:
+            max_iterations: Maximum number of thought-action cycles.
+            max_time: Optional wall-time limit for the run in seconds.
+            max_tokens: Optional limit on the tokens produced and consumed.
+        """
+        self.max_iterations = max_iterations
+        self.max_time = max_time
+        self.max_tokens = max_tokens
+        self.iterations = 0
+        self.tokens = 0
+        self.started = time.monotonic()
+        self._seen: Set[str] = set()
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started
+    
+    def add_tokens(self, text: str) -> None:
+        """
+        Charge the tokens of a piece of text against the budget.
+        
+        Args:
+            text: Text sent to or received from the model.
+        """
+        self.tokens += estimate_tokens(text)
+    
+    def is_repeat(self, action: Dict[str, Any], observation: Dict[str, Any]) -> bool:
+        """
+        Record an action/observation pair and report whether it was seen before.
+        
+        Args:
+            action: The action taken.
+            observation: The observation it produced.
+            
+        Returns:
+            True if the same pair already occurred in this run.
+        """
+        key = repr((action, observation))
+        if key in self._seen:
+            return True
+        self._seen.add(key)
+        return False
+    
+    def exhausted(self) -> Optional[str]:
+        """
+        Check whether any budget has run out.
+        
+        Returns:
+            The StopReason of the exhausted budget, or None if the run may
+            continue.
+        """
+        if self.iterations >= self.max_iterations:
+            return StopReason.MAX_ITERATIONS
+        if self.max_time is not None and self.elapsed >= self.max_time:
+            return StopReason.TIME_BUDGET
+        if self.max_tokens is not None and self.tokens >= self.max_tokens:
+            return StopReason.TOKEN_BUDGET
+        return None
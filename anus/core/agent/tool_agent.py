@@ -2,15 +2,38 @@
 Tool Agent module that extends the react agent with tool execution capabilities.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
-import importlib
+from typing import Dict, List, Any, Optional
+import asyncio
 import logging
 import re
+import time
 
-class ToolAgent:
+from anus.core.agent.react_agent import ReactAgent
+from anus.core.agent.termination import FINAL_ANSWER_ACTION, StopReason
+from anus.core.agent.trace import Trace
+from anus.core.cache import MISSING, LRUCache, make_key
+from anus.tools.registry import ToolRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+class ToolAgent(ReactAgent):
     """
     An agent that can use tools to interact with its environment.
     
+    Tools may be synchronous objects with an `execute` method, or declare
+    themselves asynchronous by setting `is_async = True` and providing an
+    `aexecute` coroutine. Synchronous tools that block on I/O can set
+    `blocking = True` to be run on a worker thread by the async path.
+    Tools whose successful result answers the task outright, like the
+    calculator, set `terminal = True` so the run ends right after them.
+    Tools that always return the same output for the same input set
+    `deterministic = True`; their successful results are memoized for the
+    rest of the run, and in the optional session-wide `tool_cache`.
+    
+    Tools come from a ToolRegistry. Loading a tool only records its name;
+    the tool's module is imported, and its shared instance created, the first
+    time any agent uses it.
+    
     This is a simplified implementation for the demo.
     """
     
@@ -19,6 +42,8 @@ class ToolAgent:
         name: Optional[str] = None, 
         max_iterations: int = 10, 
         tools: Optional[List[str]] = None,
+        tool_cache: Optional[LRUCache] = None,
+        registry: Optional[ToolRegistry] = None,
         **kwargs
     ):
         """
@@ -28,95 +53,267 @@ class ToolAgent:
             name: Optional name for the agent.
             max_iterations: Maximum number of thought-action cycles to perform.
             tools: Optional list of tool names to load.
+            tool_cache: Optional cache of deterministic tool results shared
+                across tasks, e.g. for the lifetime of a session.
+            registry: Registry to load tools from. Defaults to the shared
+                process-wide registry.
             **kwargs: Additional configuration options for the agent.
         """
-        self.name = name or "anus-tool-agent"
-        self.max_iterations = max_iterations
-        self.tools = {}
+        super().__init__(name=name or "anus-tool-agent", max_iterations=max_iterations, **kwargs)
+        self.registry = registry or get_registry()
+        # Tool name -> tool instance, or None until the tool is first used
+        self.tools: Dict[str, Optional[Any]] = {}
+        self.tool_cache = tool_cache
         
         # Load specified tools or default tools
         if tools:
             for tool_name in tools:
                 self.load_tool(tool_name)
     
-    def load_tool(self, tool_name: str) -> bool:
+    def load_tool(self, tool_name: str, tool: Optional[Any] = None) -> bool:
         """
         Load a tool by name.
         
         Args:
             tool_name: The name of the tool to load.
+            tool: Optional tool instance to register under the name.
             
         Returns:
             True if the tool was loaded successfully, False otherwise.
         """
         try:
-            # For the demo, we'll just acknowledge the tool loading
-            # In a real implementation, this would dynamically load tool classes
-            self.tools[tool_name] = {"name": tool_name, "loaded": True}
+            if tool is not None:
+                self.tools[tool_name] = tool
+                return True
+            
+            if not self.registry.has(tool_name):
+                return False
+            self.tools[tool_name] = None
             return True
         except Exception as e:
-            logging.error(f"Failed to load tool {tool_name}: {e}")
+            logger.error("Failed to load tool %s: %s", tool_name, e)
             return False
     
-    def execute(self, task: str) -> Dict[str, Any]:
+    def _get_tool(self, tool_name: str) -> Optional[Any]:
         """
-        Execute a task using available tools.
+        Return a loaded tool, creating it through the registry on first use.
         
         Args:
-            task: The task to execute.
+            tool_name: The name of the tool.
             
         Returns:
-            A dictionary containing the execution result and metadata.
+            The tool instance, or None if the tool is not loaded.
         """
-        context = {
-            "task": task,
-            "thoughts": [],
-            "actions": [],
-            "observations": []
-        }
+        tool = self.tools.get(tool_name)
+        if tool is None and tool_name in self.tools:
+            tool = self.tools[tool_name] = self.registry.get(tool_name)
+        return tool
+    
+    def _next_action(self, task: str, context: Trace) -> Dict[str, Any]:
+        """
+        Decide which tool to use next.
         
-        # Simulate the execution process
-        for i in range(self.max_iterations):
-            # Simulate thinking
-            thought = f"Thinking about how to {task} (iteration {i})"
-            context["thoughts"].append(thought)
-            
-            # Determine which tool to use (simplified)
-            # In a real implementation, this would be based on the LLM's decision
-            if "calculate" in task.lower() and "calculator" in self.tools:
-                tool_name = "calculator"
-                tool_input = {"expression": task.split("Calculate ")[-1] if "Calculate " in task else "42 * 73"}
-            else:
-                tool_name = "dummy_action"
-                tool_input = {"query": f"Placeholder action for {task.lower()}?"}
+        Args:
+            task: The task being executed.
+            context: The trace of the run so far.
             
-            # Record the action
-            action = {"name": tool_name, "input": tool_input}
-            context["actions"].append(action)
+        Returns:
+            An action dictionary with "name" and "input" keys.
+        """
+        # Determine which tool to use (simplified)
+        # In a real implementation, this would be based on the LLM's decision
+        if "calculate" in task.lower() and "calculator" in self.tools:
+            return {
+                "name": "calculator",
+                "input": {"expression": task.split("Calculate ")[-1] if "Calculate " in task else "42 * 73"}
+            }
+        return {"name": "dummy_action", "input": {"query": f"Placeholder action for {task.lower()}?"}}
+    
+    def _tool_flag(self, tool_name: str, flag: str) -> bool:
+        """
+        Read a boolean declaration such as `terminal` from a loaded tool.
+        
+        Args:
+            tool_name: The name of the tool.
+            flag: The attribute to read.
             
-            # Simulate the observation
-            if tool_name in self.tools:
-                if tool_name == "calculator":
-                    # Simple calculator implementation for demo
-                    try:
-                        expression = tool_input["expression"]
-                        # WARNING: eval is used here for demo purposes only
-                        # In a real implementation, use a safer method
-                        result = str(eval(expression))
-                        observation = {"expression": expression, "result": result, "status": "success"}
-                    except Exception as e:
-                        observation = {"status": "error", "error": str(e)}
-                else:
-                    observation = {"status": "success", "result": f"Executed {tool_name} with input {tool_input}"}
-            else:
-                observation = {"status": "error", "error": f"Unknown action or tool: {tool_name}"}
+        Returns:
+            The value of the attribute, or False if the tool does not set it.
+        """
+        try:
+            tool = self._get_tool(tool_name)
+        except Exception:
+            # Import errors surface when the tool is called
+            return False
+        return getattr(tool, flag, False)
+    
+    async def aexecute(self, task: str, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute a task using available tools.
+        
+        The run stops on a final-answer action, after a successful call to a
+        terminal tool, when an action/observation pair repeats, or when the
+        iteration, time or token budget runs out.
+        
+        Args:
+            task: The task to execute.
+            run_id: Id to checkpoint the run under, if the agent has a
+                checkpoint store. If the store holds an interrupted run with
+                this id, the run continues after its last logged iteration.
             
-            context["observations"].append(observation)
+        Returns:
+            A dictionary containing the execution result and metadata, including
+            the `stop_reason` that ended the run.
+        """
+        context, budget = self._start_run(task, run_id)
+        checkpoints = self.checkpoints
+        answer = "I was unable to process your request successfully. Please try again."
+        task_cache: Dict[Any, Dict[str, Any]] = {}
+        cache_stats = {"hits": 0, "misses": 0}
+        context["tool_cache"] = cache_stats
+        hooks = self.hooks
+        # Checked once per run so that iterations pay nothing when DEBUG is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Simulate the execution process
+        while True:
+            stop_reason = budget.exhausted()
+            if stop_reason is not None:
+                break
+            i = budget.iterations
+            budget.iterations += 1
+            started = time.monotonic() if hooks else 0.0
+            try:
+                # Simulate thinking
+                thought = await self._athink(context, budget, i)
+                
+                # Record the action
+                action = self._next_action(task, context)
+                context.record_action(action)
+                if debug:
+                    logger.debug("Agent %s iteration %d: %s", self.name, i, action["name"])
+                if action["name"] == FINAL_ANSWER_ACTION:
+                    if checkpoints is not None:
+                        self._checkpoint(context, budget, i, thought, action)
+                    answer = action["input"]["answer"]
+                    stop_reason = StopReason.FINAL_ANSWER
+                    break
+                
+                # Execute the tool and record the observation
+                tool_started = time.monotonic() if hooks else 0.0
+                hits = cache_stats["hits"]
+                observation = await self._acall_tool_cached(action["name"], action["input"], task_cache, cache_stats)
+                if hooks:
+                    self._emit_tool_call(action["name"], observation, cache_stats["hits"] > hits, tool_started)
+                context.record_observation(observation)
+                if budget.max_tokens is not None:
+                    budget.add_tokens(str(observation))
+                if checkpoints is not None:
+                    self._checkpoint(context, budget, i, thought, action, observation)
+                
+                if observation.get("status") == "success" and self._tool_flag(action["name"], "terminal"):
+                    answer = str(observation.get("result"))
+                    stop_reason = StopReason.TOOL_SUCCESS
+                    break
+                if budget.is_repeat(action, observation):
+                    stop_reason = StopReason.LOOP_DETECTED
+                    break
+            finally:
+                if hooks:
+                    self._end_iteration(context, i, started)
+        
+        self._end_run(context, budget, answer, stop_reason)
         
         # Return the final result
         return {
             "task": task,
-            "answer": "I was unable to process your request successfully. Please try again.",
-            "iterations": i,
+            "answer": answer,
+            "iterations": budget.iterations,
+            "stop_reason": stop_reason,
             "context": context
-        }
\ No newline at end of file
+        }
+    
+    def _emit_tool_call(self, tool_name: str, observation: Dict[str, Any], cached: bool, started: float) -> None:
+        """
+        Report a finished tool call to the hooks.
+        
+        Args:
+            tool_name: The name of the tool.
+            observation: The observation the call produced.
+            cached: Whether the result was served from a cache.
+            started: Monotonic time the call started at.
+        """
+        now = time.monotonic()
+        self.hooks.emit("on_tool_call", {
+            "agent": self.name,
+            "tool": tool_name,
+            "status": observation.get("status"),
+            "cached": cached,
+            "deterministic": self._tool_flag(tool_name, "deterministic"),
+            "timestamp": now,
+            "duration": now - started
+        })
+    
+    async def _acall_tool_cached(
+        self,
+        tool_name: str,
+        tool_input: Dict[str, Any],
+        task_cache: Dict[Any, Dict[str, Any]],
+        stats: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """
+        Call a tool, serving deterministic tools from the cache when possible.
+        
+        Args:
+            tool_name: The name of the tool to call.
+            tool_input: Keyword arguments for the tool.
+            task_cache: Results memoized during the current run.
+            stats: Hit and miss counters, updated in place.
+            
+        Returns:
+            A dictionary describing the observation.
+        """
+        if not self._tool_flag(tool_name, "deterministic"):
+            return await self._acall_tool(tool_name, tool_input)
+        
+        key = make_key(tool_name, tool_input)
+        cached = task_cache.get(key, MISSING)
+        if cached is MISSING and self.tool_cache is not None:
+            cached = self.tool_cache.get(key)
+        if cached is not MISSING:
+            stats["hits"] += 1
+            return dict(cached)
+        
+        stats["misses"] += 1
+        observation = await self._acall_tool(tool_name, tool_input)
+        if observation.get("status") == "success":
+            # Failures may be transient, e.g. a time limit, so only successes are kept
+            task_cache[key] = observation
+            if self.tool_cache is not None:
+                self.tool_cache.set(key, observation)
+        return dict(observation)
+    
+    async def _acall_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a loaded tool and return its observation.
+        
+        Args:
+            tool_name: The name of the tool to call.
+            tool_input: Keyword arguments for the tool.
+            
+        Returns:
+            A dictionary describing the observation.
+        """
+        if tool_name not in self.tools:
+            return {"status": "error", "error": f"Unknown action or tool: {tool_name}"}
+        
+        try:
+            tool = self._get_tool(tool_name)
+            if getattr(tool, "is_async", False):
+                return await tool.aexecute(**tool_input)
+            if getattr(tool, "blocking", False):
+                return await asyncio.to_thread(tool.execute, **tool_input)
+            return tool.execute(**tool_input)
+        except Exception as e:
+            logger.error("Tool %s failed: %s", tool_name, e)
+            return {"status": "error", "error": str(e)}
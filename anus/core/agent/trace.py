@@ -0,0 +1,202 @@
+"""
+Trace module that records what an agent did during a run.
+
+A Trace stores the thoughts, actions and observations of a run in flat
+columns, keeps the task text once, and only builds the familiar
+`{"task", "thoughts", "actions", "observations"}` dictionaries when they
+are read or serialized. The amount recorded is controlled by a trace level.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from anus.core.agent.context_window import ContextWindow
+
+class TraceLevel:
+    """How much of a run a Trace records."""
+    
+    # Only the step count and the extra run statistics
+    OFF = "off"
+    # Action names and observation statuses, without any text
+    SUMMARY = "summary"
+    # Everything
+    FULL = "full"
+    
+    ALL = (OFF, SUMMARY, FULL)
+
+class Trace(Mapping):
+    """
+    A compact, read-only mapping view of an agent run.
+    
+    Reading `trace["thoughts"]`, `trace["actions"]` or `trace["observations"]`
+    materializes fresh lists, so callers that only look at the final answer
+    never pay for them. Extra run statistics, such as tool cache counters,
+    can be stored with item assignment.
+    
+    When the run is being streamed, each record is also reported to the
+    `listener` as an event, whatever the trace level. With a `window`, each
+    record is also added to that ContextWindow, from which model prompts
+    are built.
+    """
+    
+    __slots__ = (
+        "task", "level", "thought_template", "agent", "listener", "window", "steps", "last_observation", "extra",
+        "_thoughts", "_action_names", "_action_inputs", "_observations", "_statuses"
+    )
+    
+    _KEYS = ("task", "thoughts", "actions", "observations")
+    
+    def __init__(
+        self,
+        task: str,
+        level: str = TraceLevel.FULL,
+        thought_template: Optional[str] = None,
+        agent: Optional[str] = None,
+        listener: Optional[Callable[[Dict[str, Any]], None]] = None,
+        window: Optional["ContextWindow"] = None
+    ):
+        """
+        Initialize a Trace instance.
+        
+        Args:
+            task: The task being executed.
+            level: One of the TraceLevel values.
+            thought_template: Format string with `{task}` and `{iteration}`
+                fields used for thoughts recorded without text.
+            agent: Name of the agent, reported with streamed events.
+            listener: Optional callback receiving an event per record.
+            window: Optional context window receiving each record.
+        """
+        if level not in TraceLevel.ALL:
+            raise ValueError(f"Unknown trace level: {level}")
+        self.task = sys.intern(task) if len(task) < 256 else task
+        self.level = level
+        self.thought_template = thought_template
+        self.agent = agent
+        self.listener = listener
+        self.window = window
+        self.steps = 0
+        self.last_observation: Optional[Dict[str, Any]] = None
+        self.extra: Dict[str, Any] = {}
+        self._thoughts: List[Optional[str]] = []
+        self._action_names: List[str] = []
+        self._action_inputs: List[Any] = []
+        self._observations: List[Dict[str, Any]] = []
+        self._statuses: List[Optional[str]] = []
+    
+    def record_thought(self, thought: Optional[str] = None) -> None:
+        """
+        Record a thought.
+        
+        Args:
+            thought: The thought text, or None to render it from the thought
+                template when the trace is read.
+        """
+        self.steps += 1
+        if self.level == TraceLevel.FULL:
+            self._thoughts.append(thought)
+        if self.listener is not None or self.window is not None:
+            iteration = self.steps - 1
+            if thought is None:
+                thought = self.thought_template.format(task=self.task, iteration=iteration)
+            if self.window is not None:
+                self.window.append("assistant", thought)
+            if self.listener is not None:
+                self.listener({"type": "thought", "agent": self.agent, "iteration": iteration, "text": thought})
+    
+    def record_action(self, action: Dict[str, Any]) -> None:
+        """
+        Record an action.
+        
+        Args:
+            action: An action dictionary with "name" and "input" keys.
+        """
+        if self.listener is not None:
+            self.listener({"type": "action", "agent": self.agent, "name": action["name"], "input": action.get("input")})
+        if self.window is not None:
+            self.window.append("assistant", f"Action: {action['name']} {action.get('input')}")
+        if self.level == TraceLevel.OFF:
+            return
+        self._action_names.append(sys.intern(action["name"]))
+        if self.level == TraceLevel.FULL:
+            self._action_inputs.append(action.get("input"))
+    
+    def record_observation(self, observation: Dict[str, Any]) -> None:
+        """
+        Record an observation.
+        
+        Args:
+            observation: The observation dictionary.
+        """
+        self.last_observation = observation
+        if self.listener is not None:
+            self.listener({"type": "observation", "agent": self.agent, "observation": observation})
+        if self.window is not None:
+            self.window.append("user", f"Observation: {observation}")
+        if self.level == TraceLevel.OFF:
+            return
+        self._statuses.append(observation.get("status"))
+        if self.level == TraceLevel.FULL:
+            self._observations.append(observation)
+    
+    @property
+    def thoughts(self) -> List[str]:
+        """The recorded thoughts, rendering templated ones."""
+        template = self.thought_template
+        return [
+            thought if thought is not None else template.format(task=self.task, iteration=i)
+            for i, thought in enumerate(self._thoughts)
+        ]
+    
+    @property
+    def actions(self) -> List[Dict[str, Any]]:
+        """The recorded actions."""
+        if self.level == TraceLevel.FULL:
+            return [{"name": name, "input": data} for name, data in zip(self._action_names, self._action_inputs)]
+        return [{"name": name} for name in self._action_names]
+    
+    @property
+    def observations(self) -> List[Dict[str, Any]]:
+        """The recorded observations."""
+        if self.level == TraceLevel.FULL:
+            return list(self._observations)
+        return [{"status": status} for status in self._statuses]
+    
+    def __getitem__(self, key: str) -> Any:
+        """Return one field of the dictionary view."""
+        if key == "task":
+            return self.task
+        if key in ("thoughts", "actions", "observations"):
+            return getattr(self, key)
+        return self.extra[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Store an extra run statistic."""
+        if key in self._KEYS:
+            raise KeyError(f"{key} is recorded through the record_* methods")
+        self.extra[key] = value
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the dictionary view."""
+        yield from self._KEYS
+        yield from self.extra
+    
+    def __len__(self) -> int:
+        """Return the number of keys of the dictionary view."""
+        return len(self._KEYS) + len(self.extra)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the full dictionary view, e.g. for serialization.
+        
+        Returns:
+            A plain dictionary with the task, thoughts, actions, observations
+            and any extra run statistics.
+        """
+        return {key: self[key] for key in self}
+    
+    def __repr__(self) -> str:
+        """Return a short description that does not materialize the trace."""
+        return f"<Trace level={self.level} steps={self.steps} task={self.task[:40]!r}>"
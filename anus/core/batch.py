@@ -0,0 +1,235 @@
+"""
+Batch execution module for the ANUS framework.
+
+This module runs a stream of tasks through an AgentOrchestrator on a pool of
+workers and writes the results as JSON lines in completion order.
+"""
+
+import json
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from multiprocessing.util import Finalize
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+from anus.core.orchestrator import AgentOrchestrator
+from anus.core.utils.logging_utils import configure_logging
+from anus.core.utils.serialization import json_default
+
+# Orchestrator used by the worker function; one per process
+_orchestrator: Optional[AgentOrchestrator] = None
+_refresh = False
+
+def _init_worker(config_path: str, use_cache: bool = True, refresh: bool = False, process: bool = False) -> None:
+    """
+    Create the orchestrator used by batch workers in this process.
+    
+    Args:
+        config_path: Path to the configuration file.
+        use_cache: Whether to use the result cache if one is configured.
+        refresh: Whether to re-run tasks that have cached results.
+        process: Whether this is a worker process, which sets up its own
+            logging. Worker processes log to the console only, since a
+            rotating log file cannot be shared between processes.
+    """
+    global _orchestrator, _refresh
+    _orchestrator = AgentOrchestrator(config_path=config_path, use_cache=use_cache)
+    _refresh = refresh
+    if process:
+        configure_logging({**(_orchestrator.config.get("logging") or {}), "file": None})
+        # Worker processes skip atexit handlers, but run multiprocessing finalizers
+        Finalize(None, _close_worker, exitpriority=10)
+
+def _close_worker() -> None:
+    """Close the orchestrator used by batch workers in this process."""
+    global _orchestrator
+    if _orchestrator is not None:
+        _orchestrator.close()
+        _orchestrator = None
+
+def _run_task(index: int, task: str, mode: Optional[str]) -> Tuple[int, Dict[str, Any], float]:
+    """
+    Execute a single batch task.
+    
+    Args:
+        index: Position of the task in the input.
+        task: The task to execute.
+        mode: The execution mode, if any.
+        
+    Returns:
+        A tuple of the input index, the result record and the latency in seconds.
+    """
+    start = time.perf_counter()
+    try:
+        result = _orchestrator.execute_task(task, mode=mode, refresh=_refresh)
+        record = {"index": index, "task": task, "result": result}
+    except Exception as e:
+        record = {"index": index, "task": task, "status": "error", "error": str(e)}
+    return index, record, time.perf_counter() - start
+
+def read_tasks(stream: IO[str], default_mode: Optional[str] = None) -> Iterator[Tuple[int, str, Optional[str]]]:
+    """
+    Read tasks from a JSONL or plain text stream.
+    
+    Lines that parse as a JSON object are read as {"task": ..., "mode": ...};
+    any other non-empty line is taken as the task text itself.
+    
+    Args:
+        stream: The input stream.
+        default_mode: Mode used when a line does not specify one.
+        
+    Yields:
+        Tuples of (index, task, mode), where index counts the tasks read.
+    """
+    index = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        
+        task, mode = line, default_mode
+        if line.startswith("{"):
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                item = None
+            if isinstance(item, dict) and "task" in item:
+                task = str(item["task"])
+                mode = item.get("mode", default_mode)
+        
+        yield index, task, mode
+        index += 1
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of an already sorted list.
+    
+    Args:
+        sorted_values: Values in ascending order.
+        fraction: The percentile as a fraction between 0 and 1.
+        
+    Returns:
+        The percentile value, or 0.0 for an empty list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+class BatchRunner:
+    """
+    Runs tasks through an AgentOrchestrator on a thread or process pool.
+    
+    The orchestrator, configuration and agents are built once per worker
+    process rather than once per task.
+    """
+    
+    def __init__(
+        self,
+        config_path: str = "config.yaml",
+        workers: int = 4,
+        executor: str = "thread",
+        mode: Optional[str] = None,
+        use_cache: bool = True,
+        refresh: bool = False
+    ):
+        """
+        Initialize a BatchRunner instance.
+        
+        Args:
+            config_path: Path to the configuration file.
+            workers: Number of concurrent workers.
+            executor: Either "thread" or "process".
+            mode: Default execution mode for tasks that do not specify one.
+            use_cache: Whether to use the result cache if one is configured.
+            refresh: Whether to re-run tasks that have cached results.
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor type: {executor}")
+        self.config_path = config_path
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.mode = mode
+        self.use_cache = use_cache
+        self.refresh = refresh
+    
+    def _create_pool(self):
+        """
+        Create the worker pool.
+        
+        Returns:
+            A ThreadPoolExecutor or ProcessPoolExecutor.
+        """
+        if self.executor == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.config_path, self.use_cache, self.refresh, True)
+            )
+        
+        # Threads share a single orchestrator
+        _init_worker(self.config_path, self.use_cache, self.refresh)
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="anus-batch")
+    
+    def run(self, input_stream: IO[str], output_stream: IO[str]) -> Dict[str, Any]:
+        """
+        Execute every task from the input stream and stream results out.
+        
+        At most twice the number of workers tasks are in flight at once, so
+        arbitrarily long inputs are processed in bounded memory.
+        
+        Args:
+            input_stream: Stream of tasks in JSONL or plain text format.
+            output_stream: Stream that receives one JSON result per line.
+            
+        Returns:
+            A dictionary of run statistics.
+        """
+        latencies: List[float] = []
+        errors = 0
+        start = time.perf_counter()
+        tasks = read_tasks(input_stream, default_mode=self.mode)
+        max_in_flight = self.workers * 2
+        
+        pool = self._create_pool()
+        try:
+            pending = set()
+            exhausted = False
+            while pending or not exhausted:
+                # Keep the pool fed without reading the whole input up front
+                while not exhausted and len(pending) < max_in_flight:
+                    item = next(tasks, None)
+                    if item is None:
+                        exhausted = True
+                    else:
+                        pending.add(pool.submit(_run_task, *item))
+                if not pending:
+                    break
+                
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, record, latency = future.result()
+                    latencies.append(latency)
+                    if record.get("status") == "error" or (
+                        isinstance(record.get("result"), dict)
+                        and record["result"].get("status") == "error"
+                    ):
+                        errors += 1
+                    record["latency"] = latency
+                    output_stream.write(json.dumps(record, default=json_default) + "\n")
+                output_stream.flush()
+        finally:
+            pool.shutdown()
+            if self.executor == "thread":
+                _close_worker()
+        
+        elapsed = time.perf_counter() - start
+        latencies.sort()
+        return {
+            "tasks": len(latencies),
+            "errors": errors,
+            "elapsed": elapsed,
+            "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+            "p50_latency": _percentile(latencies, 0.50),
+            "p99_latency": _percentile(latencies, 0.99)
+        }
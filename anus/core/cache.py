@@ -0,0 +1,260 @@
+"""
+Cache module for the ANUS framework.
+
+This module provides the caches used to avoid repeating work, such as
+calling a deterministic tool again with the same input or re-running a
+whole agent loop for a task that was answered before. All caches share the
+same get/set/delete/clear interface.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from anus.core.utils.serialization import json_default
+
+# Sentinel returned by cache lookups that miss
+MISSING = object()
+
+def make_key(*parts: Any) -> Hashable:
+    """
+    Build a hashable cache key from arbitrary JSON-like values.
+    
+    Dictionaries are keyed by their sorted items, so two inputs that differ
+    only in key order map to the same key.
+    
+    Args:
+        *parts: The values that identify the cached item.
+        
+    Returns:
+        A hashable representation of the values.
+    """
+    return tuple(_freeze(part) for part in parts)
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a value into a hashable equivalent.
+    
+    Args:
+        value: The value to convert.
+        
+    Returns:
+        The hashable equivalent.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return tuple(sorted(_freeze(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+class LRUCache:
+    """
+    A thread-safe least-recently-used cache with optional expiry.
+    
+    Entries are evicted when the cache grows beyond `maxsize` or when they are
+    older than `ttl` seconds.
+    """
+    
+    def __init__(self, maxsize: Optional[int] = 1024, ttl: Optional[float] = None):
+        """
+        Initialize an LRUCache instance.
+        
+        Args:
+            maxsize: Maximum number of entries, or None for no limit.
+            ttl: Optional time to live of each entry in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Look up a key and mark it as recently used.
+        
+        Args:
+            key: The key to look up.
+            default: Value returned when the key is missing or expired.
+            
+        Returns:
+            The cached value, or the default.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if needed.
+        
+        Args:
+            key: The key to store under.
+            value: The value to store.
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a key if present.
+        
+        Args:
+            key: The key to remove.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        """Return the number of entries, including ones not yet found expired."""
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    A persistent cache of JSON-serializable values stored in SQLite.
+    
+    Entries expire after `ttl` seconds, and the least recently used entries
+    are evicted once the store holds more than `maxsize` entries. Eviction
+    runs every EVICT_EVERY writes, so the store may briefly exceed maxsize.
+    The file can be shared by several processes.
+    """
+    
+    # Number of writes between eviction passes
+    EVICT_EVERY = 32
+    
+    def __init__(self, path: str, maxsize: Optional[int] = 10000, ttl: Optional[float] = None):
+        """
+        Initialize a SQLiteCache instance.
+        
+        Args:
+            path: Path to the SQLite database file.
+            maxsize: Maximum number of entries, or None for no limit.
+            ttl: Optional time to live of each entry in seconds.
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed)")
+    
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """
+        Look up a key and mark it as recently used.
+        
+        Args:
+            key: The key to look up.
+            default: Value returned when the key is missing or expired.
+            
+        Returns:
+            A freshly decoded copy of the cached value, or the default.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return default
+            value, expires = row
+            if expires is not None and expires <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return default
+            self._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting expired and least recently used entries if needed.
+        
+        Args:
+            key: The key to store under.
+            value: A JSON-serializable value.
+        """
+        now = time.time()
+        expires = now + self.ttl if self.ttl is not None else None
+        data = json.dumps(value, default=json_default)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires, accessed) VALUES (?, ?, ?, ?)",
+                (key, data, expires, now)
+            )
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict(now)
+    
+    def _evict(self, now: float) -> None:
+        """
+        Remove expired entries and trim the store to maxsize.
+        
+        Args:
+            now: The current time.
+        """
+        self._conn.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        if self.maxsize is not None:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,)
+            )
+    
+    def delete(self, key: str) -> None:
+        """
+        Remove a key if present.
+        
+        Args:
+            key: The key to remove.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def __len__(self) -> int:
+        """Return the number of entries, including ones not yet evicted."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
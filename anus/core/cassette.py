@@ -0,0 +1,367 @@
+"""
+Cassette module for the ANUS framework.
+
+A Cassette records the model requests and tool calls an agent makes, with
+their responses and how long each took, into a gzip-compressed JSON lines
+file. Played back, it answers the same requests from the file without any
+network access or API key, either after the recorded delays or at once.
+That makes realistic load tests and benchmarks of the agent loop possible
+offline, and lets a slow production run be reproduced locally.
+
+Requests are matched by a hash of their content. A request made several
+times is answered with its recorded responses in order, starting over
+after the last one, so one recorded run can drive many replayed ones.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from anus.core.config import CassetteMode, ReplayLatency
+from anus.core.llm.base import LLMError
+from anus.core.utils.async_utils import run_sync
+from anus.core.utils.serialization import json_default
+from anus.tools.registry import TOOL_FLAGS, import_spec
+
+logger = logging.getLogger(__name__)
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed request was never recorded."""
+
+def request_key(kind: str, payload: Any) -> str:
+    """
+    Hash a request for lookup in a cassette.
+    
+    Args:
+        kind: "llm" or "tool".
+        payload: The JSON-serializable content of the request.
+        
+    Returns:
+        A short hex digest of the request.
+    """
+    data = json.dumps([kind, payload], sort_keys=True, default=json_default)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=12).hexdigest()
+
+class Cassette:
+    """
+    A file of recorded model and tool calls.
+    
+    Recording truncates the file and writes one line per finished call,
+    flushed as it is written, so a recording cut short by a crash can still
+    be replayed up to its last call. A cassette file should be recorded by
+    one process at a time.
+    """
+    
+    def __init__(self, path: str, mode: str = CassetteMode.REPLAY, latency: str = ReplayLatency.RECORDED):
+        """
+        Initialize a Cassette instance.
+        
+        Args:
+            path: Path to the cassette file.
+            mode: CassetteMode.RECORD or CassetteMode.REPLAY.
+            latency: A ReplayLatency value; only used when replaying.
+            
+        Raises:
+            ValueError: If the mode or latency is not supported.
+            OSError: If the file cannot be opened.
+        """
+        if mode not in (CassetteMode.RECORD, CassetteMode.REPLAY):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        if latency not in ReplayLatency.ALL:
+            raise ValueError(f"Unsupported replay latency: {latency}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+        self._file = None
+        # Recorded entries and the index of the next one to serve, by request key
+        self._entries: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._positions: Dict[str, int] = defaultdict(int)
+        
+        if mode == CassetteMode.RECORD:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._load()
+    
+    @property
+    def recording(self) -> bool:
+        """Whether calls are being recorded rather than replayed."""
+        return self.mode == CassetteMode.RECORD
+    
+    def _load(self) -> None:
+        """Read the recorded entries, tolerating a truncated last line."""
+        count = 0
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    self._entries[entry["key"]].append(entry)
+                    count += 1
+        except EOFError:
+            logger.warning("Cassette %s ends early; replaying its first %d calls", self.path, count)
+        logger.info("Loaded %d recorded calls from cassette %s", count, self.path)
+    
+    def record(self, kind: str, name: str, payload: Any, response: Dict[str, Any], latency: float) -> None:
+        """
+        Write a finished call to the cassette.
+        
+        Args:
+            kind: "llm" or "tool".
+            name: The model or tool called.
+            payload: The JSON-serializable content of the request.
+            response: What the call returned.
+            latency: How long the call took, in seconds.
+        """
+        entry = {
+            "kind": kind,
+            "name": name,
+            "key": request_key(kind, payload),
+            "latency": round(latency, 6),
+            "response": response
+        }
+        line = json.dumps(entry, separators=(",", ":"), default=json_default)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+    
+    def lookup(self, kind: str, payload: Any) -> Tuple[Dict[str, Any], float]:
+        """
+        Find the recorded response to a request.
+        
+        Args:
+            kind: "llm" or "tool".
+            payload: The JSON-serializable content of the request.
+            
+        Returns:
+            A tuple of the recorded response and the delay to replay it with.
+            
+        Raises:
+            CassetteMiss: If the request was never recorded.
+        """
+        key = request_key(kind, payload)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMiss(f"No recorded {kind} call matches this request in cassette {self.path}")
+            position = self._positions[key]
+            self._positions[key] = (position + 1) % len(entries)
+        entry = entries[position]
+        latency = entry["latency"] if self.latency == ReplayLatency.RECORDED else 0.0
+        return entry["response"], latency
+    
+    def wrap_llm(self, client: Optional[Any]) -> "CassetteLLMClient":
+        """
+        Route a model client's requests through the cassette.
+        
+        Args:
+            client: The client to record, or None when replaying.
+            
+        Returns:
+            A client recording or replaying its requests.
+        """
+        return CassetteLLMClient(self, client)
+    
+    def wrap_tools(self, registry: Any, names: Sequence[str]) -> None:
+        """
+        Route calls to tools of a registry through the cassette.
+        
+        Each named tool is registered again as a CassetteTool. Unknown tools
+        are skipped.
+        
+        Args:
+            registry: The ToolRegistry to update.
+            names: The tools to record or replay.
+        """
+        for name in names:
+            if registry.has(name):
+                registry.register_instance(name, CassetteTool(name, self, registry.spec(name)))
+    
+    def close(self) -> None:
+        """Finish writing a recording."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+class CassetteLLMClient:
+    """
+    Stands in for a model client, recording or replaying its requests.
+    
+    When replaying, the recorded text is streamed as a single token.
+    """
+    
+    def __init__(self, cassette: Cassette, client: Optional[Any] = None):
+        """
+        Initialize a CassetteLLMClient instance.
+        
+        Args:
+            cassette: The cassette to record into or replay from.
+            client: The real client; required when recording.
+        """
+        if cassette.recording and client is None:
+            raise ValueError("Recording model requests needs a model client")
+        self.cassette = cassette
+        self.client = client
+        self.model = getattr(client, "model", None)
+    
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        on_token: Optional[Callable[[str], None]] = None,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Request a completion asynchronously, as `LLMClient.acomplete` does.
+        
+        Args:
+            messages: Chat messages, each with "role" and "content" keys.
+            on_token: Optional callback receiving the text as it streams in.
+            **options: Request options overriding the client defaults.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails, or failed when it was recorded.
+            CassetteMiss: If the request was never recorded.
+        """
+        payload = {"messages": messages, "options": options}
+        if self.cassette.recording:
+            started = time.monotonic()
+            try:
+                response = await self.client.acomplete(messages, on_token=on_token, **options)
+            except LLMError as e:
+                self.cassette.record("llm", self.model, payload, {
+                    "error": str(e), "status": e.status, "retryable": e.retryable
+                }, time.monotonic() - started)
+                raise
+            self.cassette.record("llm", self.model, payload, response, time.monotonic() - started)
+            return response
+        
+        response, latency = self.cassette.lookup("llm", payload)
+        if latency:
+            await asyncio.sleep(latency)
+        if "error" in response:
+            raise LLMError(response["error"], status=response.get("status"), retryable=response.get("retryable", False))
+        if on_token is not None:
+            on_token(response["text"])
+        return dict(response)
+    
+    def complete(self, messages: List[Dict[str, str]], **options) -> Dict[str, Any]:
+        """
+        Request a completion, as `LLMClient.complete` does.
+        
+        Args:
+            messages: Chat messages, each with "role" and "content" keys.
+            **options: Request options overriding the client defaults.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+        """
+        return run_sync(self.acomplete(messages, **options))
+    
+    def close(self) -> None:
+        """Close the real client, if there is one."""
+        if self.client is not None:
+            self.client.close()
+
+class CassetteTool:
+    """
+    Stands in for a tool, recording or replaying its calls.
+    
+    Flags such as `terminal` and `deterministic` are read from the real
+    tool's class, which is imported on first use; the real tool itself is
+    only created when recording. Exceptions the tool raises are recorded
+    as error observations, the same ones ToolAgent would produce.
+    """
+    
+    is_async = True
+    
+    def __init__(self, name: str, cassette: Cassette, spec: Any):
+        """
+        Initialize a CassetteTool instance.
+        
+        Args:
+            name: The name of the tool.
+            cassette: The cassette to record into or replay from.
+            spec: How the registry created the tool: a "module:attribute"
+                import path or a factory.
+        """
+        self.name = name
+        self.cassette = cassette
+        self._spec = spec
+        self._tool: Optional[Any] = None
+        self._class: Optional[Any] = None
+    
+    def _tool_class(self) -> Any:
+        """Return the real tool's class, or the real tool for factories."""
+        if self._class is None:
+            if isinstance(self._spec, str):
+                self._class = import_spec(self._spec)
+            else:
+                self._class = self._get_tool()
+        return self._class
+    
+    def _get_tool(self) -> Any:
+        """Return the real tool, creating it on first use."""
+        if self._tool is None:
+            spec = import_spec(self._spec) if isinstance(self._spec, str) else self._spec
+            self._tool = spec()
+        return self._tool
+    
+    def __getattr__(self, name: str) -> Any:
+        """Read flags and the description from the real tool's class."""
+        if name in TOOL_FLAGS or name == "description":
+            return getattr(self._tool_class(), name, "" if name == "description" else False)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    async def _acall(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the real tool the way ToolAgent would."""
+        tool = self._get_tool()
+        try:
+            if getattr(tool, "is_async", False):
+                return await tool.aexecute(**kwargs)
+            if getattr(tool, "blocking", False):
+                return await asyncio.to_thread(tool.execute, **kwargs)
+            return tool.execute(**kwargs)
+        except Exception as e:
+            logger.error("Tool %s failed: %s", self.name, e)
+            return {"status": "error", "error": str(e)}
+    
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        """
+        Run the tool, or replay its recorded result.
+        
+        Raises:
+            CassetteMiss: If the call was never recorded.
+        """
+        payload = {"tool": self.name, "input": kwargs}
+        if self.cassette.recording:
+            started = time.monotonic()
+            observation = await self._acall(kwargs)
+            self.cassette.record("tool", self.name, payload, observation, time.monotonic() - started)
+            return observation
+        
+        observation, latency = self.cassette.lookup("tool", payload)
+        if latency:
+            await asyncio.sleep(latency)
+        return dict(observation)
+    
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        """Run the tool, or replay its recorded result, blocking until done."""
+        return run_sync(self.aexecute(**kwargs))
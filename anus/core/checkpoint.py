@@ -0,0 +1,220 @@
+"""
+Checkpoint module for the ANUS framework.
+
+A CheckpointStore keeps an append-only log of agent runs in SQLite: one row
+per run and one row per completed iteration, holding that iteration's
+thought, action, observation and token count. An agent that checkpoints
+into a store can pick an interrupted run up again from its last completed
+iteration instead of starting over. The steps of finished runs are only
+needed until the run ends, and compaction removes them.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from anus.core.utils.serialization import json_default
+
+class RunStatus:
+    """States of a checkpointed run."""
+    
+    RUNNING = "running"
+    FINISHED = "finished"
+
+class CheckpointStore:
+    """
+    An append-only log of agent runs stored in SQLite.
+    
+    Every COMPACT_EVERY finished runs, the steps of finished runs are
+    deleted, and finished runs older than `keep_finished` seconds are
+    removed altogether. The file can be shared by several processes.
+    """
+    
+    # Number of finished runs between compaction passes
+    COMPACT_EVERY = 32
+    
+    def __init__(self, path: str, keep_finished: Optional[float] = 86400):
+        """
+        Initialize a CheckpointStore instance.
+        
+        Args:
+            path: Path to the SQLite database file.
+            keep_finished: Seconds a finished run's record is kept, or None to
+                keep finished runs forever.
+        """
+        self.path = path
+        self.keep_finished = keep_finished
+        self._lock = threading.Lock()
+        self._finished = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, agent TEXT, task TEXT NOT NULL, status TEXT NOT NULL, "
+            "result TEXT, created REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS steps ("
+            "run_id TEXT NOT NULL, iteration INTEGER NOT NULL, data TEXT NOT NULL, "
+            "PRIMARY KEY (run_id, iteration))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS runs_status ON runs (status, updated)")
+    
+    def begin_run(self, run_id: str, agent: Optional[str], task: str) -> List[Dict[str, Any]]:
+        """
+        Start logging a run, or continue logging an interrupted one.
+        
+        Args:
+            run_id: Id of the run.
+            agent: Name of the agent executing it.
+            task: The task of the run.
+            
+        Returns:
+            The steps already logged for the run, oldest first; empty for a
+            new run.
+            
+        Raises:
+            ValueError: If the run has already finished.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT INTO runs (run_id, agent, task, status, created, updated) VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_id, agent, task, RunStatus.RUNNING, now, now)
+                )
+                return []
+            if row[0] == RunStatus.FINISHED:
+                raise ValueError(f"Run {run_id} has already finished")
+            rows = self._conn.execute(
+                "SELECT data FROM steps WHERE run_id = ? ORDER BY iteration", (run_id,)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+    
+    def append_step(self, run_id: str, iteration: int, step: Dict[str, Any]) -> None:
+        """
+        Log a completed iteration.
+        
+        Args:
+            run_id: Id of the run.
+            iteration: The zero-based iteration number.
+            step: A JSON-serializable record of the iteration.
+        """
+        data = json.dumps(step, default=json_default)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO steps (run_id, iteration, data) VALUES (?, ?, ?)",
+                (run_id, iteration, data)
+            )
+    
+    def finish_run(self, run_id: str, result: Dict[str, Any]) -> None:
+        """
+        Mark a run as finished, compacting the log every COMPACT_EVERY runs.
+        
+        Args:
+            run_id: Id of the run.
+            result: A JSON-serializable summary of the result.
+        """
+        now = time.time()
+        data = json.dumps(result, default=json_default)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, result = ?, updated = ? WHERE run_id = ?",
+                (RunStatus.FINISHED, data, now, run_id)
+            )
+            self._finished += 1
+            if self._finished % self.COMPACT_EVERY == 0:
+                self._compact(now)
+    
+    def _compact(self, now: float) -> None:
+        """
+        Remove the steps of finished runs and expired finished runs.
+        
+        Args:
+            now: The current time.
+        """
+        self._conn.execute(
+            "DELETE FROM steps WHERE run_id IN (SELECT run_id FROM runs WHERE status = ?)",
+            (RunStatus.FINISHED,)
+        )
+        if self.keep_finished is not None:
+            self._conn.execute(
+                "DELETE FROM runs WHERE status = ? AND updated <= ?",
+                (RunStatus.FINISHED, now - self.keep_finished)
+            )
+    
+    def compact(self) -> None:
+        """Remove the steps of finished runs and expired finished runs now."""
+        with self._lock:
+            self._compact(time.time())
+    
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a run.
+        
+        Args:
+            run_id: Id of the run.
+            
+        Returns:
+            A dictionary with the "run_id", "agent", "task", "status",
+            "result" (None while running), "steps" logged so far and
+            "updated" time of the run, or None if the run is unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT agent, task, status, result, updated FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            steps = self._conn.execute("SELECT COUNT(*) FROM steps WHERE run_id = ?", (run_id,)).fetchone()[0]
+        agent, task, status, result, updated = row
+        return {
+            "run_id": run_id,
+            "agent": agent,
+            "task": task,
+            "status": status,
+            "result": json.loads(result) if result is not None else None,
+            "steps": steps,
+            "updated": updated
+        }
+    
+    def unfinished_runs(self) -> List[Dict[str, Any]]:
+        """
+        List the runs that were interrupted or are still running.
+        
+        Returns:
+            Dictionaries as returned by `get_run`, oldest first.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.run_id, r.agent, r.task, r.updated, COUNT(s.iteration) FROM runs r "
+                "LEFT JOIN steps s ON s.run_id = r.run_id WHERE r.status = ? "
+                "GROUP BY r.run_id ORDER BY r.updated",
+                (RunStatus.RUNNING,)
+            ).fetchall()
+        return [
+            {
+                "run_id": run_id,
+                "agent": agent,
+                "task": task,
+                "status": RunStatus.RUNNING,
+                "result": None,
+                "steps": steps,
+                "updated": updated
+            }
+            for run_id, agent, task, updated, steps in rows
+        ]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,339 @@
+"""
+Configuration module for the ANUS framework.
+
+`load_config` reads a YAML config file into an immutable Config, expanding
+"${NAME}" and "${NAME:-default}" references to environment variables and
+checking the settings the framework reads. Each file is parsed once per
+change: later loads of an unchanged file return the same Config, as long as
+the environment variables it references are unchanged too.
+
+ConfigWatcher polls a config file and reports each new valid version, which
+is what lets the orchestrator apply edits without a restart.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# "${NAME}" or "${NAME:-default}"
+_ENV_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}")
+
+AGENT_MODES = ("single", "multi", "auto")
+CACHE_BACKENDS = ("memory", "sqlite")
+
+class CassetteMode:
+    """Ways a cassette can be used."""
+    
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+    
+    ALL = (OFF, RECORD, REPLAY)
+
+class ReplayLatency:
+    """How long replayed calls take."""
+    
+    # Wait as long as the call took when it was recorded
+    RECORDED = "recorded"
+    # Answer at once
+    NONE = "none"
+    
+    ALL = (RECORDED, NONE)
+
+# Parsed configs by absolute path, with the file state and the referenced
+# environment variables they were parsed from
+_loaded: Dict[str, Tuple[Tuple[int, int], Tuple[Tuple[str, Optional[str]], ...], "Config"]] = {}
+_loaded_lock = threading.Lock()
+
+class ConfigError(ValueError):
+    """Raised when a config file holds invalid settings."""
+
+class Config(dict):
+    """
+    A read-only dictionary of settings.
+    
+    Nested sections are Configs too and lists become tuples, so a Config can
+    be shared between threads and kept by in-flight tasks while a newer one
+    replaces it. Being a dict, it works anywhere a config section did.
+    """
+    
+    def _readonly(self, *args, **kwargs):
+        """Reject any change to the config."""
+        raise TypeError("Config is read-only")
+    
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = __ior__ = _readonly
+    
+    def __copy__(self) -> "Config":
+        """Return the config itself, since it cannot change."""
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Config":
+        """Return the config itself, since it cannot change."""
+        return self
+    
+    def __reduce__(self):
+        """Pickle the config as its items, which unpickling cannot set one by one."""
+        return (Config, (dict(self),))
+
+def _expand(value: str) -> Any:
+    """
+    Expand the environment variable references in a string.
+    
+    A string that is a single reference takes the YAML type of the value,
+    so `max_iterations: ${MAX_ITERATIONS}` gives an integer. References to
+    unset variables without a default are left as they are.
+    
+    Args:
+        value: The string to expand.
+        
+    Returns:
+        The expanded value.
+    """
+    def replace(match: "re.Match[str]") -> str:
+        name, default = match.group(1), match.group(2)
+        return os.environ.get(name, match.group(0) if default is None else default)
+    
+    expanded = _ENV_PATTERN.sub(replace, value)
+    if expanded != value and _ENV_PATTERN.fullmatch(value):
+        try:
+            parsed = yaml.safe_load(expanded)
+        except yaml.YAMLError:
+            return expanded
+        if isinstance(parsed, (int, float, bool)) or parsed is None:
+            return parsed
+    return expanded
+
+def freeze(value: Any) -> Any:
+    """
+    Convert parsed YAML into its immutable equivalent, expanding
+    environment variable references in strings.
+    
+    Args:
+        value: A value parsed from YAML.
+        
+    Returns:
+        The value with dictionaries turned into Configs and lists into tuples.
+    """
+    if isinstance(value, dict):
+        return Config((str(k), freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, str):
+        return _expand(value)
+    return value
+
+def _check(condition: bool, message: str) -> None:
+    """Raise a ConfigError with the message unless the condition holds."""
+    if not condition:
+        raise ConfigError(message)
+
+def _is_positive_int(value: Any) -> bool:
+    """Return True for positive integers, which bools are not."""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+def validate_config(config: Dict[str, Any]) -> None:
+    """
+    Check the settings the framework reads from a config.
+    
+    Unknown keys are allowed; only known settings with the wrong type or an
+    unsupported value are rejected.
+    
+    Args:
+        config: The config to check.
+        
+    Raises:
+        ConfigError: Describing the first invalid setting.
+    """
+    from anus.core.agent.context_window import CompactionStrategy
+    from anus.core.agent.trace import TraceLevel
+    
+    for section in ("model", "agent", "tools", "cache", "checkpoints", "cassette", "logging", "reload"):
+        _check(isinstance(config.get(section, {}), dict), f"'{section}' must be a mapping")
+    
+    agent = config.get("agent", {})
+    _check(agent.get("mode", "auto") in AGENT_MODES, f"agent.mode must be one of {', '.join(AGENT_MODES)}")
+    _check(_is_positive_int(agent.get("max_iterations", 10)), "agent.max_iterations must be a positive integer")
+    for key in ("max_time", "max_tokens", "context_max_tokens", "role_timeout"):
+        value = agent.get(key)
+        _check(
+            value is None or (isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0),
+            f"agent.{key} must be a positive number"
+        )
+    capacity = agent.get("memory_capacity", 0)
+    _check(capacity == 0 or _is_positive_int(capacity), "agent.memory_capacity must be a non-negative integer")
+    _check(_is_positive_int(agent.get("memory_top_k", 3)), "agent.memory_top_k must be a positive integer")
+    workers = agent.get("max_workers")
+    _check(workers is None or _is_positive_int(workers), "agent.max_workers must be a positive integer")
+    _check(
+        agent.get("trace_level", TraceLevel.FULL) in TraceLevel.ALL,
+        f"agent.trace_level must be one of {', '.join(TraceLevel.ALL)}"
+    )
+    _check(
+        agent.get("context_strategy", CompactionStrategy.TRUNCATE) in CompactionStrategy.ALL,
+        f"agent.context_strategy must be one of {', '.join(CompactionStrategy.ALL)}"
+    )
+    
+    enabled = config.get("tools", {}).get("enabled", ())
+    _check(
+        isinstance(enabled, (list, tuple)) and all(isinstance(name, str) for name in enabled),
+        "tools.enabled must be a list of tool names"
+    )
+    
+    sandbox = config.get("tools", {}).get("sandbox", {})
+    _check(isinstance(sandbox, dict), "tools.sandbox must be a mapping")
+    _check(_is_positive_int(sandbox.get("workers", 2)), "tools.sandbox.workers must be a positive integer")
+    
+    backend = config.get("cache", {}).get("backend", "memory")
+    _check(backend in CACHE_BACKENDS, f"cache.backend must be one of {', '.join(CACHE_BACKENDS)}")
+    
+    cassette = config.get("cassette", {})
+    _check(
+        cassette.get("mode", CassetteMode.OFF) in CassetteMode.ALL,
+        f"cassette.mode must be one of {', '.join(CassetteMode.ALL)}"
+    )
+    _check(
+        cassette.get("latency", ReplayLatency.RECORDED) in ReplayLatency.ALL,
+        f"cassette.latency must be one of {', '.join(ReplayLatency.ALL)}"
+    )
+    
+    interval = config.get("reload", {}).get("interval", 2.0)
+    _check(
+        isinstance(interval, (int, float)) and not isinstance(interval, bool) and interval > 0,
+        "reload.interval must be a positive number"
+    )
+
+def _file_state(path: str) -> Tuple[int, int]:
+    """Return the modification time and size of a file."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def _environment(names: Sequence[str]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Read environment variables.
+    
+    Args:
+        names: The variables to read.
+        
+    Returns:
+        (name, value) pairs, with None for unset variables.
+    """
+    return tuple((name, os.environ.get(name)) for name in names)
+
+def load_config(path: str) -> Config:
+    """
+    Load and check a config file.
+    
+    Args:
+        path: Path to the YAML config file.
+        
+    Returns:
+        The immutable config; the same object as the previous call for the
+        same path if neither the file nor the environment variables it
+        references have changed since.
+        
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the file is not valid YAML.
+        ConfigError: If the file holds invalid settings.
+    """
+    path = os.path.abspath(path)
+    state = _file_state(path)
+    with _loaded_lock:
+        entry = _loaded.get(path)
+    if entry is not None and entry[0] == state and entry[1] == _environment([name for name, _ in entry[1]]):
+        return entry[2]
+    
+    with open(path, "r") as f:
+        text = f.read()
+    raw = yaml.safe_load(text)
+    # Read before expanding, so a change made meanwhile invalidates the entry
+    environment = _environment(sorted({match.group(1) for match in _ENV_PATTERN.finditer(text)}))
+    if raw is None:
+        raw = {}
+    _check(isinstance(raw, dict), f"{path} must hold a mapping of settings")
+    config = freeze(raw)
+    validate_config(config)
+    with _loaded_lock:
+        _loaded[path] = (state, environment, config)
+    return config
+
+class ConfigWatcher:
+    """
+    Polls a config file and reports each new valid version of it.
+    
+    Polling the modification time keeps the watcher dependency-free and
+    costs one `stat` per interval. Versions that fail to load are logged
+    and skipped, so a half-saved or invalid edit never replaces a working
+    config.
+    """
+    
+    def __init__(self, path: str, on_change: Callable[[Config], None], interval: float = 2.0):
+        """
+        Initialize a ConfigWatcher instance.
+        
+        Args:
+            path: Path to the config file.
+            on_change: Called with each new config, on the watcher thread.
+            interval: Seconds between checks.
+        """
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._state = self._current_state()
+    
+    def _current_state(self) -> Optional[Tuple[int, int]]:
+        """Return the file's modification time and size, or None if it is missing."""
+        try:
+            return _file_state(self.path)
+        except OSError:
+            return None
+    
+    def start(self) -> None:
+        """Start watching the file on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="anus-config-watcher", daemon=True)
+            self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop watching the file."""
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+    
+    def check(self) -> bool:
+        """
+        Check the file once and report a new version.
+        
+        Returns:
+            True if a new config was loaded and reported.
+        """
+        state = self._current_state()
+        if state is None or state == self._state:
+            return False
+        self._state = state
+        try:
+            config = load_config(self.path)
+        except Exception as e:
+            logger.error("Ignoring changed config %s: %s", self.path, e)
+            return False
+        try:
+            self.on_change(config)
+        except Exception as e:
+            logger.error("Failed to apply changed config %s: %s", self.path, e)
+            return False
+        return True
+    
+    def _run(self) -> None:
+        """Poll the file until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.check()
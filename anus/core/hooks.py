@@ -0,0 +1,100 @@
+"""
+Hooks module for the ANUS framework.
+
+Hooks are objects with any of the methods named in HOOK_EVENTS. Agents and
+the orchestrator call them at the points of a run those names describe,
+each with a single event dictionary. Every event carries the "agent" it
+comes from and a monotonic "timestamp" from `time.monotonic()`; events that
+close a span also carry its "duration" in seconds.
+
+- on_task_start: "task"
+- on_iteration: "task", "iteration", "duration"
+- on_tool_call: "tool", "status", "cached", "deterministic", "duration"
+- on_llm_call: "status", "tokens", "duration"
+- on_task_end: "task", "status", "stop_reason", "iterations", "duration",
+  and for the orchestrator also "coalesced" and "cached" (None when no
+  result cache is configured)
+
+When no hooks are registered, the instrumented code skips building events
+entirely, so the only cost is a truth test per call site.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = ("on_task_start", "on_iteration", "on_tool_call", "on_llm_call", "on_task_end")
+
+class HookRegistry:
+    """
+    The hooks registered on an agent or orchestrator.
+    
+    The registry is falsy while empty. Registering and removing hooks is
+    thread-safe and never disturbs events being delivered concurrently.
+    """
+    
+    __slots__ = ("_callbacks", "_hooks", "_lock")
+    
+    def __init__(self):
+        """Initialize a HookRegistry instance."""
+        self._callbacks: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._hooks: List[Any] = []
+        self._lock = threading.Lock()
+    
+    def __bool__(self) -> bool:
+        """Return True if any hook is registered."""
+        return bool(self._hooks)
+    
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the registered hooks."""
+        return iter(self._hooks)
+    
+    def _rebuild(self, hooks: List[Any]) -> None:
+        """Replace the callback table; the lock must be held."""
+        callbacks: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        for hook in hooks:
+            for name in HOOK_EVENTS:
+                callback = getattr(hook, name, None)
+                if callable(callback):
+                    callbacks.setdefault(name, []).append(callback)
+        self._callbacks = callbacks
+        self._hooks = hooks
+    
+    def add(self, hook: Any) -> None:
+        """
+        Register a hook.
+        
+        Args:
+            hook: An object with any of the HOOK_EVENTS methods.
+        """
+        with self._lock:
+            if hook not in self._hooks:
+                self._rebuild(self._hooks + [hook])
+    
+    def remove(self, hook: Any) -> None:
+        """
+        Unregister a hook.
+        
+        Args:
+            hook: A previously registered hook.
+        """
+        with self._lock:
+            self._rebuild([h for h in self._hooks if h is not hook])
+    
+    def emit(self, name: str, event: Dict[str, Any]) -> None:
+        """
+        Deliver an event to every hook implementing `name`.
+        
+        A failing hook is logged and never interrupts the run.
+        
+        Args:
+            name: One of HOOK_EVENTS.
+            event: The event dictionary.
+        """
+        for callback in self._callbacks.get(name, ()):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error("Hook %s failed: %s", name, e)
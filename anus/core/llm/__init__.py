@@ -0,0 +1,50 @@
+"""
+LLM client layer for the ANUS framework.
+
+This package contains the model clients agents use for reasoning steps:
+- LLMClient: Abstract base class with retries, concurrency limits and
+  optional request coalescing
+- OpenAIClient: Client for OpenAI-compatible chat completion endpoints
+- ConnectionPool: Keep-alive HTTP connection pool shared by a client
+- get_client: Shared client for a `model` config section
+- release_client: Give back a shared client, closing it after the last user
+
+The names are imported lazily on first attribute access (PEP 562).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from anus.core.llm.base import LLMClient, LLMError
+    from anus.core.llm.openai_client import OpenAIClient
+    from anus.core.llm.pool import ConnectionPool
+    from anus.core.llm.providers import create_client, get_client, release_client
+
+_LAZY_ATTRIBUTES = {
+    "LLMClient": "anus.core.llm.base",
+    "LLMError": "anus.core.llm.base",
+    "OpenAIClient": "anus.core.llm.openai_client",
+    "ConnectionPool": "anus.core.llm.pool",
+    "create_client": "anus.core.llm.providers",
+    "get_client": "anus.core.llm.providers",
+    "release_client": "anus.core.llm.providers",
+}
+
+__all__ = [
+    "LLMClient", "LLMError", "OpenAIClient", "ConnectionPool", "create_client", "get_client",
+    "release_client"
+]
+
+def __getattr__(name: str) -> Any:
+    """Import a client class or helper on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List the lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
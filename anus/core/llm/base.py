@@ -0,0 +1,254 @@
+"""
+Base module for the LLM clients used by ANUS agents.
+
+A client turns a list of chat messages into a completion. Requests run on a
+small pool of worker threads owned by the client, which caps how many are
+in flight at once and lets a single client be shared by every agent and
+every event loop in the process. Failed requests that are worth repeating,
+such as rate limits, server errors and dropped connections, are retried
+with exponential backoff.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from anus.core.utils.async_utils import run_sync
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes that are worth retrying
+RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+class LLMError(Exception):
+    """
+    Raised when a model request fails.
+    
+    Attributes:
+        status: The HTTP status of the failed response, if there was one.
+        retryable: Whether repeating the request may succeed.
+        retry_after: Seconds the server asked us to wait, if it said so.
+    """
+    
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        retryable: bool = False,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+class LLMClient(ABC):
+    """
+    Abstract base class for model clients.
+    
+    Subclasses implement `_send`, which performs a single blocking request.
+    Clients that can stream tokens override `_send_stream`.
+    """
+    
+    def __init__(
+        self,
+        model: str,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        coalesce_size: Optional[int] = None,
+        coalesce_wait: float = 0.005,
+        **defaults
+    ):
+        """
+        Initialize an LLMClient instance.
+        
+        Args:
+            model: The model name sent with each request.
+            max_concurrency: Maximum number of requests in flight at once.
+            max_retries: How many times a retryable failure is repeated.
+            backoff: Delay before the first retry in seconds; it doubles on
+                every further attempt.
+            max_backoff: Upper bound on a single retry delay in seconds.
+            coalesce_size: Enable coalescing of concurrent requests, grouping
+                at most this many and sending identical ones once. None
+                disables coalescing.
+            coalesce_wait: How long a group waits for more requests, in seconds.
+            **defaults: Default request options, e.g. temperature.
+        """
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.defaults = defaults
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="anus-llm")
+        self._coalescer = None
+        if coalesce_size:
+            from anus.core.llm.coalescing import RequestCoalescer
+            self._coalescer = RequestCoalescer(self, max_size=coalesce_size, max_wait=coalesce_wait)
+    
+    @abstractmethod
+    def _send(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform one blocking model request.
+        
+        Args:
+            request: A request with "messages" and any request options.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails.
+        """
+        pass
+    
+    def _send_stream(self, request: Dict[str, Any], on_token: Callable[[str], None]) -> Dict[str, Any]:
+        """
+        Perform one blocking model request, reporting tokens as they arrive.
+        
+        The default implementation reports the whole text as one token.
+        
+        Args:
+            request: A request with "messages" and any request options.
+            on_token: Called from a worker thread with each piece of text.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails.
+        """
+        response = self._send(request)
+        on_token(response["text"])
+        return response
+    
+    def _build_request(self, messages: List[Dict[str, str]], options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Combine messages with the default and per-call options.
+        
+        Args:
+            messages: The chat messages.
+            options: Per-call request options.
+            
+        Returns:
+            The request dictionary.
+        """
+        request = dict(self.defaults)
+        request.update(options)
+        request["messages"] = messages
+        return request
+    
+    def _delay(self, attempt: int, error: LLMError) -> float:
+        """
+        Compute how long to wait before retrying.
+        
+        Args:
+            attempt: The number of the attempt that failed, starting at 0.
+            error: The failure.
+            
+        Returns:
+            The delay in seconds, with jitter.
+        """
+        if error.retry_after is not None:
+            return min(error.retry_after, self.max_backoff)
+        delay = min(self.backoff * (2 ** attempt), self.max_backoff)
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    def _with_retries(self, send, payload):
+        """
+        Call a blocking send function, retrying retryable failures.
+        
+        Args:
+            send: `_send`, or a function streaming a request.
+            payload: The request to pass to it.
+            
+        Returns:
+            The result of the first successful call.
+            
+        Raises:
+            LLMError: If the last attempt fails or the failure is not retryable.
+        """
+        attempt = 0
+        while True:
+            try:
+                return send(payload)
+            except LLMError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+                delay = self._delay(attempt, e)
+                logger.warning("LLM request failed (%s); retrying in %.2fs", e, delay)
+                time.sleep(delay)
+                attempt += 1
+    
+    def submit(self, request: Dict[str, Any], on_token: Optional[Callable[[str], None]] = None) -> Future:
+        """
+        Schedule a request on the client's worker threads.
+        
+        Args:
+            request: The request to send.
+            on_token: Optional callback to stream the response text to.
+                Streamed requests are never coalesced.
+            
+        Returns:
+            A future resolving to the response.
+        """
+        if on_token is not None:
+            return self._executor.submit(self._with_retries, lambda r: self._send_stream(r, on_token), request)
+        if self._coalescer is not None:
+            return self._coalescer.submit(request)
+        return self._executor.submit(self._with_retries, self._send, request)
+    
+    async def acomplete(
+        self,
+        messages: List[Dict[str, str]],
+        on_token: Optional[Callable[[str], None]] = None,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Request a completion asynchronously.
+        
+        Args:
+            messages: Chat messages, each with "role" and "content" keys.
+            on_token: Optional callback receiving the text as it streams in,
+                called from a worker thread.
+            **options: Request options overriding the client defaults.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails.
+        """
+        return await asyncio.wrap_future(self.submit(self._build_request(messages, options), on_token))
+    
+    def complete(self, messages: List[Dict[str, str]], **options) -> Dict[str, Any]:
+        """
+        Request a completion.
+        
+        Args:
+            messages: Chat messages, each with "role" and "content" keys.
+            **options: Request options overriding the client defaults.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails.
+        """
+        return run_sync(self.acomplete(messages, **options))
+    
+    def close(self) -> None:
+        """
+        Stop the worker threads and release any open connections.
+        
+        Requests already running finish in the background; subclasses close
+        the connections they use once they are done.
+        """
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,110 @@
+"""
+Coalescing of concurrent LLM requests.
+
+Requests submitted within a short window are grouped. Identical requests
+in a group are sent once and share the response; distinct requests are
+still sent one by one.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
+
+from anus.core.cache import make_key
+
+class RequestCoalescer:
+    """
+    Groups requests for an LLMClient.
+    
+    A group is flushed when it reaches `max_size` requests or `max_wait`
+    seconds after its first request, whichever comes first.
+    """
+    
+    def __init__(self, client, max_size: int = 8, max_wait: float = 0.005):
+        """
+        Initialize a RequestCoalescer instance.
+        
+        Args:
+            client: The LLMClient that sends the requests.
+            max_size: Maximum number of requests in a group.
+            max_wait: Maximum time a request waits for its group, in seconds.
+        """
+        self.client = client
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: List[Tuple[Dict[str, Any], Future]] = []
+        self._timer = None
+        self._lock = threading.Lock()
+    
+    def submit(self, request: Dict[str, Any]) -> Future:
+        """
+        Add a request to the current group.
+        
+        Args:
+            request: The request to send.
+            
+        Returns:
+            A future resolving to the response.
+        """
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((request, future))
+            if len(self._pending) >= self.max_size:
+                group = self._take()
+            else:
+                group = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.max_wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if group:
+            self._dispatch(group)
+        return future
+    
+    def _take(self) -> List[Tuple[Dict[str, Any], Future]]:
+        """Remove and return the current group. The lock must be held."""
+        group, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return group
+    
+    def flush(self) -> None:
+        """Send the current group now."""
+        with self._lock:
+            group = self._take()
+        if group:
+            self._dispatch(group)
+    
+    def _dispatch(self, group: List[Tuple[Dict[str, Any], Future]]) -> None:
+        """
+        Send a group of requests on the client's worker threads.
+        
+        Args:
+            group: The requests and the futures waiting for them.
+        """
+        # Identical requests are sent once
+        futures: Dict[Any, List[Future]] = {}
+        requests: Dict[Any, Dict[str, Any]] = {}
+        for request, future in group:
+            if future.set_running_or_notify_cancel():
+                key = make_key(request)
+                futures.setdefault(key, []).append(future)
+                requests.setdefault(key, request)
+        if not futures:
+            return
+        
+        client = self.client
+        for key, request in requests.items():
+            job = client._executor.submit(client._with_retries, client._send, request)
+            job.add_done_callback(lambda done, waiting=futures[key]: self._resolve(done, waiting))
+    
+    @staticmethod
+    def _resolve(done: Future, waiting: List[Future]) -> None:
+        """Pass the outcome of one sent request to every future waiting for it."""
+        error = done.exception()
+        for future in waiting:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(dict(done.result()))
@@ -0,0 +1,173 @@
+"""
+OpenAI-compatible chat completions client.
+
+Works with the OpenAI API and with any server that implements the same
+`/chat/completions` endpoint, such as a local stub used in tests.
+"""
+
+import http.client
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from anus.core.llm.base import RETRYABLE_STATUSES, LLMClient, LLMError
+from anus.core.llm.pool import ConnectionPool
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+class OpenAIClient(LLMClient):
+    """
+    A client for OpenAI-compatible chat completion endpoints.
+    
+    Requests share a pool of keep-alive connections sized to the client's
+    concurrency limit.
+    """
+    
+    def __init__(
+        self,
+        model: str = "gpt-4",
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = 60.0,
+        max_concurrency: int = 8,
+        **kwargs
+    ):
+        """
+        Initialize an OpenAIClient instance.
+        
+        Args:
+            model: The model name, e.g. "gpt-4".
+            api_key: The API key sent as a bearer token, if any.
+            base_url: The API base URL.
+            timeout: Socket timeout per request in seconds.
+            max_concurrency: Maximum number of requests in flight at once.
+            **kwargs: Additional LLMClient options and request defaults.
+        """
+        super().__init__(model, max_concurrency=max_concurrency, **kwargs)
+        self.api_key = api_key
+        self.pool = ConnectionPool(base_url, maxsize=max_concurrency, timeout=timeout)
+    
+    def _post(
+        self,
+        payload: Dict[str, Any],
+        on_line: Optional[Callable[[bytes], None]] = None
+    ) -> Tuple[Dict[str, str], bytes]:
+        """
+        POST a chat completion payload.
+        
+        Args:
+            payload: The JSON payload.
+            on_line: Optional callback for streaming the response body.
+            
+        Returns:
+            A tuple of (response headers, response body).
+            
+        Raises:
+            LLMError: If the request fails.
+        """
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        try:
+            status, response_headers, data = self.pool.request(
+                "POST", "/chat/completions", json.dumps(payload).encode("utf-8"), headers, on_line
+            )
+        except LLMError:
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            raise LLMError(f"Connection to model API failed: {e}", retryable=True)
+        
+        if status != 200:
+            retry_after = response_headers.get("retry-after")
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_after = None
+            raise LLMError(
+                f"Model API returned HTTP {status}: {data[:200].decode('utf-8', 'replace')}",
+                status=status,
+                retryable=status in RETRYABLE_STATUSES,
+                retry_after=retry_after
+            )
+        return response_headers, data
+    
+    def _send(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one chat completion request.
+        
+        Args:
+            request: A request with "messages" and any request options.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails.
+        """
+        payload = dict(request)
+        payload.setdefault("model", self.model)
+        _, data = self._post(payload)
+        try:
+            body = json.loads(data)
+            text = body["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise LLMError(f"Malformed model API response: {e}")
+        return {"text": text, "model": body.get("model", payload["model"]), "usage": body.get("usage", {})}
+    
+    def _send_stream(self, request: Dict[str, Any], on_token: Callable[[str], None]) -> Dict[str, Any]:
+        """
+        Send one chat completion request, streaming the reply.
+        
+        Args:
+            request: A request with "messages" and any request options.
+            on_token: Called with each piece of text as it arrives.
+            
+        Returns:
+            A response with "text", "model" and "usage" keys.
+            
+        Raises:
+            LLMError: If the request fails. Failures after text has been
+                streamed are not retried, so no text is reported twice.
+        """
+        payload = dict(request)
+        payload.setdefault("model", self.model)
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+        parts: List[str] = []
+        response = {"text": "", "model": payload["model"], "usage": {}}
+        
+        def on_line(line: bytes) -> None:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                return
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                return
+            try:
+                chunk = json.loads(data)
+            except ValueError as e:
+                raise LLMError(f"Malformed model API stream: {e}")
+            response["model"] = chunk.get("model", response["model"])
+            if chunk.get("usage"):
+                response["usage"] = chunk["usage"]
+            for choice in chunk.get("choices") or []:
+                text = (choice.get("delta") or {}).get("content")
+                if text:
+                    parts.append(text)
+                    on_token(text)
+        
+        try:
+            self._post(payload, on_line)
+        except LLMError as e:
+            if parts:
+                e.retryable = False
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            raise LLMError(f"Model API stream failed: {e}", retryable=not parts)
+        response["text"] = "".join(parts)
+        return response
+    
+    def close(self) -> None:
+        """Stop the worker threads and close the pooled connections."""
+        super().close()
+        self.pool.close()
@@ -0,0 +1,162 @@
+"""
+HTTP connection pool used by the LLM clients.
+
+Connections are kept alive and reused between requests, so the TCP and TLS
+handshakes are paid once per connection rather than once per model call.
+"""
+
+import http.client
+import queue
+import ssl
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Errors raised when a kept-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+_ssl_context: Optional[ssl.SSLContext] = None
+_ssl_lock = threading.Lock()
+
+def _default_ssl_context() -> ssl.SSLContext:
+    """Return the TLS context shared by every pool, creating it on first use."""
+    global _ssl_context
+    with _ssl_lock:
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return _ssl_context
+
+class ConnectionPool:
+    """
+    A thread-safe pool of keep-alive connections to a single host.
+    
+    At most `maxsize` idle connections are kept; extra connections created
+    under load are closed when they are returned. Once the pool is closed,
+    connections returned by requests still in flight are closed too.
+    """
+    
+    def __init__(self, base_url: str, maxsize: int = 8, timeout: float = 60.0):
+        """
+        Initialize a ConnectionPool instance.
+        
+        Args:
+            base_url: Scheme, host, optional port and path prefix, e.g.
+                "https://api.openai.com/v1".
+            maxsize: Maximum number of idle connections to keep.
+            timeout: Socket timeout in seconds.
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(maxsize)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.created = 0
+    
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Open a new connection to the pool's host."""
+        self.created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=_default_ssl_context()
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+    
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full or closed."""
+        with self._lock:
+            if not self._closed:
+                try:
+                    self._idle.put_nowait(conn)
+                    return
+                except queue.Full:
+                    pass
+        conn.close()
+    
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        on_line: Optional[Callable[[bytes], None]] = None
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send a request and read the whole response.
+        
+        With `on_line`, a successful response body is passed to it line by
+        line as it arrives instead of being returned, e.g. for server-sent
+        events. A request that fails on a reused connection because the server had
+        already closed it is repeated once on a fresh connection.
+        
+        Args:
+            method: The HTTP method.
+            path: The path, relative to the base URL's path prefix.
+            body: Optional request body.
+            headers: Optional request headers.
+            on_line: Optional callback for streaming a successful response.
+            
+        Returns:
+            A tuple of (status, response headers, response body); the body
+            is empty when it was streamed to `on_line`.
+            
+        Raises:
+            OSError: If the connection fails.
+            http.client.HTTPException: If the response is malformed.
+        """
+        headers = dict(headers or {})
+        headers.setdefault("Connection", "keep-alive")
+        try:
+            conn = self._idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            conn = self._new_connection()
+            reused = False
+        
+        while True:
+            try:
+                conn.request(method, self.prefix + path, body=body, headers=headers)
+                response = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                conn = self._new_connection()
+                reused = False
+                continue
+            except BaseException:
+                conn.close()
+                raise
+            break
+        
+        try:
+            if on_line is not None and response.status == 200:
+                data = b""
+                for line in iter(response.readline, b""):
+                    on_line(line)
+            else:
+                data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return response.status, {k.lower(): v for k, v in response.getheaders()}, data
+    
+    def close(self) -> None:
+        """Close every idle connection, and every busy one once it is returned."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
@@ -0,0 +1,109 @@
+"""
+Provider lookup for the LLM clients.
+
+`create_client` builds a client from the `model` section of the config.
+`get_client` returns a client shared by every caller with the same
+settings, so all agents in a process reuse one connection pool. Callers
+hand the client back with `release_client`; the last release closes it.
+"""
+
+import importlib
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from anus.core.cache import make_key
+from anus.core.llm.base import LLMClient
+
+# Providers shipped with ANUS, as "module:attribute" import paths
+PROVIDERS = {
+    "openai": "anus.core.llm.openai_client:OpenAIClient",
+}
+
+# Keys of the model config section that map to client options
+_CLIENT_OPTIONS = (
+    "api_key", "base_url", "timeout", "max_concurrency", "max_retries",
+    "backoff", "max_backoff", "coalesce_size", "coalesce_wait", "temperature", "max_tokens"
+)
+
+# Shared clients by config key, with how many callers hold each one
+_clients: Dict[Any, LLMClient] = {}
+_references: Dict[Any, int] = {}
+_clients_lock = threading.Lock()
+
+def create_client(model_config: Dict[str, Any]) -> LLMClient:
+    """
+    Create a client from a model config section.
+    
+    Args:
+        model_config: The `model` section of the config, with at least a
+            "provider" and a "name". String values may reference environment
+            variables as "${NAME}".
+            
+    Returns:
+        A new LLMClient.
+        
+    Raises:
+        ValueError: If the provider is unknown.
+    """
+    provider = model_config.get("provider", "openai")
+    spec = PROVIDERS.get(provider)
+    if spec is None:
+        raise ValueError(f"Unknown model provider: {provider}")
+    module_name, _, attribute = spec.partition(":")
+    cls = getattr(importlib.import_module(module_name), attribute)
+    
+    options = {}
+    for key in _CLIENT_OPTIONS:
+        value = model_config.get(key)
+        if isinstance(value, str):
+            value = os.path.expandvars(value)
+            if value.startswith("${"):
+                # Unset environment variable
+                value = None
+        if value is not None:
+            options[key] = value
+    return cls(model=model_config.get("name", "gpt-4"), **options)
+
+def get_client(model_config: Dict[str, Any]) -> LLMClient:
+    """
+    Return the shared client for a model config section.
+    
+    Every call takes a reference to the client, which the caller gives
+    back with `release_client` when it no longer needs it.
+    
+    Args:
+        model_config: The `model` section of the config.
+        
+    Returns:
+        A client shared with every other caller using the same settings.
+    """
+    key = make_key(model_config)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = create_client(model_config)
+        _references[key] = _references.get(key, 0) + 1
+        return client
+
+def release_client(client: LLMClient) -> None:
+    """
+    Give back a client returned by `get_client`.
+    
+    The client is closed, with its connections, once every caller that
+    took it has released it. A later `get_client` call creates a new one.
+    
+    Args:
+        client: The shared client.
+    """
+    with _clients_lock:
+        for key, shared in _clients.items():
+            if shared is client:
+                break
+        else:
+            return
+        _references[key] -= 1
+        if _references[key] > 0:
+            return
+        del _clients[key], _references[key]
+    client.close()
@@ -0,0 +1,346 @@
+"""
+Memory module for the ANUS framework.
+
+This module gives agents a memory that outlives a single `execute` call.
+Items are embedded once when they are added and kept in a fixed-size NumPy
+matrix, so adding an item is O(1) and retrieval is a single matrix product
+however many queries are asked together. When the store is full, the least
+recently used item makes room for the new one.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+def _import_numpy():
+    """
+    Import NumPy on first use, so that creating a store at startup does not
+    pay for it.
+    
+    Returns:
+        The numpy module.
+    """
+    import numpy
+    return numpy
+
+class HashingEmbedder:
+    """
+    Embeds text by hashing its words and word pairs into a fixed number of
+    buckets.
+    
+    It needs no model or vocabulary and always maps the same text to the
+    same vector, including across processes, which is what lets a persisted
+    store be reloaded without re-embedding.
+    """
+    
+    def __init__(self, dim: int = 256):
+        """
+        Initialize a HashingEmbedder instance.
+        
+        Args:
+            dim: Number of dimensions of the embeddings.
+        """
+        self.dim = dim
+    
+    def _features(self, text: str) -> List[int]:
+        """
+        Hash the words and adjacent word pairs of a text.
+        
+        Args:
+            text: The text to hash.
+            
+        Returns:
+            One 32-bit hash per feature.
+        """
+        words = _TOKEN_PATTERN.findall(text.lower())
+        features = [zlib.crc32(word.encode("utf-8")) for word in words]
+        features.extend(
+            zlib.crc32(f"{a} {b}".encode("utf-8")) for a, b in zip(words, words[1:])
+        )
+        return features
+    
+    def embed(self, texts: Sequence[str]) -> "np.ndarray":
+        """
+        Embed several texts.
+        
+        Args:
+            texts: The texts to embed.
+            
+        Returns:
+            A float32 array of shape (len(texts), dim) with unit-length rows;
+            texts without words embed to zero vectors.
+        """
+        np = _import_numpy()
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            hashes = np.asarray(self._features(text), dtype=np.uint32)
+            if hashes.size:
+                # The top bit picks the sign so that collisions tend to cancel out
+                signs = np.where(hashes >> 31, -1.0, 1.0).astype(np.float32)
+                np.add.at(vectors[row], hashes % self.dim, signs)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+class MemoryStore:
+    """
+    A capacity-bounded store of past items with similarity search.
+    
+    With a `path`, the embeddings live in a memory-mapped file and the items
+    in an append-only log next to it, so a restarted process loads the store
+    without re-embedding anything. The matrix is created, or the files are
+    opened, when the store is first used.
+    """
+    
+    VECTORS_FILE = "vectors.npy"
+    ITEMS_FILE = "items.jsonl"
+    
+    def __init__(
+        self,
+        capacity: int = 2000,
+        embedder: Optional[HashingEmbedder] = None,
+        path: Optional[str] = None
+    ):
+        """
+        Initialize a MemoryStore instance.
+        
+        Args:
+            capacity: Maximum number of items kept.
+            embedder: Embedder for items and queries. Defaults to a
+                HashingEmbedder.
+            path: Optional directory to persist the store in.
+        """
+        if capacity < 1:
+            raise ValueError("Memory capacity must be at least 1")
+        self.capacity = capacity
+        self.embedder = embedder or HashingEmbedder()
+        self.path = path
+        self._items: List[Optional[Dict[str, Any]]] = [None] * capacity
+        # Occupied slots, least recently used first
+        self._order: "OrderedDict[int, None]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._log = None
+        self._log_lines = 0
+        self._closed = False
+        # Created by `_ensure_open`
+        self._vectors: Optional["np.ndarray"] = None
+    
+    def _ensure_open(self) -> None:
+        """Create or load the embedding matrix on first use. The lock must be held."""
+        if self._vectors is not None:
+            return
+        np = _import_numpy()
+        shape = (self.capacity, self.embedder.dim)
+        if self.path is None:
+            self._vectors = np.zeros(shape, dtype=np.float32)
+        else:
+            self._vectors = self._open(self.path, shape)
+    
+    def _open(self, path: str, shape) -> "np.ndarray":
+        """
+        Open or create the persisted store.
+        
+        Args:
+            path: The store directory.
+            shape: The expected shape of the embedding matrix.
+            
+        Returns:
+            The memory-mapped embedding matrix.
+        """
+        np = _import_numpy()
+        os.makedirs(path, exist_ok=True)
+        vectors_path = os.path.join(path, self.VECTORS_FILE)
+        items_path = os.path.join(path, self.ITEMS_FILE)
+        
+        vectors = None
+        if os.path.exists(vectors_path):
+            vectors = np.load(vectors_path, mmap_mode="r+")
+            if vectors.shape != shape or vectors.dtype != np.float32:
+                logger.warning(
+                    "Discarding memory at %s: stored shape %s does not match %s", path, vectors.shape, shape
+                )
+                vectors = None
+                if os.path.exists(items_path):
+                    os.remove(items_path)
+        if vectors is None:
+            vectors = np.lib.format.open_memmap(vectors_path, mode="w+", dtype=np.float32, shape=shape)
+        
+        if os.path.exists(items_path):
+            with open(items_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn final line from an interrupted write
+                        continue
+                    slot = record.pop("slot")
+                    self._items[slot] = record
+                    self._order.pop(slot, None)
+                    self._order[slot] = None
+            if self._log_lines > 2 * self.capacity:
+                self._rewrite_log(items_path)
+        self._log = open(items_path, "a", encoding="utf-8")
+        return vectors
+    
+    def _rewrite_log(self, items_path: str) -> None:
+        """
+        Replace the item log with one line per live item.
+        
+        Args:
+            items_path: Path of the item log.
+        """
+        temp_path = items_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for slot in self._order:
+                f.write(json.dumps({"slot": slot, **self._items[slot]}) + "\n")
+        os.replace(temp_path, items_path)
+        self._log_lines = len(self._order)
+    
+    def _check_open(self) -> None:
+        """Raise RuntimeError if the store is closed. The lock must be held."""
+        if self._closed:
+            raise RuntimeError("Memory store is closed")
+    
+    def __len__(self) -> int:
+        """Return the number of items in the store."""
+        with self._lock:
+            self._ensure_open()
+            return len(self._order)
+    
+    def add(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Add an item, evicting the least recently used one if the store is full.
+        
+        Args:
+            text: The text to remember and to match queries against.
+            metadata: Optional JSON-serializable data kept with the item.
+            
+        Returns:
+            The slot the item was stored in.
+            
+        Raises:
+            RuntimeError: If the store is closed.
+        """
+        vector = self.embedder.embed([text])[0]
+        item = {"text": text, "metadata": metadata or {}}
+        with self._lock:
+            self._check_open()
+            self._ensure_open()
+            if len(self._order) < self.capacity:
+                slot = len(self._order)
+            else:
+                slot, _ = self._order.popitem(last=False)
+            self._vectors[slot] = vector
+            self._items[slot] = item
+            self._order[slot] = None
+            if self._log is not None:
+                # The vector reaches the file before the item is logged, so a
+                # crash never leaves a logged item without its vector
+                self._vectors.flush()
+                self._log.write(json.dumps({"slot": slot, **item}) + "\n")
+                self._log.flush()
+                self._log_lines += 1
+        return slot
+    
+    def search(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the items most similar to a query.
+        
+        Args:
+            query: The query text.
+            k: Maximum number of items to return.
+            
+        Returns:
+            Items with "text", "metadata" and "score" keys, best first.
+        """
+        return self.search_batch([query], k)[0]
+    
+    def search_batch(self, queries: Sequence[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Find the items most similar to each of several queries at once.
+        
+        Items with no similarity to a query are not returned. Returned items
+        count as used for eviction.
+        
+        Args:
+            queries: The query texts.
+            k: Maximum number of items to return per query.
+            
+        Returns:
+            One list of items per query, as returned by `search`.
+        """
+        np = _import_numpy()
+        query_vectors = self.embedder.embed(queries)
+        with self._lock:
+            self._ensure_open()
+            size = len(self._order)
+            if size == 0 or k < 1:
+                return [[] for _ in queries]
+            # Slots are filled in order and reused in place, so the first
+            # `size` rows are exactly the occupied ones
+            scores = query_vectors @ self._vectors[:size].T
+            k = min(k, size)
+            if k < size:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(size), (len(queries), size))
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            ranking = np.argsort(-top_scores, axis=1, kind="stable")
+            
+            results = []
+            for row in range(len(queries)):
+                matches = []
+                for column in ranking[row]:
+                    score = float(top_scores[row, column])
+                    if score <= 0:
+                        break
+                    slot = int(top[row, column])
+                    item = self._items[slot]
+                    matches.append({"text": item["text"], "metadata": item["metadata"], "score": score})
+                    self._order.move_to_end(slot)
+                results.append(matches)
+        return results
+    
+    def clear(self) -> None:
+        """
+        Remove every item.
+        
+        Raises:
+            RuntimeError: If the store is closed.
+        """
+        with self._lock:
+            self._check_open()
+            self._ensure_open()
+            self._order.clear()
+            self._items = [None] * self.capacity
+            self._vectors[:] = 0
+            if self._log is not None:
+                self._log.truncate(0)
+                self._log_lines = 0
+    
+    def close(self) -> None:
+        """
+        Flush the persisted store to disk and close its files. The store can
+        still be searched but no longer changed.
+        """
+        with self._lock:
+            self._closed = True
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+                self._rewrite_log(os.path.join(self.path, self.ITEMS_FILE))
+            if self._vectors is not None and self.path is not None:
+                self._vectors.flush()
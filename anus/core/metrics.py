@@ -0,0 +1,250 @@
+"""
+Metrics module for the ANUS framework.
+
+MetricsCollector is a hook that turns agent and orchestrator events into
+latency histograms and counters, and exports them in the Prometheus text
+format or as a JSON snapshot.
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Histogram buckets for latencies, in seconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Histogram buckets for iteration counts
+ITERATION_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def _escape_label(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _json_number(value: Optional[float]) -> Any:
+    """Make a quantile estimate JSON-safe, spelling infinity as "+Inf"."""
+    return "+Inf" if value == float("inf") else value
+
+class Histogram:
+    """A cumulative histogram with fixed bucket bounds."""
+    
+    __slots__ = ("bounds", "counts", "count", "sum")
+    
+    def __init__(self, bounds: Sequence[float]):
+        """
+        Initialize a Histogram instance.
+        
+        Args:
+            bounds: Upper bounds of the buckets, in increasing order.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: The observed value.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        Return the cumulative bucket counts.
+        
+        Returns:
+            (upper bound, count) pairs, ending with the "+Inf" bucket.
+        """
+        total = 0
+        buckets = []
+        for bound, count in zip(list(self.bounds) + ["+Inf"], self.counts):
+            total += count
+            buckets.append((str(bound), total))
+        return buckets
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+        
+        Args:
+            q: The quantile, between 0 and 1.
+            
+        Returns:
+            The estimate, None if nothing was observed, or infinity if it
+            falls in the last bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return float("inf")
+
+class MetricsCollector:
+    """
+    A hook that aggregates run events into metrics.
+    
+    Register it with `add_hook` on an agent or orchestrator. Histograms are
+    kept per agent (multi-agent roles are agents named after their role),
+    per tool and per iteration count; counters track errors and cache hits.
+    """
+    
+    HISTOGRAMS = {
+        "anus_task_duration_seconds": ("Task duration", LATENCY_BUCKETS),
+        "anus_task_iterations": ("Iterations per task", ITERATION_BUCKETS),
+        "anus_iteration_duration_seconds": ("Duration of one thought-action cycle", LATENCY_BUCKETS),
+        "anus_tool_call_duration_seconds": ("Tool call duration", LATENCY_BUCKETS),
+        "anus_llm_call_duration_seconds": ("Model call duration", LATENCY_BUCKETS)
+    }
+    
+    COUNTERS = {
+        "anus_tasks_total": "Tasks finished",
+        "anus_errors_total": "Errors by source",
+        "anus_cache_hits_total": "Cache hits",
+        "anus_cache_misses_total": "Cache misses",
+        "anus_llm_tokens_total": "Model tokens used"
+    }
+    
+    def __init__(self):
+        """Initialize a MetricsCollector instance."""
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {name: {} for name in self.HISTOGRAMS}
+        self._counters: Dict[str, Dict[Labels, float]] = {name: {} for name in self.COUNTERS}
+        self._lock = threading.Lock()
+    
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        """Record a value in a histogram."""
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(labels)
+            if histogram is None:
+                histogram = series[labels] = Histogram(self.HISTOGRAMS[name][1])
+            histogram.observe(value)
+    
+    def _increment(self, name: str, labels: Labels, amount: float = 1) -> None:
+        """Add to a counter."""
+        with self._lock:
+            series = self._counters[name]
+            series[labels] = series.get(labels, 0) + amount
+    
+    def on_iteration(self, event: Dict[str, Any]) -> None:
+        """Record the duration of a thought-action cycle."""
+        self._observe("anus_iteration_duration_seconds", (("agent", event["agent"]),), event["duration"])
+    
+    def on_tool_call(self, event: Dict[str, Any]) -> None:
+        """Record a tool call, its outcome and whether it was served from cache."""
+        labels = (("agent", event["agent"]), ("tool", event["tool"]))
+        if not event.get("cached"):
+            self._observe("anus_tool_call_duration_seconds", labels, event["duration"])
+        if event.get("deterministic"):
+            counter = "anus_cache_hits_total" if event.get("cached") else "anus_cache_misses_total"
+            self._increment(counter, (("cache", "tool"),))
+        if event["status"] == "error":
+            self._increment("anus_errors_total", (("agent", event["agent"]), ("source", "tool")))
+    
+    def on_llm_call(self, event: Dict[str, Any]) -> None:
+        """Record a model call, its outcome and its token usage."""
+        labels = (("agent", event["agent"]),)
+        self._observe("anus_llm_call_duration_seconds", labels, event["duration"])
+        if event.get("tokens"):
+            self._increment("anus_llm_tokens_total", labels, event["tokens"])
+        if event["status"] == "error":
+            self._increment("anus_errors_total", (("agent", event["agent"]), ("source", "llm")))
+    
+    def on_task_end(self, event: Dict[str, Any]) -> None:
+        """Record a finished task."""
+        agent = event["agent"]
+        labels = (("agent", agent),)
+        self._increment("anus_tasks_total", (("agent", agent), ("status", event["status"])))
+        if event.get("cached") is not None:
+            counter = "anus_cache_hits_total" if event["cached"] else "anus_cache_misses_total"
+            self._increment(counter, (("cache", "result"),))
+        if event["status"] == "error":
+            self._increment("anus_errors_total", (("agent", agent), ("source", "task")))
+        if event.get("cached") or event.get("coalesced"):
+            # Served without running, so it says nothing about run latency
+            return
+        self._observe("anus_task_duration_seconds", labels, event["duration"])
+        if event.get("iterations") is not None:
+            self._observe("anus_task_iterations", labels, event["iterations"])
+    
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            for series in self._histograms.values():
+                series.clear()
+            for series in self._counters.values():
+                series.clear()
+    
+    @staticmethod
+    def _format_labels(labels: Labels, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+        """Format labels in the Prometheus text format."""
+        pairs = labels + extra
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs) + "}"
+    
+    def to_prometheus(self) -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+        
+        Returns:
+            The metrics text.
+        """
+        lines = []
+        with self._lock:
+            for name, series in self._counters.items():
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {self.COUNTERS[name]}")
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{name}{self._format_labels(labels)} {value}")
+            for name, series in self._histograms.items():
+                if not series:
+                    continue
+                lines.append(f"# HELP {name} {self.HISTOGRAMS[name][0]}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in sorted(series.items()):
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{name}_bucket{self._format_labels(labels, (('le', bound),))} {count}")
+                    lines.append(f"{name}_sum{self._format_labels(labels)} {histogram.sum}")
+                    lines.append(f"{name}_count{self._format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Export the metrics as a JSON-serializable snapshot.
+        
+        Returns:
+            A dictionary with "counters" and "histograms", each mapping metric
+            names to a list of series with their labels.
+        """
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(labels), "value": value} for labels, value in sorted(series.items())]
+                for name, series in self._counters.items() if series
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "p50": _json_number(histogram.quantile(0.5)),
+                        "p99": _json_number(histogram.quantile(0.99)),
+                        "buckets": dict(histogram.cumulative())
+                    }
+                    for labels, histogram in sorted(series.items())
+                ]
+                for name, series in self._histograms.items() if series
+            }
+        return {"counters": counters, "histograms": histograms}
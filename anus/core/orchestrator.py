@@ -7,30 +7,204 @@ lifecycle and coordinates task execution across multiple agents.
 Behind every successful ANUS is a well-designed Orchestrator.
 """
 
-from typing import Dict, List, Any, Optional
-import yaml
-import os
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Any, Optional, Set, Tuple
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
 
-from anus.core.agent.tool_agent import ToolAgent
+from anus.core.agent.context_window import CompactionStrategy
+from anus.core.agent.hybrid_agent import HybridAgent
+from anus.core.agent.termination import run_status
+from anus.core.agent.trace import TraceLevel
+from anus.core.cache import MISSING, LRUCache, SQLiteCache
+from anus.core.config import CassetteMode, Config, ConfigWatcher, ReplayLatency, freeze, load_config
+from anus.core.hooks import HookRegistry
+from anus.core.singleflight import SingleFlight
+from anus.core.agent.streaming import astream_run
+from anus.core.utils.async_utils import iterate_sync, run_sync
+
+logger = logging.getLogger(__name__)
 
 class AgentOrchestrator:
     """
     Coordinates agents and manages their lifecycle.
     
+    The config and the primary agent built from it are replaced together
+    when the config file changes, either by calling `reload_config` or, with
+    `reload.enabled` set, by watching the file. Tasks already running finish
+    with the config and agent they started with; what the replaced agent
+    alone holds, such as its model client and memory store, is released
+    after they finish.
+    
+    With `cassette.mode` set to "record", every model request and tool call
+    is written to a cassette file; with "replay", they are answered from it
+    instead, without network access.
+    
     This is a simplified implementation for the demo.
     """
     
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str = "config.yaml", use_cache: bool = True):
         """
         Initialize an AgentOrchestrator instance.
         
         Args:
             config_path: Path to the configuration file.
+            use_cache: Whether to use the result cache if one is configured.
+        """
+        self.config_path = config_path
+        self.hooks = HookRegistry()
+        self._reload_lock = threading.Lock()
+        config = self._load_config(config_path)
+        self.tool_sandbox = None
+        self.cassette = self._create_cassette(config)
+        self._tool_registry = self._create_tool_registry(config)
+        self.checkpoints = self._create_checkpoint_store(config)
+        # Tasks running on each agent, and what to release once an agent is
+        # no longer active and idle, by agent id
+        self._agent_tasks: Dict[int, int] = {}
+        self._releases: Dict[int, Dict[str, Callable[[], None]]] = {}
+        self._retired: Set[int] = set()
+        # The config and its primary agent, swapped together on reload
+        self._active: Tuple[Config, HybridAgent] = (config, self._create_primary_agent(config))
+        self.result_cache = self._create_result_cache() if use_cache else None
+        self._in_flight = SingleFlight()
+        self._watcher: Optional[ConfigWatcher] = None
+        
+        reload_config = config.get("reload", {})
+        if reload_config.get("enabled", False):
+            self.watch_config(reload_config.get("interval", 2.0))
+    
+    @property
+    def config(self) -> Config:
+        """The current configuration."""
+        return self._active[0]
+    
+    @property
+    def primary_agent(self) -> HybridAgent:
+        """The agent built from the current configuration."""
+        return self._active[1]
+    
+    def add_hook(self, hook: Any) -> None:
+        """
+        Register a hook on the orchestrator and its agents.
+        
+        Orchestrator events come from the agent named "orchestrator" and
+        also cover tasks served from the cache or shared with an identical
+        task in flight.
+        
+        Args:
+            hook: An object with any of the methods in `HOOK_EVENTS`.
+        """
+        with self._reload_lock:
+            self.hooks.add(hook)
+            self.primary_agent.add_hook(hook)
+    
+    def remove_hook(self, hook: Any) -> None:
+        """
+        Unregister a hook from the orchestrator and its agents.
+        
+        Args:
+            hook: A previously registered hook.
+        """
+        with self._reload_lock:
+            self.hooks.remove(hook)
+            self.primary_agent.remove_hook(hook)
+    
+    def _acquire(self) -> Tuple[Config, HybridAgent]:
+        """
+        Take the active config and agent for a task.
+        
+        Returns:
+            The config and agent, which stay usable until `_release`.
+        """
+        with self._reload_lock:
+            config, agent = self._active
+            self._agent_tasks[id(agent)] = self._agent_tasks.get(id(agent), 0) + 1
+        return config, agent
+    
+    def _hold(self, agent: HybridAgent) -> None:
+        """
+        Take an agent already taken with `_acquire` again, for work that may
+        outlive the task that took it.
+        
+        Args:
+            agent: The agent.
+        """
+        with self._reload_lock:
+            self._agent_tasks[id(agent)] += 1
+    
+    def _release(self, agent: HybridAgent) -> None:
+        """
+        Finish a task taken with `_acquire`, releasing the agent's resources
+        if it has been replaced and this was its last task.
+        
+        Args:
+            agent: The agent the task ran on.
+        """
+        with self._reload_lock:
+            remaining = self._agent_tasks[id(agent)] - 1
+            if remaining:
+                self._agent_tasks[id(agent)] = remaining
+                return
+            del self._agent_tasks[id(agent)]
+            if id(agent) not in self._retired:
+                return
+            releases = self._retire_now(agent)
+        self._run_releases(releases)
+    
+    def _retire_now(self, agent: HybridAgent) -> List[Callable[[], None]]:
+        """
+        Forget a replaced, idle agent. The reload lock must be held.
+        
+        Args:
+            agent: The agent.
+            
+        Returns:
+            The functions releasing its resources, to call without the lock.
+        """
+        self._retired.discard(id(agent))
+        return list(self._releases.pop(id(agent), {}).values())
+    
+    @staticmethod
+    def _run_releases(releases: List[Callable[[], None]]) -> None:
+        """
+        Release an agent's resources, logging failures.
+        
+        Args:
+            releases: Functions releasing one resource each.
         """
-        self.config = self._load_config(config_path)
-        self.primary_agent = self._create_primary_agent()
+        for release in releases:
+            try:
+                release()
+            except Exception as e:
+                logger.warning("Failed to release a replaced agent's resources: %s", e)
     
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
+    def _emit_task_end(self, task: str, started: float, result: Dict[str, Any]) -> None:
+        """
+        Report a finished task to the hooks.
+        
+        Args:
+            task: The task.
+            started: Monotonic time the task started at.
+            result: The result returned to the caller.
+        """
+        now = time.monotonic()
+        self.hooks.emit("on_task_end", {
+            "agent": "orchestrator",
+            "task": task,
+            "status": run_status(result),
+            "stop_reason": result.get("stop_reason"),
+            "iterations": result.get("iterations"),
+            "cached": bool(result.get("cached")) if self.result_cache is not None else None,
+            "coalesced": bool(result.get("coalesced")),
+            "timestamp": now,
+            "duration": now - started
+        })
+    
+    def _load_config(self, config_path: str) -> Config:
         """
         Load configuration from a file.
         
@@ -38,16 +212,13 @@ class AgentOrchestrator:
             config_path: Path to the configuration file.
             
         Returns:
-            A dictionary containing the configuration.
+            The immutable configuration.
         """
         try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-            return config
+            return load_config(config_path)
         except Exception as e:
-            print(f"Warning: Failed to load config from {config_path}: {e}")
-            print("Using default configuration.")
-            return {
+            logger.warning("Failed to load config from %s: %s. Using default configuration.", config_path, e)
+            return freeze({
                 "agent": {
                     "mode": "single",
                     "max_iterations": 10,
@@ -56,37 +227,510 @@ class AgentOrchestrator:
                 "tools": {
                     "enabled": ["calculator"]
                 }
-            }
+            })
+    
+    def _create_tool_registry(self, config: Config) -> Optional[Any]:
+        """
+        Create the registry of tools run in worker processes or through the
+        cassette, if configured.
+        
+        The `tools.sandbox` section is read once; reloading the config does
+        not restart the pool.
+        
+        Args:
+            config: The configuration.
+            
+        Returns:
+            A ToolRegistry whose sandboxed tools run in `self.tool_sandbox`
+            and whose tools are recorded or replayed by `self.cassette`, or
+            None to use the shared default registry.
+        """
+        sandbox_config = config.get("tools", {}).get("sandbox", {})
+        sandboxed = sandbox_config.get("enabled", False)
+        if not sandboxed and self.cassette is None:
+            return None
+        
+        from anus.tools.registry import ToolRegistry
+        registry = ToolRegistry()
+        if sandboxed:
+            from anus.tools.sandbox import create_sandbox
+            self.tool_sandbox = create_sandbox(
+                registry,
+                sandbox_config.get("tools", ()),
+                workers=sandbox_config.get("workers", 2),
+                timeout=sandbox_config.get("timeout", 10.0),
+                max_memory_mb=sandbox_config.get("max_memory_mb", 1024),
+                max_cpu_seconds=sandbox_config.get("max_cpu_seconds", 5.0),
+                max_calls=sandbox_config.get("max_calls", 500),
+                max_rss_growth_mb=sandbox_config.get("max_rss_growth_mb", 200)
+            )
+        if self.cassette is not None:
+            # Wrap every known tool, so that tools enabled by a later reload are covered too
+            self.cassette.wrap_tools(registry, registry.available())
+        return registry
+    
+    def _create_cassette(self, config: Config) -> Optional[Any]:
+        """
+        Open the cassette model and tool calls are recorded in or replayed
+        from, if configured.
+        
+        The `cassette` section is read once; reloading the config keeps the
+        cassette.
+        
+        Args:
+            config: The configuration.
+            
+        Returns:
+            A Cassette, or None if the cassette mode is "off".
+        """
+        cassette_config = config.get("cassette", {})
+        mode = cassette_config.get("mode", CassetteMode.OFF)
+        if mode == CassetteMode.OFF:
+            return None
+        
+        from anus.core.cassette import Cassette
+        return Cassette(
+            cassette_config.get("path", ".anus/cassette.jsonl.gz"),
+            mode=mode,
+            latency=cassette_config.get("latency", ReplayLatency.RECORDED)
+        )
     
-    def _create_primary_agent(self) -> ToolAgent:
+    def _create_checkpoint_store(self, config: Config) -> Optional[Any]:
+        """
+        Create the store that agent runs are checkpointed in, if configured.
+        
+        The `checkpoints` section is read once; reloading the config keeps
+        the store.
+        
+        Args:
+            config: The configuration.
+            
+        Returns:
+            A CheckpointStore, or None if checkpointing is disabled.
+        """
+        checkpoint_config = config.get("checkpoints", {})
+        if not checkpoint_config.get("enabled", False):
+            return None
+        
+        from anus.core.checkpoint import CheckpointStore
+        return CheckpointStore(
+            checkpoint_config.get("path", ".anus/checkpoints.sqlite"),
+            keep_finished=checkpoint_config.get("keep_finished", 86400)
+        )
+    
+    def _create_primary_agent(
+        self,
+        config: Config,
+        previous: Optional[Tuple[Config, HybridAgent]] = None
+    ) -> HybridAgent:
         """
         Create the primary agent based on configuration.
         
+        Args:
+            config: The configuration to build the agent from.
+            previous: The config and agent being replaced, if any. Their
+                tool cache and memory are carried over when the new config
+                leaves those settings unchanged. A persisted memory store
+                is also kept when only its capacity changes, since a new
+                store cannot share its files.
+                
         Returns:
-            A ToolAgent instance.
+            A HybridAgent, which runs tasks in single or multi-agent mode
+            as `agent.mode` or the task's own mode selects.
         """
+        previous_config, previous_agent = previous or (None, None)
+        
         # Get enabled tools from config
-        tools = self.config.get("tools", {}).get("enabled", [])
+        tools = config.get("tools", {}).get("enabled", [])
+        
+        # Optionally share deterministic tool results across tasks
+        cache_config = config.get("tools", {}).get("cache")
+        tool_cache = None
+        if previous_agent is not None and cache_config == previous_config.get("tools", {}).get("cache"):
+            tool_cache = previous_agent.tool_cache
+        elif cache_config:
+            tool_cache = LRUCache(
+                maxsize=cache_config.get("max_entries", 1024),
+                ttl=cache_config.get("ttl")
+            )
+        
+        # Use the model for reasoning steps when it is enabled
+        model_config = config.get("model", {})
+        llm = None
+        # Resources only this agent holds, released when it is retired
+        releases: Dict[str, Callable[[], None]] = {}
+        if model_config.get("enabled", False):
+            # A replayed model needs no client, and so no network or API key
+            if self.cassette is None or self.cassette.recording:
+                from anus.core.llm.providers import get_client, release_client
+                llm = get_client(model_config)
+                releases["llm"] = lambda client=llm: release_client(client)
+            if self.cassette is not None:
+                llm = self.cassette.wrap_llm(llm)
+        
+        # Give the agent a memory that outlives single tasks
+        agent_config = config.get("agent", {})
+        memory = None
+        memory_capacity = agent_config.get("memory_capacity", 0)
+        memory_settings = (memory_capacity, agent_config.get("memory_path"))
+        if previous_agent is not None and previous_agent.memory is not None:
+            previous_settings = previous_config.get("agent", {})
+            previous_path = previous_settings.get("memory_path")
+            if memory_settings == (previous_settings.get("memory_capacity", 0), previous_path):
+                memory = previous_agent.memory
+            elif memory_capacity and previous_path is not None and previous_path == memory_settings[1]:
+                # A second store cannot open the files while running tasks
+                # still write to the first one
+                logger.warning(
+                    "Keeping the memory store at %s; its new capacity applies after a restart", previous_path
+                )
+                memory = previous_agent.memory
+            if memory is not None:
+                # The new agent takes over closing the store
+                self._releases.get(id(previous_agent), {}).pop("memory", None)
+        if memory_capacity and memory is None:
+            from anus.core.memory import MemoryStore
+            memory = MemoryStore(capacity=memory_capacity, path=agent_config.get("memory_path"))
+        if memory is not None:
+            # A replaced store is closed once the tasks still using it are done
+            releases["memory"] = memory.close
         
         # Create the agent
-        agent = ToolAgent(
+        agent = HybridAgent(
             name="primary-agent",
-            max_iterations=self.config.get("agent", {}).get("max_iterations", 10),
-            tools=tools
+            mode=agent_config.get("mode", "auto"),
+            max_workers=agent_config.get("max_workers"),
+            role_timeout=agent_config.get("role_timeout"),
+            max_iterations=agent_config.get("max_iterations", 10),
+            max_time=agent_config.get("max_time"),
+            max_tokens=agent_config.get("max_tokens"),
+            trace_level=agent_config.get("trace_level", TraceLevel.FULL),
+            tools=tools,
+            tool_cache=tool_cache,
+            registry=self._tool_registry,
+            llm=llm,
+            memory=memory,
+            memory_top_k=agent_config.get("memory_top_k", 3),
+            context_max_tokens=agent_config.get("context_max_tokens"),
+            context_strategy=agent_config.get("context_strategy", CompactionStrategy.TRUNCATE),
+            checkpoints=self.checkpoints
         )
+        self._releases[id(agent)] = releases
         
         return agent
     
-    def execute_task(self, task: str, mode: Optional[str] = None) -> Dict[str, Any]:
+    def reload_config(self, config: Optional[Config] = None) -> bool:
+        """
+        Replace the configuration and the primary agent.
+        
+        The new agent is built first and then swapped in with the config in
+        a single step, so every task sees a matching pair. Tasks already
+        running finish on the old agent, whose model client and memory store
+        are released once the last of them is done, unless the new agent
+        shares them. The result cache is kept; its keys cover the settings
+        that change answers.
+        
+        Args:
+            config: The new configuration. Defaults to loading the config
+                file again.
+                
+        Returns:
+            True if a new configuration was applied, False if it was
+            unchanged.
+            
+        Raises:
+            ConfigError: If the config file holds invalid settings. Read and
+                YAML errors are raised as by `load_config`. Either way the
+                current configuration stays in place.
+        """
+        if config is None:
+            config = load_config(self.config_path)
+        with self._reload_lock:
+            previous = self._active
+            if config is previous[0]:
+                return False
+            agent = self._create_primary_agent(config, previous)
+            for hook in self.hooks:
+                agent.add_hook(hook)
+            self._active = (config, agent)
+            previous_agent = previous[1]
+            self._retired.add(id(previous_agent))
+            releases = [] if id(previous_agent) in self._agent_tasks else self._retire_now(previous_agent)
+        self._run_releases(releases)
+        logger.info("Applied configuration from %s", self.config_path)
+        return True
+    
+    def watch_config(self, interval: float = 2.0) -> None:
+        """
+        Apply changes to the config file as they are saved.
+        
+        The file is polled on a background thread. Changes that fail to load
+        are logged and leave the current configuration in place.
+        
+        Args:
+            interval: Seconds between checks of the file.
+        """
+        if self._watcher is None:
+            self._watcher = ConfigWatcher(self.config_path, self.reload_config, interval)
+            self._watcher.start()
+    
+    def stop_watching(self) -> None:
+        """Stop watching the config file."""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+    
+    def close(self) -> None:
+        """
+        Stop watching the config file, release the agents' model clients and
+        memory stores, stop the tool worker processes and close the
+        checkpoint store and cassette.
+        """
+        self.stop_watching()
+        with self._reload_lock:
+            releases = [release for agent_releases in self._releases.values() for release in agent_releases.values()]
+            self._releases.clear()
+            self._retired.clear()
+        self._run_releases(releases)
+        if self.tool_sandbox is not None:
+            self.tool_sandbox.close()
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+        if self.cassette is not None:
+            self.cassette.close()
+    
+    def _create_result_cache(self):
+        """
+        Create the result cache described by the `cache` config section.
+        
+        Returns:
+            An LRUCache or SQLiteCache, or None if caching is disabled.
+        """
+        cache_config = self.config.get("cache", {})
+        if not cache_config.get("enabled", False):
+            return None
+        
+        backend = cache_config.get("backend", "memory")
+        max_entries = cache_config.get("max_entries", 10000)
+        ttl = cache_config.get("ttl")
+        if backend == "sqlite":
+            return SQLiteCache(cache_config.get("path", ".anus/cache.sqlite"), maxsize=max_entries, ttl=ttl)
+        if backend == "memory":
+            return LRUCache(maxsize=max_entries, ttl=ttl)
+        logger.warning("Unknown cache backend %r; result caching is disabled.", backend)
+        return None
+    
+    def _cache_key(self, task: str, mode: Optional[str], config: Config) -> str:
+        """
+        Build the result cache key for a task.
+        
+        The key covers the task text with whitespace normalized and every
+        setting that can change the answer, so that editing the config
+        naturally invalidates earlier results.
+        
+        Args:
+            task: The task to execute.
+            mode: The execution mode requested for the task.
+            config: The configuration the task runs with.
+            
+        Returns:
+            A hex digest identifying the task and configuration.
+        """
+        agent_config = config.get("agent", {})
+        settings = {
+            "mode": mode or agent_config.get("mode"),
+            "max_iterations": agent_config.get("max_iterations", 10),
+            "tools": sorted(config.get("tools", {}).get("enabled", [])),
+            "model": config.get("model", {}).get("name")
+        }
+        normalized = " ".join(task.split())
+        payload = json.dumps([normalized, settings], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def execute_task(
+        self,
+        task: str,
+        mode: Optional[str] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Execute a task using the appropriate agent(s).
         
         Args:
             task: The task to execute.
-            mode: The execution mode (single or multi).
+            mode: The execution mode: single, multi or auto. Defaults to
+                `agent.mode` from the config.
+            refresh: Whether to ignore a cached result and execute anyway.
+            
+        Returns:
+            A dictionary containing the execution result and metadata.
+        """
+        return run_sync(self.execute_task_async(task, mode=mode, refresh=refresh))
+    
+    async def execute_task_async(
+        self,
+        task: str,
+        mode: Optional[str] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute a task asynchronously using the appropriate agent(s).
+        
+        Many tasks can run concurrently on a single event loop. When a result
+        cache is configured, results served from it carry `"cached": True`;
+        only runs that answered the task are cached.
+        Identical tasks submitted while one is already running attach to that
+        execution instead of starting another; their results carry
+        `"coalesced": True`.
+        
+        Args:
+            task: The task to execute.
+            mode: The execution mode: single, multi or auto. Defaults to
+                `agent.mode` from the config.
+            refresh: Whether to ignore a cached result and execute anyway;
+                the fresh result replaces the cached one.
+                
+        Returns:
+            A dictionary containing the execution result and metadata.
+        """
+        hooks = self.hooks
+        if hooks:
+            started = time.monotonic()
+            hooks.emit("on_task_start", {"agent": "orchestrator", "task": task, "timestamp": started})
+        
+        # Keep the config and agent the task started with across a reload
+        config, agent = self._acquire()
+        try:
+            cache = self.result_cache
+            key = self._cache_key(task, mode, config)
+            if cache is not None and not refresh:
+                cached = cache.get(key)
+                if cached is not MISSING:
+                    result = copy.deepcopy(cached) if isinstance(cache, LRUCache) else cached
+                    result["cached"] = True
+                    if hooks:
+                        self._emit_task_end(task, started, result)
+                    return result
+            
+            async def run() -> Dict[str, Any]:
+                # The run may outlive this caller when others share it
+                self._hold(agent)
+                try:
+                    # Use the primary agent to execute the task
+                    result = await agent.aexecute(task, mode=mode)
+                finally:
+                    self._release(agent)
+                # Only answers are kept; incomplete runs may succeed when retried
+                if cache is not None and run_status(result) == "success":
+                    cache.set(key, copy.deepcopy(result) if isinstance(cache, LRUCache) else result)
+                return result
+            
+            try:
+                result, shared = await self._in_flight.ado(key, run)
+            except Exception:
+                if hooks:
+                    self._emit_task_end(task, started, {"status": "error"})
+                raise
+        finally:
+            self._release(agent)
+        if shared:
+            result = copy.deepcopy(result)
+            result["coalesced"] = True
+        if hooks:
+            self._emit_task_end(task, started, result)
+        return result
+    
+    def unfinished_runs(self) -> List[Dict[str, Any]]:
+        """
+        List the checkpointed runs that have not finished, e.g. after a crash.
+        
+        Returns:
+            Run summaries as returned by `CheckpointStore.unfinished_runs`,
+            or an empty list if checkpointing is disabled.
+        """
+        if self.checkpoints is None:
+            return []
+        return self.checkpoints.unfinished_runs()
+    
+    def resume_task(self, run_id: str) -> Dict[str, Any]:
+        """
+        Continue an interrupted run from its last completed iteration.
+        
+        Args:
+            run_id: Id of the run, as listed by `unfinished_runs`.
+            
+        Returns:
+            A dictionary containing the execution result and metadata.
+        """
+        return run_sync(self.resume_task_async(run_id))
+    
+    async def resume_task_async(self, run_id: str) -> Dict[str, Any]:
+        """
+        Continue an interrupted run asynchronously from its last completed
+        iteration.
+        
+        The run continues on the current primary agent. Its result is not
+        added to the result cache.
+        
+        Args:
+            run_id: Id of the run, as listed by `unfinished_runs`.
             
         Returns:
             A dictionary containing the execution result and metadata.
+            
+        Raises:
+            RuntimeError: If checkpointing is disabled.
+            KeyError: If the run is unknown.
+            ValueError: If the run has already finished.
+        """
+        _, agent = self._acquire()
+        try:
+            return await agent.aresume(run_id)
+        finally:
+            self._release(agent)
+    
+    async def aexecute_stream(
+        self,
+        task: str,
+        mode: Optional[str] = None,
+        refresh: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a task asynchronously, yielding events as they happen.
+        
+        Cached results and results shared with an identical task already in
+        flight produce only the final event. Stopping the iteration early
+        cancels the run unless other callers are waiting for it.
+        
+        Args:
+            task: The task to execute.
+            mode: The execution mode: single, multi or auto. Defaults to
+                `agent.mode` from the config.
+            refresh: Whether to ignore a cached result and execute anyway.
+            
+        Yields:
+            The agent events described in `anus.core.agent.streaming`,
+            ending with a "final" event.
+        """
+        async for event in astream_run(lambda: self.execute_task_async(task, mode=mode, refresh=refresh)):
+            yield event
+    
+    def execute_stream(
+        self,
+        task: str,
+        mode: Optional[str] = None,
+        refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a task, yielding events as they happen.
+        
+        Args:
+            task: The task to execute.
+            mode: The execution mode: single, multi or auto. Defaults to
+                `agent.mode` from the config.
+            refresh: Whether to ignore a cached result and execute anyway.
+            
+        Yields:
+            The events described in `aexecute_stream`.
         """
-        # Use the primary agent to execute the task
-        return self.primary_agent.execute(task)
+        yield from iterate_sync(self.aexecute_stream(task, mode=mode, refresh=refresh))
@@ -0,0 +1,124 @@
+"""
+Single-flight module for the ANUS framework.
+
+This module coalesces concurrent identical requests: while one execution
+for a key is in flight, other callers asking for the same key wait for it
+and share its outcome instead of starting their own.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+class _Call:
+    """An in-flight execution and the callers waiting for it."""
+    
+    __slots__ = ("future", "waiters", "task", "loop")
+    
+    def __init__(self):
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.waiters = 0
+        self.task: Optional[asyncio.Task] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+    
+    The shared outcome is held in a thread-safe future, so callers on
+    different threads and event loops (including synchronous callers going
+    through `run_sync`) can attach to the same execution. Errors propagate to
+    every waiter. A waiter that is cancelled simply stops waiting; the
+    execution itself is cancelled only once no waiters are left.
+    """
+    
+    def __init__(self):
+        """Initialize a SingleFlight instance."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+    
+    def in_flight(self) -> int:
+        """Return the number of executions currently in flight."""
+        return len(self._calls)
+    
+    async def ado(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run `factory()` for a key, or wait for the execution already in flight.
+        
+        Args:
+            key: Identifies equivalent requests.
+            factory: Creates the awaitable that produces the result.
+            
+        Returns:
+            A tuple of the result and whether it was shared with (rather than
+            produced for) this caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            call.waiters += 1
+        
+        if leader:
+            call.loop = asyncio.get_running_loop()
+            call.task = asyncio.ensure_future(self._run(key, call, factory))
+        
+        try:
+            result = await asyncio.shield(asyncio.wrap_future(call.future))
+        except asyncio.CancelledError:
+            self._leave(key, call)
+            raise
+        return result, not leader
+    
+    async def _run(self, key: Hashable, call: _Call, factory: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Execute the shared work and publish its outcome to the waiters.
+        
+        Args:
+            key: The key of the execution.
+            call: The in-flight call record.
+            factory: Creates the awaitable that produces the result.
+        """
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            call.future.cancel()
+            raise
+        except BaseException as e:
+            call.future.set_exception(e)
+        else:
+            call.future.set_result(result)
+        finally:
+            self._forget(key, call)
+    
+    def _leave(self, key: Hashable, call: _Call) -> None:
+        """
+        Detach a cancelled waiter, cancelling the execution if it was the last.
+        
+        Args:
+            key: The key of the execution.
+            call: The in-flight call record.
+        """
+        with self._lock:
+            call.waiters -= 1
+            abandoned = call.waiters == 0 and not call.future.done()
+            if abandoned and self._calls.get(key) is call:
+                # New callers must start a fresh execution
+                del self._calls[key]
+        if abandoned and call.task is not None:
+            call.loop.call_soon_threadsafe(call.task.cancel)
+    
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        """
+        Remove a finished execution so later calls start afresh.
+        
+        Args:
+            key: The key of the execution.
+            call: The in-flight call record.
+        """
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
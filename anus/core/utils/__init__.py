@@ -1,17 +1,51 @@
 """
 Utility functions for the ANUS framework.
+
+The functions are imported lazily on first attribute access (PEP 562), so
+importing one utility module does not import the others or their
+dependencies.
 """
 
-from anus.core.utils.api_keys import (
-    load_environment,
-    get_openai_api_key,
-    validate_api_keys,
-    ensure_api_keys
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from anus.core.utils.api_keys import (
+        load_environment,
+        get_openai_api_key,
+        validate_api_keys,
+        ensure_api_keys
+    )
+    from anus.core.utils.async_utils import run_sync
+    from anus.core.utils.logging_utils import configure_logging
+
+_LAZY_ATTRIBUTES = {
+    "load_environment": "anus.core.utils.api_keys",
+    "get_openai_api_key": "anus.core.utils.api_keys",
+    "validate_api_keys": "anus.core.utils.api_keys",
+    "ensure_api_keys": "anus.core.utils.api_keys",
+    "run_sync": "anus.core.utils.async_utils",
+    "configure_logging": "anus.core.utils.logging_utils",
+}
 
 __all__ = [
     "load_environment",
     "get_openai_api_key",
     "validate_api_keys",
-    "ensure_api_keys"
-]
\ No newline at end of file
+    "ensure_api_keys",
+    "run_sync",
+    "configure_logging"
+]
+
+def __getattr__(name: str) -> Any:
+    """Import a utility function on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    """List the lazily imported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
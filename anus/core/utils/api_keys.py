@@ -4,36 +4,45 @@ Utility functions for managing API keys in ANUS.
 
 import os
 import sys
-from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
-def load_environment() -> bool:
+# Result of the first load_environment call; None until then
+_env_loaded: Optional[bool] = None
+
+def load_environment(force: bool = False) -> bool:
     """
     Load environment variables from .env file.
     
+    The lookup runs once per process; later calls return the memoized result
+    without touching the filesystem.
+    
+    Args:
+        force: Whether to search for and load the .env file again.
+    
     Returns:
         bool: True if any .env file was found and loaded, False otherwise.
     """
-    # Try to load from project root directory
-    env_path = Path('.') / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-        return True
-        
-    # Try to load from parent directory if running from inside package
-    env_path = Path('..') / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-        return True
-        
-    # Try to load from user's home directory
-    env_path = Path.home() / '.anus' / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-        return True
-        
-    return False
+    global _env_loaded
+    if _env_loaded is not None and not force:
+        return _env_loaded
+    
+    # os.path is used rather than pathlib to keep CLI startup cheap
+    candidates = [
+        # Project root directory
+        os.path.join('.', '.env'),
+        # Parent directory if running from inside package
+        os.path.join('..', '.env'),
+        # User's home directory
+        os.path.join(os.path.expanduser('~'), '.anus', '.env'),
+    ]
+    _env_loaded = False
+    for env_path in candidates:
+        if os.path.exists(env_path):
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path=env_path)
+            _env_loaded = True
+            break
+    return _env_loaded
 
 def get_openai_api_key() -> Optional[str]:
     """
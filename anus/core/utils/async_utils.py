@@ -0,0 +1,123 @@
+"""
+Helpers for bridging the synchronous and asynchronous APIs of ANUS.
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Coroutine, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop reserved for synchronous callers on this thread.
+    
+    The loop is created on first use and reused afterwards, which keeps the
+    synchronous wrappers cheap compared to creating a loop per call.
+    
+    Returns:
+        asyncio.AbstractEventLoop: The thread's private event loop.
+    """
+    loop = getattr(_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _local.loop = loop
+    return loop
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+    
+    When no event loop is running on the calling thread, the coroutine runs on
+    the thread's private loop. When called from inside a running loop, it runs
+    on a helper thread so the caller's loop is never re-entered.
+    
+    Args:
+        coro: The coroutine to run.
+        
+    Returns:
+        The value returned by the coroutine.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _thread_loop().run_until_complete(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_sync, coro).result()
+
+
+def iterate_sync(aiterator: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Iterate over an async iterator from synchronous code.
+    
+    Items are produced one at a time as the caller asks for them, on the same
+    loops `run_sync` uses. Closing the returned generator early closes the
+    async iterator too.
+    
+    Args:
+        aiterator: The async iterator, typically an async generator.
+        
+    Yields:
+        The items of the async iterator.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        loop = _thread_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(aiterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(aiterator, "aclose", None)
+            if aclose is not None:
+                loop.run_until_complete(aclose())
+        return
+    
+    # A loop is running on this thread; drive the iterator on a helper thread
+    items: queue.Queue = queue.Queue(maxsize=1)
+    stop = threading.Event()
+    done = object()
+    
+    def pump() -> None:
+        async def drain() -> None:
+            try:
+                async for item in aiterator:
+                    items.put((item, None))
+                    if stop.is_set():
+                        break
+            except BaseException as e:
+                items.put((done, e))
+                return
+            finally:
+                aclose = getattr(aiterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            items.put((done, None))
+        run_sync(drain())
+    
+    helper = threading.Thread(target=pump, daemon=True)
+    helper.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        # Unblock the helper if it is waiting to hand over an item
+        while helper.is_alive():
+            try:
+                items.get(timeout=0.05)
+            except queue.Empty:
+                pass
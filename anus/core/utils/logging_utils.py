@@ -0,0 +1,178 @@
+"""
+Logging setup for the ANUS framework.
+
+`configure_logging` applies the `logging` section of the config. Records are
+put on an in-memory queue by the threads that log them and written to the
+console and the log file by a single background listener thread, so agent
+threads never wait on file I/O. Message arguments are merged into the
+message on the listener thread, not on the hot path.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+from typing import Any, Dict, Optional
+
+# Argument types that can safely be formatted later, on the listener thread
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+DEFAULT_FORMAT = "%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of the DEBUG records of selected loggers.
+    
+    Sampling is deterministic: with a rate of 0.1, every tenth record of a
+    logger is kept. Records above DEBUG level always pass.
+    """
+    
+    def __init__(self, rates: Dict[str, float]):
+        """
+        Initialize a SamplingFilter instance.
+        
+        Args:
+            rates: Maps logger names to the fraction of their DEBUG records
+                to keep. A name also covers its child loggers.
+        """
+        super().__init__()
+        self.rates = dict(rates)
+        self._periods: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+    
+    def _period(self, name: str) -> int:
+        """Return how many records of a logger share one kept record."""
+        period = self._periods.get(name)
+        if period is None:
+            rate = 1.0
+            # The most specific configured ancestor decides
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            period = 0 if rate <= 0 else max(1, round(1 / min(rate, 1.0)))
+            self._periods[name] = period
+        return period
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether to keep a record."""
+        if record.levelno > logging.DEBUG:
+            return True
+        period = self._period(record.name)
+        if period <= 1:
+            return period == 1
+        count = self._counts.get(record.name, 0)
+        self._counts[record.name] = count + 1
+        return count % period == 0
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that leaves message formatting to the listener thread.
+    
+    The standard QueueHandler formats every record before queueing it.
+    Here, records whose arguments are immutable are queued as they are.
+    Records with other arguments are still formatted right away, because
+    those arguments may change before the listener gets to them.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for queueing."""
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(isinstance(a, _IMMUTABLE_ARG_TYPES) for a in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+def configure_logging(config: Optional[Dict[str, Any]] = None) -> logging.handlers.QueueListener:
+    """
+    Configure logging from the `logging` section of the config.
+    
+    Calling it again replaces the previous configuration.
+    
+    Supported keys:
+        level: Root log level, e.g. "DEBUG". Defaults to "INFO".
+        file: Optional log file path.
+        rotation: "size" (the default) or "time".
+        max_bytes: File size that triggers size-based rotation.
+        when, interval: Schedule for time-based rotation, as accepted by
+            TimedRotatingFileHandler, e.g. "midnight" and 1.
+        backup_count: Number of rotated files to keep.
+        console_level: Level of records also printed to stderr. Defaults to
+            "WARNING".
+        format: Log record format.
+        sample: Maps logger names to the fraction of their DEBUG records
+            to keep, e.g. {"anus.core.agent": 0.1}.
+    
+    Args:
+        config: The `logging` config section.
+        
+    Returns:
+        The started QueueListener.
+    """
+    global _listener
+    config = config or {}
+    shutdown_logging()
+    
+    formatter = logging.Formatter(config.get("format", DEFAULT_FORMAT))
+    handlers = []
+    
+    console = logging.StreamHandler()
+    console.setLevel(str(config.get("console_level", "WARNING")).upper())
+    console.setFormatter(formatter)
+    handlers.append(console)
+    
+    path = config.get("file")
+    if path:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if config.get("rotation", "size") == "time":
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                path,
+                when=config.get("when", "midnight"),
+                interval=config.get("interval", 1),
+                backupCount=config.get("backup_count", 7),
+                encoding="utf-8",
+                delay=True
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                path,
+                maxBytes=config.get("max_bytes", 10 * 1024 * 1024),
+                backupCount=config.get("backup_count", 5),
+                encoding="utf-8",
+                delay=True
+            )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = LazyQueueHandler(log_queue)
+    if config.get("sample"):
+        queue_handler.addFilter(SamplingFilter(config["sample"]))
+    
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(str(config.get("level", "INFO")).upper())
+    
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+def shutdown_logging() -> None:
+    """Write out any queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,23 @@
+"""
+Serialization helpers for the ANUS framework.
+"""
+
+from typing import Any
+
+def json_default(obj: Any) -> Any:
+    """
+    Convert objects that `json` cannot encode natively.
+    
+    Objects with a `to_dict` method, such as agent traces, are encoded as that
+    dictionary; anything else falls back to its string form.
+    
+    Args:
+        obj: The object to convert.
+        
+    Returns:
+        A JSON-encodable value.
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    return str(obj)
@@ -6,72 +6,117 @@ Main entry point for the Anus AI agent framework
 import argparse
 import sys
 import os
-from pathlib import Path
-from dotenv import load_dotenv
 
-from anus.core.orchestrator import AgentOrchestrator
-from anus.ui.cli import CLI
+# Only lightweight modules are imported up front; the orchestrator, the CLI
+# and their dependencies are imported after arguments are parsed, so that
+# `anus --help` and argument errors return immediately.
+from anus.core.utils.api_keys import load_environment
 
-def load_environment():
-    """Load environment variables from .env file"""
-    # Try to load from project root directory
-    env_path = Path('.') / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-        return True
-        
-    # Try to load from parent directory if running from inside package
-    env_path = Path('..') / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-        return True
-        
-    # Try to load from user's home directory
-    env_path = Path.home() / '.anus' / '.env'
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
+def run_batch(args, cli):
+    """Run tasks from a file or stdin through a pool of workers"""
+    from anus.core.batch import BatchRunner
+    
+    runner = BatchRunner(
+        config_path=args.config,
+        workers=args.workers,
+        executor=args.executor,
+        mode=args.mode,
+        use_cache=not args.no_cache,
+        refresh=args.refresh
+    )
+    input_stream = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        stats = runner.run(input_stream, output_stream)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    
+    cli.display_batch_summary(stats)
+
+def setup_logging(config_path):
+    """Apply the logging section of the configuration file"""
+    from anus.core.config import load_config
+    from anus.core.utils.logging_utils import configure_logging
+    
+    try:
+        config = load_config(config_path)
+    except Exception:
+        # The orchestrator reports unusable configuration files
+        config = {}
+    configure_logging(config.get("logging"))
+
+def needs_api_key(config_path):
+    """Return False when the configuration replays a cassette, which needs no API key"""
+    from anus.core.config import CassetteMode, load_config
+    
+    try:
+        config = load_config(config_path)
+    except Exception:
+        # The orchestrator reports unusable configuration files
         return True
-        
-    return False
+    return config.get("cassette", {}).get("mode") != CassetteMode.REPLAY
 
 def main():
     """Main entry point for the Anus AI agent"""
-    # Load environment variables
-    env_loaded = load_environment()
-    
     parser = argparse.ArgumentParser(description="Anus AI - Autonomous Networked Utility System")
     parser.add_argument("--config", type=str, default="config.yaml", help="Path to configuration file")
-    parser.add_argument("--mode", type=str, default="auto", choices=["single", "multi", "auto"], help="Agent mode")
+    parser.add_argument("--mode", type=str, choices=["single", "multi", "auto"], help="Agent mode (defaults to agent.mode in the config)")
     parser.add_argument("--task", type=str, help="Task description")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    parser.add_argument("--batch", type=str, help="Run tasks from a JSONL or text file ('-' for stdin)")
+    parser.add_argument("--output", type=str, default="-", help="Batch results file ('-' for stdout)")
+    parser.add_argument("--workers", type=int, default=4, help="Number of batch workers")
+    parser.add_argument("--executor", type=str, default="thread", choices=["thread", "process"], help="Batch worker pool type")
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the result cache")
+    parser.add_argument("--refresh", action="store_true", help="Re-run tasks and overwrite their cached results")
     
     args = parser.parse_args()
     
+    # Load environment variables
+    env_loaded = load_environment()
+    
+    from anus.ui.cli import CLI
+    
     # Initialize the CLI
     cli = CLI(verbose=args.verbose)
     
-    # Display welcome message
-    cli.display_welcome()
+    # Display welcome message; batch output on stdout must stay pure JSONL
+    if not args.batch:
+        cli.display_welcome()
     
-    # Check if OpenAI API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
+    # Check if OpenAI API key is available, unless calls are replayed from a cassette
+    if not os.environ.get("OPENAI_API_KEY") and needs_api_key(args.config):
         cli.display_error("OpenAI API key not found in environment variables or .env file.")
         cli.display_message("Please set your API key by either:")
         cli.display_message("1. Creating a .env file in the project root with OPENAI_API_KEY=your_key")
         cli.display_message("2. Setting the OPENAI_API_KEY environment variable directly")
         sys.exit(1)
     
-    # Initialize the agent orchestrator
-    orchestrator = AgentOrchestrator(config_path=args.config)
+    setup_logging(args.config)
     
-    # If task is provided as argument, execute it
-    if args.task:
-        result = orchestrator.execute_task(args.task, mode=args.mode)
-        cli.display_result(result)
+    # Batch mode builds its own orchestrator per worker process
+    if args.batch:
+        run_batch(args, cli)
         return
     
-    # Otherwise, start interactive mode
-    cli.start_interactive_mode(orchestrator)
+    # Initialize the agent orchestrator
+    from anus.core.orchestrator import AgentOrchestrator
+    orchestrator = AgentOrchestrator(config_path=args.config, use_cache=not args.no_cache)
+    
+    try:
+        # If task is provided as argument, execute it
+        if args.task:
+            cli.display_stream(orchestrator.execute_stream(args.task, mode=args.mode, refresh=args.refresh))
+            return
+        
+        # Otherwise, start interactive mode
+        cli.start_interactive_mode(orchestrator)
+    finally:
+        # Stop tool workers and flush caches, checkpoints and cassettes
+        orchestrator.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,7 +2,8 @@
 Tools module for the ANUS framework.
 
 This module contains various tools that can be used by agents to interact with 
-the environment and perform tasks.
+the environment and perform tasks. Tools are looked up through the registry in
+`anus.tools.registry`, which imports each tool only when it is first used.
 """
 
-__all__ = ["calculator", "search", "text", "code"]
\ No newline at end of file
+__all__ = ["calculator", "registry"]
@@ -2,12 +2,646 @@
 Calculator tool for basic arithmetic operations.
 
 This tool provides safe evaluation of mathematical expressions.
+Expressions are parsed with `ast`, checked against a whitelist of node
+types, and compiled once into a tree of closures. Compiled programs are
+kept in a size-bounded LRU cache keyed by the normalized expression, so
+repeated calculations skip parsing entirely.
+
+Evaluation is cost-bounded: the size of big-integer products, powers and
+factorials is estimated before they are computed, and expressions that
+are too long, too large or too slow are rejected with an error result
+instead of stalling the calling thread.
 """
 
 import logging
 import ast
+import math
 import operator
-from typing import Dict, Any, Union
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Any, Union, Callable, Optional, List, Mapping, Sequence, Tuple
+
+Number = Union[int, float]
+
+# Maximum number of compiled expressions kept in the cache
+CACHE_SIZE = 4096
+
+# Default evaluation budgets
+DEFAULT_MAX_LENGTH = 10000
+DEFAULT_MAX_STEPS = 1000
+DEFAULT_MAX_BITS = 10000
+DEFAULT_MAX_TIME = 1.0
+
+# Operands below this size are cheap enough to skip the wall-time check
+_CHEAP_BITS = 64
+
+class CalculationLimitError(ValueError):
+    """Raised when an expression exceeds one of the evaluation budgets."""
+
+class _EvalState:
+    """
+    Per-call evaluation budget shared by the closures of a program.
+    
+    The wall-time clock starts at the first expensive operation; everything
+    before it is bounded by the step budget and costs microseconds.
+    """
+    
+    __slots__ = ("max_bits", "max_time", "deadline", "variables")
+    
+    def __init__(
+        self,
+        max_bits: Optional[int],
+        max_time: Optional[float],
+        variables: Optional[Dict[str, Number]] = None
+    ):
+        self.max_bits = max_bits
+        self.max_time = max_time
+        self.deadline = None
+        self.variables = variables
+    
+    def lookup(self, name: str) -> Number:
+        """Return the value bound to a variable name."""
+        try:
+            value = self.variables[name]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unknown name: {name}")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Variable {name} must be a number, got {type(value).__name__}")
+        return value
+    
+    def check_bits(self, bits: float) -> None:
+        """Reject a result that would be larger than the bit budget."""
+        if self.max_bits is not None and bits > self.max_bits:
+            raise CalculationLimitError(
+                f"Result would have about {int(bits)} bits, exceeding the limit of {self.max_bits}"
+            )
+    
+    def check_time(self) -> None:
+        """Reject further work once the wall-time budget is spent."""
+        if self.max_time is None:
+            return
+        now = time.perf_counter()
+        if self.deadline is None:
+            self.deadline = now + self.max_time
+        elif now > self.deadline:
+            raise CalculationLimitError(f"Evaluation exceeded the time limit of {self.max_time} seconds")
+
+Program = Callable[[_EvalState], Number]
+
+def _checked_mul(a: Number, b: Number, state: _EvalState) -> Number:
+    """Multiply, refusing integer products that would exceed the bit budget."""
+    if type(a) is int and type(b) is int:
+        bits_a, bits_b = a.bit_length(), b.bit_length()
+        if bits_a > _CHEAP_BITS or bits_b > _CHEAP_BITS:
+            state.check_bits(bits_a + bits_b - 1)
+            state.check_time()
+    return a * b
+
+def _checked_pow(a: Number, b: Number, state: _EvalState) -> Number:
+    """Exponentiate, refusing integer powers that would exceed the bit budget."""
+    if type(a) is int and type(b) is int and b > 1 and abs(a) > 1:
+        bits = b * math.log2(abs(a))
+        if bits > _CHEAP_BITS:
+            state.check_bits(bits)
+            state.check_time()
+    return a ** b
+
+def _checked_factorial(n: Number, state: _EvalState) -> int:
+    """Compute a factorial, refusing results that would exceed the bit budget."""
+    if type(n) is int and n > 20:
+        state.check_bits(math.lgamma(n + 1) / math.log(2))
+        state.check_time()
+    return math.factorial(n)
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: _checked_mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _checked_pow,
+}
+
+# Operators that need the evaluation state to enforce budgets
+_CHECKED_OPERATORS = {_checked_mul, _checked_pow}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+_FUNCTIONS = {
+    "abs": abs,
+    "round": round,
+    "min": min,
+    "max": max,
+    "sqrt": math.sqrt,
+    "exp": math.exp,
+    "log": math.log,
+    "log10": math.log10,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "factorial": _checked_factorial,
+}
+
+_CHECKED_FUNCTIONS = {_checked_factorial}
+
+_CONSTANTS = {
+    "pi": math.pi,
+    "e": math.e,
+}
+
+def normalize_expression(expression: str) -> str:
+    """
+    Normalize an expression for use as a cache key.
+    
+    Args:
+        expression: The raw expression.
+        
+    Returns:
+        The expression with surrounding whitespace removed and internal runs
+        of whitespace collapsed to a single space.
+    """
+    return " ".join(expression.split())
+
+def _count_nodes(node: ast.AST) -> int:
+    """
+    Count the evaluation steps of an expression tree.
+    
+    Args:
+        node: The root of the tree.
+        
+    Returns:
+        The number of nodes in the tree.
+    """
+    return sum(1 for _ in ast.walk(node))
+
+def _compile_node(node: ast.AST) -> Program:
+    """
+    Compile a whitelisted AST node into a closure.
+    
+    Args:
+        node: The node to compile.
+        
+    Returns:
+        A callable that evaluates the node under an evaluation state.
+        
+    Raises:
+        ValueError: If the node uses a construct outside the whitelist.
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Unsupported constant: {value!r}")
+        return lambda state: value
+    
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        if op in _CHECKED_OPERATORS:
+            return lambda state: op(left(state), right(state), state)
+        return lambda state: op(left(state), right(state))
+    
+    if isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+        operand = _compile_node(node.operand)
+        return lambda state: op(operand(state))
+    
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in _CONSTANTS:
+            value = _CONSTANTS[name]
+            return lambda state: value
+        return lambda state: state.lookup(name)
+    
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS:
+            raise ValueError(f"Unsupported function: {ast.unparse(node.func)}")
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported")
+        func = _FUNCTIONS[node.func.id]
+        args = tuple(_compile_node(arg) for arg in node.args)
+        if func in _CHECKED_FUNCTIONS:
+            return lambda state: func(*[arg(state) for arg in args], state)
+        return lambda state: func(*[arg(state) for arg in args])
+    
+    raise ValueError(f"Unsupported expression: {type(node).__name__}")
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_normalized(expression: str) -> Program:
+    """
+    Parse and compile a normalized expression; results are cached.
+    
+    Args:
+        expression: A normalized expression.
+        
+    Returns:
+        The compiled program, with its step count in the `steps` attribute.
+    """
+    tree = ast.parse(expression, mode="eval")
+    program = _compile_node(tree.body)
+    program.steps = _count_nodes(tree.body)
+    return program
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expression: str) -> Program:
+    """
+    Compile an expression into a reusable program.
+    
+    Lookups are cached on the raw string first, so repeated identical inputs
+    do not even pay for normalization; spelling variants that normalize to
+    the same text share one compiled program.
+    
+    Args:
+        expression: The mathematical expression to compile.
+        
+    Returns:
+        A callable taking an evaluation state and returning the value of the
+        expression. Its `steps` attribute holds the number of nodes evaluated.
+        
+    Raises:
+        SyntaxError: If the expression cannot be parsed.
+        ValueError: If the expression uses unsupported constructs.
+    """
+    return _compile_normalized(normalize_expression(expression))
+
+# ---------------------------------------------------------------------------
+# Vectorized evaluation
+#
+# A program compiled for NumPy evaluates one expression over whole columns of
+# variable bindings. It only trusts elements whose result is guaranteed to be
+# identical to the scalar evaluator; every other element is flagged "unsafe"
+# (possible int64 overflow, division by zero, non-finite results, domain
+# errors) and re-evaluated with the scalar program.
+# ---------------------------------------------------------------------------
+
+# Integers at or above this magnitude may overflow int64 in the next operation
+_VECTOR_INT_LIMIT = 2 ** 62
+
+# Largest integer that converts to float64 exactly
+_VECTOR_EXACT_FLOAT = 2 ** 53
+
+# Groups smaller than this are cheaper to evaluate with the scalar program
+VECTOR_MIN_SIZE = 16
+
+class _VectorFallback(Exception):
+    """Raised when an expression cannot be evaluated exactly with NumPy."""
+
+class _VectorState:
+    """Columns and the per-element unsafe mask for one vectorized evaluation."""
+    
+    __slots__ = ("np", "columns", "unsafe")
+    
+    def __init__(self, np, columns: Dict[str, Any], size: int):
+        self.np = np
+        self.columns = columns
+        self.unsafe = np.zeros(size, dtype=bool)
+
+VectorProgram = Callable[[_VectorState], Any]
+
+def _import_numpy():
+    """
+    Import NumPy on first use so that scalar-only users never pay for it.
+    
+    Returns:
+        The numpy module.
+    """
+    import numpy
+    return numpy
+
+def _is_int(np, x) -> bool:
+    """Return True if a NumPy value has an integer dtype."""
+    return np.asarray(x).dtype.kind == "i"
+
+def _vector_add(a, b, vs: _VectorState):
+    np = vs.np
+    if _is_int(np, a) and _is_int(np, b):
+        vs.unsafe |= (np.abs(a) >= _VECTOR_INT_LIMIT // 2) | (np.abs(b) >= _VECTOR_INT_LIMIT // 2)
+    return np.add(a, b)
+
+def _vector_sub(a, b, vs: _VectorState):
+    np = vs.np
+    if _is_int(np, a) and _is_int(np, b):
+        vs.unsafe |= (np.abs(a) >= _VECTOR_INT_LIMIT // 2) | (np.abs(b) >= _VECTOR_INT_LIMIT // 2)
+    return np.subtract(a, b)
+
+def _vector_mul(a, b, vs: _VectorState):
+    np = vs.np
+    if _is_int(np, a) and _is_int(np, b):
+        vs.unsafe |= np.abs(np.multiply(a, b, dtype=np.float64)) >= _VECTOR_INT_LIMIT
+    return np.multiply(a, b)
+
+def _vector_truediv(a, b, vs: _VectorState):
+    np = vs.np
+    zero = b == 0
+    vs.unsafe |= zero
+    if _is_int(np, a):
+        vs.unsafe |= np.abs(a) > _VECTOR_EXACT_FLOAT
+    if _is_int(np, b):
+        vs.unsafe |= np.abs(b) > _VECTOR_EXACT_FLOAT
+    return np.true_divide(a, np.where(zero, 1, b))
+
+def _vector_floordiv(a, b, vs: _VectorState):
+    np = vs.np
+    zero = b == 0
+    vs.unsafe |= zero
+    return np.floor_divide(a, np.where(zero, 1, b))
+
+def _vector_mod(a, b, vs: _VectorState):
+    np = vs.np
+    zero = b == 0
+    vs.unsafe |= zero
+    return np.remainder(a, np.where(zero, 1, b))
+
+def _vector_pow(a, b, vs: _VectorState):
+    np = vs.np
+    if _is_int(np, a) and _is_int(np, b):
+        # Negative exponents produce floats in Python; large results overflow
+        risky = (b < 0) | (
+            np.power(np.abs(a).astype(np.float64), np.maximum(b, 0).astype(np.float64)) >= _VECTOR_INT_LIMIT
+        )
+        vs.unsafe |= risky
+        return np.power(a, np.where(risky, 0, b))
+    # Float powers go through CPython's pow to match the scalar result exactly
+    result = _apply_elementwise(operator.pow, (a, b), vs)
+    vs.unsafe |= ~np.isfinite(result)
+    return result
+
+def _vector_pos(a, vs: _VectorState):
+    return vs.np.positive(a)
+
+def _vector_neg(a, vs: _VectorState):
+    return vs.np.negative(a)
+
+def _vector_abs(a, vs: _VectorState):
+    return vs.np.abs(a)
+
+def _vector_sqrt(a, vs: _VectorState):
+    np = vs.np
+    result = np.sqrt(np.asarray(a, dtype=np.float64))
+    vs.unsafe |= ~np.isfinite(result)
+    return result
+
+def _vector_rounding(func_name: str):
+    """Build a vectorized floor, ceil or round that returns integers like Python."""
+    def apply(a, vs: _VectorState):
+        np = vs.np
+        if _is_int(np, a):
+            return a
+        rounded = getattr(np, func_name)(a)
+        risky = ~np.isfinite(rounded) | (np.abs(rounded) >= _VECTOR_INT_LIMIT)
+        vs.unsafe |= risky
+        return np.where(risky, 0, rounded).astype(np.int64)
+    return apply
+
+def _vector_extremum(reduce_name: str):
+    """Build a vectorized min or max over two or more arguments of one dtype."""
+    def apply(*args):
+        *values, vs = args
+        np = vs.np
+        if len({np.asarray(v).dtype.kind for v in values}) != 1:
+            # Python keeps the type of the winning argument, NumPy promotes
+            raise _VectorFallback()
+        result = getattr(np, reduce_name).reduce(np.broadcast_arrays(*values))
+        # Python returns the first of several equal arguments, which matters for -0.0
+        vs.unsafe |= sum((v == result).astype(np.int64) for v in values) > 1
+        return result
+    return apply
+
+def _apply_elementwise(func: Callable[..., Number], args: Tuple[Any, ...], vs: _VectorState):
+    """
+    Apply a Python function to broadcast arguments one element at a time.
+    
+    Used where NumPy's vectorized implementation may differ from CPython's in
+    the last bit. Elements that raise, or that do not produce a float, are
+    flagged unsafe so the scalar evaluator reports them exactly.
+    """
+    np = vs.np
+    arrays = np.broadcast_arrays(*[np.asarray(arg) for arg in args])
+    shape = arrays[0].shape
+    columns = [array.reshape(-1).tolist() for array in arrays]
+    out = np.zeros(len(columns[0]), dtype=np.float64)
+    failed = np.zeros(len(columns[0]), dtype=bool)
+    for i, values in enumerate(zip(*columns)):
+        try:
+            value = func(*values)
+        except (ArithmeticError, ValueError):
+            failed[i] = True
+            continue
+        if type(value) is float:
+            out[i] = value
+        else:
+            failed[i] = True
+    vs.unsafe |= failed.reshape(shape)
+    return out.reshape(shape)
+
+def _vector_elementwise(func: Callable[[float], float]):
+    """Build a vectorized wrapper that applies a math function per element."""
+    def apply(a, vs: _VectorState):
+        return _apply_elementwise(func, (a,), vs)
+    return apply
+
+_VECTOR_BINARY_OPERATORS = {
+    ast.Add: _vector_add,
+    ast.Sub: _vector_sub,
+    ast.Mult: _vector_mul,
+    ast.Div: _vector_truediv,
+    ast.FloorDiv: _vector_floordiv,
+    ast.Mod: _vector_mod,
+    ast.Pow: _vector_pow,
+}
+
+_VECTOR_UNARY_OPERATORS = {
+    ast.UAdd: _vector_pos,
+    ast.USub: _vector_neg,
+}
+
+# Function name -> (allowed argument counts, implementation)
+_VECTOR_FUNCTIONS = {
+    "abs": ((1,), _vector_abs),
+    "sqrt": ((1,), _vector_sqrt),
+    "floor": ((1,), _vector_rounding("floor")),
+    "ceil": ((1,), _vector_rounding("ceil")),
+    "round": ((1,), _vector_rounding("rint")),
+    "min": (None, _vector_extremum("minimum")),
+    "max": (None, _vector_extremum("maximum")),
+    "exp": ((1,), _vector_elementwise(math.exp)),
+    "log": ((1,), _vector_elementwise(math.log)),
+    "log10": ((1,), _vector_elementwise(math.log10)),
+    "sin": ((1,), _vector_elementwise(math.sin)),
+    "cos": ((1,), _vector_elementwise(math.cos)),
+    "tan": ((1,), _vector_elementwise(math.tan)),
+}
+
+def _compile_vector_node(node: ast.AST) -> VectorProgram:
+    """
+    Compile a whitelisted AST node into a closure over NumPy columns.
+    
+    Args:
+        node: The node to compile.
+        
+    Returns:
+        A callable evaluating the node under a vector state.
+        
+    Raises:
+        _VectorFallback: If the node has no exact vectorized equivalent.
+    """
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise _VectorFallback()
+        if isinstance(value, int):
+            if abs(value) >= _VECTOR_INT_LIMIT:
+                raise _VectorFallback()
+            return lambda vs: vs.np.int64(value)
+        return lambda vs: vs.np.float64(value)
+    
+    if isinstance(node, ast.BinOp):
+        op = _VECTOR_BINARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise _VectorFallback()
+        left = _compile_vector_node(node.left)
+        right = _compile_vector_node(node.right)
+        return lambda vs: op(left(vs), right(vs), vs)
+    
+    if isinstance(node, ast.UnaryOp):
+        op = _VECTOR_UNARY_OPERATORS.get(type(node.op))
+        if op is None:
+            raise _VectorFallback()
+        operand = _compile_vector_node(node.operand)
+        return lambda vs: op(operand(vs), vs)
+    
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in _CONSTANTS:
+            value = _CONSTANTS[name]
+            return lambda vs: vs.np.float64(value)
+        
+        def lookup(vs: _VectorState):
+            try:
+                return vs.columns[name]
+            except KeyError:
+                raise _VectorFallback()
+        return lookup
+    
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _VECTOR_FUNCTIONS or node.keywords:
+            raise _VectorFallback()
+        arities, func = _VECTOR_FUNCTIONS[node.func.id]
+        if arities is None and len(node.args) < 2 or arities is not None and len(node.args) not in arities:
+            raise _VectorFallback()
+        args = tuple(_compile_vector_node(arg) for arg in node.args)
+        return lambda vs: func(*[arg(vs) for arg in args], vs)
+    
+    raise _VectorFallback()
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_vector(expression: str) -> Optional[VectorProgram]:
+    """
+    Compile a normalized expression for vectorized evaluation; cached.
+    
+    Args:
+        expression: A normalized expression.
+        
+    Returns:
+        The vector program, or None if the expression has no exact
+        vectorized equivalent.
+    """
+    try:
+        return _compile_vector_node(ast.parse(expression, mode="eval").body)
+    except (SyntaxError, ValueError, RecursionError, _VectorFallback):
+        return None
+
+def _to_column(np, values: Any) -> Optional[Any]:
+    """
+    Convert a sequence of bindings into an int64 or float64 column.
+    
+    Args:
+        np: The numpy module.
+        values: A sequence or NumPy array of numbers.
+        
+    Returns:
+        A one-dimensional array, or None if the values cannot be represented
+        without changing how the scalar evaluator would treat them.
+    """
+    if isinstance(values, np.ndarray):
+        if values.ndim != 1:
+            return None
+        if values.dtype.kind == "i" or (values.dtype.kind == "u" and (values.size == 0 or values.max() < 2 ** 63)):
+            return values.astype(np.int64, copy=False)
+        if values.dtype.kind == "f":
+            return values.astype(np.float64, copy=False)
+        return None
+    
+    values = list(values)
+    if all(type(v) is int for v in values):
+        if any(abs(v) >= 2 ** 63 for v in values):
+            return None
+        return np.array(values, dtype=np.int64)
+    if all(type(v) is float for v in values):
+        return np.array(values, dtype=np.float64)
+    return None
+
+# Decimal numeric literals that are not part of a name or a longer literal
+_LITERAL_PATTERN = re.compile(r"(?<![\w.])(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?(?![\w.])")
+
+# Prefix of the placeholder names used for literals in templates
+_PLACEHOLDER_PREFIX = "__literal_"
+
+def _parameterize(expression: str) -> Optional[Tuple[str, Tuple[str, ...], Tuple[Number, ...]]]:
+    """
+    Replace the numeric literals of an expression with placeholder names.
+    
+    Expressions that differ only in their numbers, such as "3 * 4 + 1" and
+    "7 * 2 + 5", share a template and can be evaluated together. Integer
+    literals too large for an int64 column stay in the template as they are.
+    
+    Args:
+        expression: The raw expression.
+        
+    Returns:
+        A tuple of (template, placeholder names, literal values), or None if
+        the expression cannot be parameterized safely.
+    """
+    if _PLACEHOLDER_PREFIX in expression:
+        return None
+    
+    names: List[str] = []
+    values: List[Number] = []
+    
+    def replace(match: "re.Match") -> str:
+        token = match.group(0)
+        if "." in token or "e" in token or "E" in token:
+            value: Number = float(token)
+            kind = "f"
+        else:
+            if len(token) > 1 and token[0] == "0" and token.strip("0"):
+                # Leading zeros are a syntax error in Python 3 literals
+                raise _VectorFallback()
+            value = int(token)
+            if value >= 2 ** 63:
+                return token
+            kind = "i"
+        name = f"{_PLACEHOLDER_PREFIX}{kind}{len(names)}"
+        names.append(name)
+        values.append(value)
+        return name
+    
+    try:
+        template = _LITERAL_PATTERN.sub(replace, normalize_expression(expression))
+    except _VectorFallback:
+        return None
+    return template, tuple(names), tuple(values)
 
 class CalculatorTool:
     """
@@ -18,6 +652,8 @@ class CalculatorTool:
     
     name = "calculator"
     description = "Perform basic arithmetic calculations"
+    terminal = True
+    deterministic = True
     parameters = {
         "type": "object",
         "properties": {
@@ -29,21 +665,131 @@ class CalculatorTool:
         "required": ["expression"]
     }
     
-    def execute(self, expression: str) -> Dict[str, Any]:
+    def __init__(
+        self,
+        max_length: Optional[int] = DEFAULT_MAX_LENGTH,
+        max_steps: Optional[int] = DEFAULT_MAX_STEPS,
+        max_bits: Optional[int] = DEFAULT_MAX_BITS,
+        max_time: Optional[float] = DEFAULT_MAX_TIME
+    ):
+        """
+        Initialize a CalculatorTool instance.
+        
+        Any budget set to None is not enforced.
+        
+        Args:
+            max_length: Maximum length of an expression in characters.
+            max_steps: Maximum number of evaluation steps (AST nodes).
+            max_bits: Maximum size in bits of any integer product, power or
+                factorial computed while evaluating.
+            max_time: Maximum wall time in seconds spent evaluating.
+        """
+        self.max_length = max_length
+        self.max_steps = max_steps
+        self.max_bits = max_bits
+        self.max_time = max_time
+    
+    def _compile(self, expression: str, check_length: bool = True) -> Program:
+        """
+        Compile an expression and check it against the static budgets.
+        
+        Args:
+            expression: The mathematical expression to compile.
+            check_length: Whether to enforce the length budget.
+            
+        Returns:
+            The compiled program.
+            
+        Raises:
+            CalculationLimitError: If the expression is too long or too large.
+        """
+        if check_length and self.max_length is not None and len(expression) > self.max_length:
+            raise CalculationLimitError(
+                f"Expression is {len(expression)} characters long, exceeding the limit of {self.max_length}"
+            )
+        try:
+            program = compile_expression(expression)
+        except RecursionError:
+            raise CalculationLimitError("Expression is nested too deeply")
+        if self.max_steps is not None and program.steps > self.max_steps:
+            raise CalculationLimitError(
+                f"Expression has {program.steps} steps, exceeding the limit of {self.max_steps}"
+            )
+        return program
+    
+    def _evaluate(self, expression: str, variables: Optional[Dict[str, Number]] = None) -> Number:
+        """
+        Evaluate an expression within the configured budgets.
+        
+        Args:
+            expression: The mathematical expression to evaluate.
+            variables: Optional values for the names used in the expression.
+            
+        Returns:
+            The value of the expression.
+            
+        Raises:
+            CalculationLimitError: If a budget would be exceeded.
+        """
+        program = self._compile(expression)
+        return program(_EvalState(self.max_bits, self.max_time, variables))
+    
+    def _evaluate_columns(
+        self,
+        expression: str,
+        columns: Dict[str, Any],
+        size: int
+    ) -> Optional[Tuple[List[Number], List[bool]]]:
+        """
+        Evaluate an expression over NumPy columns of variable bindings.
+        
+        Args:
+            expression: The mathematical expression to evaluate.
+            columns: One-dimensional int64 or float64 arrays keyed by name.
+            size: The number of rows.
+            
+        Returns:
+            A tuple of (values, unsafe), where unsafe marks the rows whose value
+            must be recomputed with the scalar evaluator, or None if the whole
+            expression has to be evaluated row by row.
+        """
+        if self.max_bits is not None and self.max_bits < _CHEAP_BITS:
+            # int64 results could already break the bit budget
+            return None
+        program = _compile_vector(normalize_expression(expression))
+        if program is None:
+            return None
+        
+        np = _import_numpy()
+        state = _VectorState(np, columns, size)
+        for column in columns.values():
+            if column.dtype.kind == "f":
+                state.unsafe |= ~np.isfinite(column)
+        try:
+            with np.errstate(all="ignore"):
+                result = np.asarray(program(state))
+        except (_VectorFallback, ArithmeticError, ValueError, TypeError):
+            return None
+        
+        if result.dtype.kind == "f":
+            state.unsafe |= ~np.isfinite(result)
+        elif result.dtype.kind != "i":
+            return None
+        return np.broadcast_to(result, (size,)).tolist(), state.unsafe.tolist()
+    
+    def execute(self, expression: str, variables: Optional[Dict[str, Number]] = None) -> Dict[str, Any]:
         """
         Execute the calculator tool with the given expression.
         
         Args:
             expression: The mathematical expression to evaluate.
+            variables: Optional values for the names used in the expression.
             
         Returns:
             A dictionary containing the result of the calculation.
         """
         try:
-            # Simple implementation for demo
-            # WARNING: eval is used here for demo purposes only
-            # In a real implementation, use a safer method
-            result = str(eval(expression))
+            result = str(self._evaluate(expression, variables))
             return {
                 "expression": expression,
                 "result": result,
@@ -54,4 +800,115 @@ class CalculatorTool:
                 "expression": expression,
                 "error": str(e),
                 "status": "error"
-            }
\ No newline at end of file
+            }
+    
+    def execute_template(self, expression: str, bindings: Mapping[str, Sequence[Number]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate one expression over columns of variable bindings.
+        
+        The expression is compiled once and, for large enough inputs, evaluated
+        with NumPy over whole columns. Row i of the result equals
+        `execute(expression, {name: column[i] for each column})`, including
+        per-row error results; NumPy arrays are compared through their Python
+        values (`tolist()`).
+        
+        Args:
+            expression: The mathematical expression to evaluate.
+            bindings: Sequences or NumPy arrays of equal length, keyed by
+                variable name.
+            
+        Returns:
+            A list with one result dictionary per row.
+            
+        Raises:
+            ValueError: If the binding columns differ in length.
+        """
+        lengths = {len(values) for values in bindings.values()}
+        if len(lengths) > 1:
+            raise ValueError("All binding columns must have the same length")
+        size = lengths.pop() if lengths else 1
+        
+        try:
+            self._compile(expression)
+        except Exception as e:
+            return [{"expression": expression, "error": str(e), "status": "error"} for _ in range(size)]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * size
+        if size >= VECTOR_MIN_SIZE and bindings:
+            np = _import_numpy()
+            columns = {name: _to_column(np, values) for name, values in bindings.items()}
+            if all(column is not None for column in columns.values()):
+                evaluated = self._evaluate_columns(expression, columns, size)
+                if evaluated is not None:
+                    values, unsafe = evaluated
+                    for i in range(size):
+                        if not unsafe[i]:
+                            results[i] = {"expression": expression, "result": str(values[i]), "status": "success"}
+        
+        # Rows the vectorized path could not vouch for take the scalar path
+        rows = None
+        for i in range(size):
+            if results[i] is None:
+                if rows is None:
+                    rows = {
+                        name: values.tolist() if hasattr(values, "tolist") else list(values)
+                        for name, values in bindings.items()
+                    }
+                results[i] = self.execute(expression, {name: column[i] for name, column in rows.items()})
+        return results
+    
+    def execute_batch(self, expressions: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Execute many expressions at once.
+        
+        Expressions that differ only in their numeric literals share a template
+        that is compiled once and evaluated over NumPy columns of the literal
+        values. The results are identical to calling `execute` on each
+        expression in turn.
+        
+        Args:
+            expressions: The mathematical expressions to evaluate.
+            
+        Returns:
+            A list with one result dictionary per expression, in input order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(expressions)
+        
+        # Group expressions by template
+        groups: Dict[str, Tuple[Tuple[str, ...], List[int], List[Tuple[Number, ...]]]] = {}
+        for i, expression in enumerate(expressions):
+            if self.max_length is not None and len(expression) > self.max_length:
+                continue
+            parameterized = _parameterize(expression)
+            if parameterized is None:
+                continue
+            template, names, values = parameterized
+            group = groups.setdefault(template, (names, [], []))
+            group[1].append(i)
+            group[2].append(values)
+        
+        for template, (names, indices, rows) in groups.items():
+            if len(indices) < VECTOR_MIN_SIZE:
+                continue
+            try:
+                self._compile(template, check_length=False)
+            except Exception:
+                continue
+            
+            np = _import_numpy()
+            columns = {
+                name: np.array(column, dtype=np.float64 if name[len(_PLACEHOLDER_PREFIX)] == "f" else np.int64)
+                for name, column in zip(names, zip(*rows))
+            } if names else {}
+            evaluated = self._evaluate_columns(template, columns, len(indices))
+            if evaluated is None:
+                continue
+            values, unsafe = evaluated
+            for j, i in enumerate(indices):
+                if not unsafe[j]:
+                    results[i] = {"expression": expressions[i], "result": str(values[j]), "status": "success"}
+        
+        for i, expression in enumerate(expressions):
+            if results[i] is None:
+                results[i] = self.execute(expression)
+        return results
@@ -0,0 +1,211 @@
+"""
+Tool registry for the ANUS framework.
+
+The registry maps tool names to import paths and creates each tool the
+first time it is used, so that importing ANUS or constructing an agent
+costs the same however many tools are installed. Third-party packages can
+contribute tools through the `anus.tools` entry point group, e.g.:
+
+    [project.entry-points."anus.tools"]
+    weather = "my_package.weather:WeatherTool"
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Entry point group scanned for third-party tools
+ENTRY_POINT_GROUP = "anus.tools"
+
+# Tools shipped with ANUS, as "module:attribute" import paths
+BUILTIN_TOOLS = {
+    "calculator": "anus.tools.calculator:CalculatorTool",
+}
+
+ToolSpec = Union[str, Callable[[], Any]]
+
+# Class-level tool declarations that stand-ins for a tool copy from it
+TOOL_FLAGS = ("terminal", "deterministic")
+
+def import_spec(spec: str) -> Any:
+    """
+    Import the object a "module:attribute" path names.
+    
+    Args:
+        spec: The import path.
+        
+    Returns:
+        The named object, usually a tool class.
+        
+    Raises:
+        ImportError: If the module cannot be imported.
+        AttributeError: If the module has no such attribute.
+    """
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+class ToolRegistry:
+    """
+    A registry of tools that are imported and instantiated lazily.
+    
+    Each tool is created once per registry and shared by every agent that
+    uses it, so tools must be safe to call concurrently.
+    """
+    
+    def __init__(self, specs: Optional[Dict[str, ToolSpec]] = None, discover: bool = True):
+        """
+        Initialize a ToolRegistry instance.
+        
+        Args:
+            specs: Tools to register, mapping names to "module:attribute"
+                import paths or to factories. Defaults to the built-in tools.
+            discover: Whether to look up unknown names in the `anus.tools`
+                entry point group.
+        """
+        self._specs: Dict[str, ToolSpec] = dict(BUILTIN_TOOLS if specs is None else specs)
+        self._instances: Dict[str, Any] = {}
+        self._discover = discover
+        self._discovered = False
+        self._missing: Set[str] = set()
+        self._lock = threading.RLock()
+    
+    def register(self, name: str, spec: ToolSpec) -> None:
+        """
+        Register a tool.
+        
+        Args:
+            name: The name agents use for the tool.
+            spec: A "module:attribute" import path, a tool class, or any
+                zero-argument factory returning a tool instance.
+        """
+        with self._lock:
+            self._specs[name] = spec
+            self._instances.pop(name, None)
+            self._missing.discard(name)
+    
+    def register_instance(self, name: str, tool: Any) -> None:
+        """
+        Register an already constructed tool instance.
+        
+        Args:
+            name: The name agents use for the tool.
+            tool: The tool instance.
+        """
+        with self._lock:
+            self._specs[name] = lambda: tool
+            self._instances[name] = tool
+            self._missing.discard(name)
+    
+    def _discover_entry_points(self) -> None:
+        """Add the tools advertised through entry points, once."""
+        if self._discovered or not self._discover:
+            return
+        self._discovered = True
+        try:
+            from importlib.metadata import entry_points
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                self._specs.setdefault(entry_point.name, entry_point.value)
+        except Exception as e:
+            logger.error("Failed to discover tools from entry points: %s", e)
+    
+    def has(self, name: str) -> bool:
+        """
+        Check whether a tool is known, without importing it.
+        
+        Args:
+            name: The name of the tool.
+            
+        Returns:
+            True if the tool is registered or advertised by an entry point.
+        """
+        if name in self._specs:
+            return True
+        with self._lock:
+            self._discover_entry_points()
+            if name in self._specs:
+                return True
+            if name not in self._missing:
+                self._missing.add(name)
+                logger.warning("Tool %s is not available", name)
+            return False
+    
+    def available(self) -> List[str]:
+        """
+        List the names of all known tools.
+        
+        Returns:
+            The sorted tool names.
+        """
+        with self._lock:
+            self._discover_entry_points()
+            return sorted(self._specs)
+    
+    def spec(self, name: str) -> ToolSpec:
+        """
+        Return how a tool is created, without importing it.
+        
+        Args:
+            name: The name of the tool.
+            
+        Returns:
+            The "module:attribute" import path or factory of the tool.
+            
+        Raises:
+            KeyError: If the tool is not known.
+        """
+        with self._lock:
+            if not self.has(name):
+                raise KeyError(f"Unknown tool: {name}")
+            return self._specs[name]
+    
+    def get(self, name: str) -> Any:
+        """
+        Return the shared instance of a tool, importing it on first use.
+        
+        Args:
+            name: The name of the tool.
+            
+        Returns:
+            The tool instance.
+            
+        Raises:
+            KeyError: If the tool is not known.
+            ImportError: If the tool's module cannot be imported.
+        """
+        tool = self._instances.get(name)
+        if tool is not None:
+            return tool
+        
+        with self._lock:
+            tool = self._instances.get(name)
+            if tool is not None:
+                return tool
+            if not self.has(name):
+                raise KeyError(f"Unknown tool: {name}")
+            
+            spec = self._specs[name]
+            if isinstance(spec, str):
+                spec = import_spec(spec)
+            tool = spec()
+            self._instances[name] = tool
+            return tool
+
+_default_registry: Optional[ToolRegistry] = None
+_default_lock = threading.Lock()
+
+def get_registry() -> ToolRegistry:
+    """
+    Return the process-wide default tool registry.
+    
+    Returns:
+        The shared ToolRegistry instance.
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = ToolRegistry()
+    return _default_registry
@@ -0,0 +1,475 @@
+"""
+Sandboxed tool execution for the ANUS framework.
+
+A SandboxPool runs tool calls in a pool of worker processes that import
+and create their tools once, when they start, so a call costs a round trip
+over a pipe rather than a process start. Each worker runs under memory and
+CPU limits, and the pool kills workers that exceed the call timeout, so a
+runaway call can only take its own worker down. Workers are replaced after
+a number of calls, or once their memory use has grown too much, to bound
+leaks.
+
+Calls and results travel with pickle protocol 5: large buffers such as
+NumPy arrays are sent as separate messages straight from their memory,
+without being copied into the pickle stream.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import queue
+import struct
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from anus.tools.registry import TOOL_FLAGS, import_spec
+
+logger = logging.getLogger(__name__)
+
+# Seconds a worker is given to exit before it is killed
+_STOP_TIMEOUT = 1.0
+
+def _send(conn: Any, obj: Any) -> None:
+    """
+    Send an object over a pipe, passing large buffers out of band.
+    
+    Args:
+        conn: The sending end of the pipe.
+        obj: The object to send.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    # Sent on its own, so that no message is copied to prepend it
+    conn.send_bytes(struct.pack("!I", len(buffers)))
+    conn.send_bytes(data)
+    for buffer in buffers:
+        conn.send_bytes(buffer.raw())
+
+def _recv(conn: Any) -> Any:
+    """
+    Receive an object sent with `_send`.
+    
+    Out-of-band buffers are used in place, so arrays in the object are
+    read-only views of the received data.
+    
+    Args:
+        conn: The receiving end of the pipe.
+        
+    Returns:
+        The object.
+    """
+    count, = struct.unpack("!I", conn.recv_bytes())
+    data = conn.recv_bytes()
+    buffers = [conn.recv_bytes() for _ in range(count)]
+    return pickle.loads(data, buffers=buffers)
+
+def _apply_limits(max_memory: Optional[int]) -> None:
+    """
+    Limit the address space of the current process.
+    
+    Args:
+        max_memory: Maximum address space in bytes, or None for no limit.
+    """
+    if max_memory is None:
+        return
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+def _limit_cpu(max_cpu_seconds: Optional[float]) -> None:
+    """
+    Allow the current process at most a number of further CPU seconds.
+    
+    The process is killed by SIGXCPU when it goes over.
+    
+    Args:
+        max_cpu_seconds: CPU seconds allowed, or None for no limit.
+    """
+    if max_cpu_seconds is None:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = int(usage.ru_utime + usage.ru_stime + max_cpu_seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+def _peak_rss() -> int:
+    """
+    Return the peak resident memory of the current process.
+    
+    Returns:
+        The peak RSS in kilobytes, or 0 where it cannot be measured.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _worker_main(
+    conn: Any,
+    specs: Dict[str, str],
+    max_memory: Optional[int],
+    max_cpu_seconds: Optional[float]
+) -> None:
+    """
+    Serve tool calls from a pipe until told to stop.
+    
+    Args:
+        conn: The worker's end of the pipe.
+        specs: Tools to create, as "module:attribute" import paths by name.
+        max_memory: Address space limit in bytes.
+        max_cpu_seconds: CPU seconds allowed per call.
+    """
+    _apply_limits(max_memory)
+    
+    tools: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, spec in specs.items():
+        try:
+            tools[name] = import_spec(spec)()
+        except Exception as e:
+            errors[name] = f"Failed to load tool {name}: {e}"
+    
+    while True:
+        try:
+            message = _recv(conn)
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        name, kwargs = message
+        healthy = True
+        try:
+            if name not in tools:
+                raise RuntimeError(errors.get(name, f"Unknown tool: {name}"))
+            _limit_cpu(max_cpu_seconds)
+            tool = tools[name]
+            if getattr(tool, "is_async", False):
+                result = asyncio.run(tool.aexecute(**kwargs))
+            else:
+                result = tool.execute(**kwargs)
+        except MemoryError:
+            # The heap may be in a bad state; ask to be replaced
+            healthy = False
+            result = {"status": "error", "error": f"Tool {name} ran out of memory"}
+        except Exception as e:
+            result = {"status": "error", "error": str(e)}
+        try:
+            _send(conn, (result, _peak_rss(), healthy))
+        except (EOFError, OSError):
+            return
+        except Exception as e:
+            # The result could not be pickled
+            _send(conn, ({"status": "error", "error": f"Tool {name} returned an unsendable result: {e}"}, _peak_rss(), healthy))
+
+class _Worker:
+    """A worker process and the parent's end of its pipe."""
+    
+    __slots__ = ("process", "conn", "calls", "baseline_rss")
+    
+    def __init__(self, context: Any, specs: Dict[str, str], max_memory: Optional[int], max_cpu_seconds: Optional[float]):
+        """Start the worker process; it loads its tools in the background."""
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, specs, max_memory, max_cpu_seconds),
+            name="anus-tool-worker",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.calls = 0
+        self.baseline_rss: Optional[int] = None
+    
+    def call(self, name: str, kwargs: Dict[str, Any], timeout: Optional[float]) -> Tuple[Dict[str, Any], int, bool]:
+        """
+        Run a tool call on the worker.
+        
+        Args:
+            name: The name of the tool.
+            kwargs: Keyword arguments for the tool.
+            timeout: Seconds to wait for the result, or None to wait forever.
+            
+        Returns:
+            The tool's result, the worker's peak RSS in kilobytes, and
+            whether the worker can be reused.
+            
+        Raises:
+            TimeoutError: If the call takes longer than the timeout.
+            EOFError: If the worker died during the call.
+        """
+        _send(self.conn, (name, kwargs))
+        if not self.conn.poll(timeout):
+            raise TimeoutError
+        self.calls += 1
+        return _recv(self.conn)
+    
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            _send(self.conn, None)
+        except (EOFError, OSError):
+            pass
+        self.process.join(_STOP_TIMEOUT)
+        self.kill()
+    
+    def kill(self) -> None:
+        """Kill the worker right away."""
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+class SandboxPool:
+    """
+    A pool of prewarmed worker processes that run tool calls in isolation.
+    
+    Calls block while every worker is busy, so the pool size also caps the
+    number of tool calls running at once. A call that times out, crashes
+    its worker or exceeds the worker's limits returns an error result like
+    any failed tool call, and the worker is replaced.
+    """
+    
+    def __init__(
+        self,
+        specs: Dict[str, str],
+        workers: int = 2,
+        timeout: Optional[float] = 10.0,
+        max_memory_mb: Optional[int] = 1024,
+        max_cpu_seconds: Optional[float] = 5.0,
+        max_calls: Optional[int] = 500,
+        max_rss_growth_mb: Optional[int] = 200
+    ):
+        """
+        Initialize a SandboxPool instance and start its workers.
+        
+        Args:
+            specs: Tools the workers provide, as "module:attribute" import
+                paths by name.
+            workers: Number of worker processes.
+            timeout: Default wall-time limit per call in seconds.
+            max_memory_mb: Address space limit of each worker.
+            max_cpu_seconds: CPU time limit per call; a worker that goes
+                over is killed by the operating system.
+            max_calls: Calls after which a worker is replaced.
+            max_rss_growth_mb: Growth of a worker's peak memory since its
+                first call after which it is replaced.
+        """
+        if workers < 1:
+            raise ValueError("A sandbox pool needs at least one worker")
+        self.specs = dict(specs)
+        self.timeout = timeout
+        self.max_memory = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+        self.max_cpu_seconds = max_cpu_seconds
+        self.max_calls = max_calls
+        self.max_rss_growth = max_rss_growth_mb * 1024 if max_rss_growth_mb else None
+        methods = multiprocessing.get_all_start_methods()
+        # Forking the main process is unsafe once it runs threads
+        self._context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        # Idle workers, then None once the pool is closed
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers: List[_Worker] = []
+        for _ in range(workers):
+            self._idle.put(self._start_worker())
+    
+    def _start_worker(self) -> _Worker:
+        """Start a worker process and keep track of it."""
+        worker = _Worker(self._context, self.specs, self.max_memory, self.max_cpu_seconds)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+    
+    def _retire(self, worker: _Worker, kill: bool = False) -> None:
+        """
+        Stop a worker and forget it.
+        
+        Args:
+            worker: The worker to stop.
+            kill: Whether to kill it without waiting for it to exit.
+        """
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        if kill:
+            worker.kill()
+        else:
+            worker.stop()
+    
+    def _needs_recycling(self, worker: _Worker, rss: int) -> bool:
+        """
+        Decide whether a worker should be replaced after a call.
+        
+        Args:
+            worker: The worker.
+            rss: Its peak RSS in kilobytes after the call.
+            
+        Returns:
+            True if the worker has served enough calls or grown too much.
+        """
+        if worker.baseline_rss is None:
+            worker.baseline_rss = rss
+        if self.max_calls is not None and worker.calls >= self.max_calls:
+            return True
+        return self.max_rss_growth is not None and rss - worker.baseline_rss > self.max_rss_growth
+    
+    def call(self, name: str, kwargs: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run a tool call on a worker.
+        
+        Args:
+            name: The name of the tool.
+            kwargs: Keyword arguments for the tool.
+            timeout: Wall-time limit for this call. Defaults to the pool's.
+            
+        Returns:
+            The tool's result, or an error result if the call failed.
+            
+        Raises:
+            RuntimeError: If the pool is closed, including while the call
+                waits for a worker.
+        """
+        if self._closed:
+            raise RuntimeError("Sandbox pool is closed")
+        timeout = self.timeout if timeout is None else timeout
+        worker = self._idle.get()
+        if worker is None:
+            # Pass the close marker on to the next waiting call
+            self._idle.put(None)
+            raise RuntimeError("Sandbox pool is closed")
+        replace = False
+        try:
+            try:
+                result, rss, healthy = worker.call(name, kwargs, timeout)
+            except TimeoutError:
+                replace = True
+                logger.warning("Tool %s timed out after %s seconds; replacing its worker", name, timeout)
+                return {"status": "error", "error": f"Tool {name} timed out after {timeout} seconds"}
+            except (EOFError, OSError):
+                replace = True
+                worker.process.join(_STOP_TIMEOUT)
+                logger.warning("Tool %s crashed its worker (exit code %s)", name, worker.process.exitcode)
+                return {
+                    "status": "error",
+                    "error": f"Tool {name} crashed its worker (exit code {worker.process.exitcode})"
+                }
+            replace = not healthy or self._needs_recycling(worker, rss)
+            return result
+        finally:
+            if replace:
+                self._retire(worker, kill=True)
+                worker = None if self._closed else self._start_worker()
+            if worker is not None:
+                with self._lock:
+                    closed = self._closed
+                    if not closed:
+                        self._idle.put(worker)
+                if closed:
+                    self._retire(worker)
+    
+    def close(self) -> None:
+        """
+        Stop every worker; calls still running finish first, and calls
+        waiting for a worker raise RuntimeError.
+        """
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                self._retire(worker)
+        self._idle.put(None)
+    
+    def tool(self, name: str, spec: str) -> "SandboxedTool":
+        """
+        Create the stand-in agents use to call a tool in this pool.
+        
+        Args:
+            name: The name of the tool.
+            spec: The tool's "module:attribute" import path.
+            
+        Returns:
+            A SandboxedTool.
+        """
+        return SandboxedTool(name, self, import_spec(spec))
+
+class SandboxedTool:
+    """
+    Stands in for a tool whose calls run in a SandboxPool.
+    
+    It carries the flags of the real tool's class, such as `terminal` and
+    `deterministic`, and is asynchronous so that waiting for a worker never
+    blocks the event loop.
+    """
+    
+    is_async = True
+    
+    def __init__(self, name: str, pool: SandboxPool, tool_class: Any):
+        """
+        Initialize a SandboxedTool instance.
+        
+        Args:
+            name: The name of the tool.
+            pool: The pool that runs the calls.
+            tool_class: The real tool's class, read for its flags.
+        """
+        self.name = name
+        self.pool = pool
+        self.description = getattr(tool_class, "description", "")
+        for flag in TOOL_FLAGS:
+            setattr(self, flag, getattr(tool_class, flag, False))
+    
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        """Run the tool in the pool and return its result."""
+        return self.pool.call(self.name, kwargs)
+    
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        """Run the tool in the pool without blocking the event loop."""
+        return await asyncio.to_thread(self.pool.call, self.name, kwargs)
+
+def create_sandbox(registry: Any, names: Sequence[str], **options) -> SandboxPool:
+    """
+    Move tools of a registry into a new SandboxPool.
+    
+    Each named tool is registered again as a SandboxedTool, so agents using
+    the registry call it in the pool.
+    
+    Args:
+        registry: The ToolRegistry to update.
+        names: Tools to sandbox. Unknown tools are skipped; tools registered
+            with a factory rather than an import path cannot be sandboxed.
+        **options: Options for SandboxPool.
+        
+    Returns:
+        The started pool.
+        
+    Raises:
+        ValueError: If a tool is registered with a factory.
+    """
+    specs = {}
+    for name in names:
+        if not registry.has(name):
+            continue
+        spec = registry.spec(name)
+        if not isinstance(spec, str):
+            raise ValueError(f"Tool {name} is not registered with an import path and cannot be sandboxed")
+        specs[name] = spec
+    pool = SandboxPool(specs, **options)
+    for name, spec in specs.items():
+        registry.register_instance(name, pool.tool(name, spec))
+    return pool
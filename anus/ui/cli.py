@@ -3,7 +3,7 @@ Command-line interface for the ANUS framework.
 """
 
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 class CLI:
     """
@@ -20,6 +20,8 @@ class CLI:
             verbose: Whether to enable verbose output.
         """
         self.verbose = verbose
+        # Agent whose streamed thought is currently being printed
+        self._token_agent: Optional[str] = None
     
     def display_welcome(self):
         """
@@ -45,6 +47,111 @@ class CLI:
         else:
             print(result)
     
+    def display_event(self, event: Dict[str, Any]):
+        """
+        Display one event of a streamed task execution.
+        
+        Tokens are printed as they arrive; with verbose output, action
+        inputs and full observations are shown too.
+        
+        Args:
+            event: An event from `execute_stream`.
+        """
+        kind = event["type"]
+        agent = event.get("agent")
+        prefix = f"[{agent}] " if agent else ""
+        
+        if kind == "token":
+            if self._token_agent != agent:
+                if self._token_agent is not None:
+                    print()
+                print(f"{prefix}Thought: ", end="")
+                self._token_agent = agent
+            print(event["text"], end="", flush=True)
+            return
+        if self._token_agent is not None:
+            print()
+            streamed = self._token_agent == agent
+            self._token_agent = None
+            if kind == "thought" and streamed:
+                # Already printed token by token
+                return
+        
+        if kind == "thought":
+            print(f"{prefix}Thought: {event['text']}", flush=True)
+        elif kind == "action":
+            if self.verbose:
+                print(f"{prefix}Action: {event['name']} {event.get('input')}", flush=True)
+            else:
+                print(f"{prefix}Action: {event['name']}", flush=True)
+        elif kind == "observation":
+            observation = event["observation"]
+            if self.verbose:
+                print(f"{prefix}Observation: {observation}", flush=True)
+            else:
+                status = observation.get("status")
+                detail = observation.get("result") if status == "success" else observation.get("error")
+                print(f"{prefix}Observation: {status}" + (f" - {detail}" if detail is not None else ""), flush=True)
+        elif kind == "final":
+            self.display_result(event["result"])
+    
+    def display_stream(self, events: Iterable[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Display the events of a streamed task execution as they arrive.
+        
+        Args:
+            events: The events from `execute_stream`.
+            
+        Returns:
+            The result carried by the final event, or None if there was none.
+        """
+        result = None
+        self._token_agent = None
+        for event in events:
+            self.display_event(event)
+            if event["type"] == "final":
+                result = event["result"]
+        return result
+    
+    def display_message(self, message: str):
+        """
+        Display an informational message.
+        
+        Args:
+            message: The message to display.
+        """
+        print(message)
+    
+    def display_error(self, message: str):
+        """
+        Display an error message.
+        
+        Args:
+            message: The error message to display.
+        """
+        print(f"Error: {message}", file=sys.stderr)
+    
+    def display_batch_summary(self, stats: Dict[str, Any]):
+        """
+        Display the statistics of a batch run.
+        
+        The summary goes to stderr so it never mixes with results on stdout.
+        
+        Args:
+            stats: The statistics returned by the batch runner.
+        """
+        print(
+            f"\nBatch complete: {stats['tasks']} tasks, {stats['errors']} errors "
+            f"in {stats['elapsed']:.2f}s",
+            file=sys.stderr
+        )
+        print(
+            f"Throughput: {stats['throughput']:.2f} tasks/s | "
+            f"p50 latency: {stats['p50_latency'] * 1000:.1f} ms | "
+            f"p99 latency: {stats['p99_latency'] * 1000:.1f} ms",
+            file=sys.stderr
+        )
+    
     def start_interactive_mode(self, orchestrator):
         """
         Start an interactive session with the agent orchestrator.
@@ -66,12 +173,9 @@ class CLI:
                 if not user_input.strip():
                     continue
                 
-                # Process the task
+                # Process the task, showing each step as it happens
                 print("\nProcessing your request...\n")
-                result = orchestrator.execute_task(user_input)
-                
-                # Display the result
-                self.display_result(result)
+                self.display_stream(orchestrator.execute_stream(user_input))
                 
             except KeyboardInterrupt:
                 print("\nExiting ANUS. Goodbye!")
@@ -0,0 +1,32 @@
+"""
+Benchmarks for the agent loops.
+"""
+
+from anus.core.agent.hybrid_agent import HybridAgent
+from anus.core.agent.react_agent import ReactAgent
+from anus.core.agent.tool_agent import ToolAgent
+
+def bench_react_agent_execute(benchmark):
+    agent = ReactAgent(name="bench-react")
+    result = benchmark(agent.execute, "Summarize the quarterly report")
+    assert result["stop_reason"] == "final_answer"
+
+def bench_tool_agent_execute(benchmark):
+    agent = ToolAgent(name="bench-tool", tools=["calculator"])
+    result = benchmark(agent.execute, "Calculate 257 * 89")
+    assert result["answer"] == "22873"
+
+def bench_tool_agent_execute_no_tool(benchmark):
+    agent = ToolAgent(name="bench-tool", tools=["calculator"])
+    benchmark(agent.execute, "What is the capital of Japan?")
+
+def bench_hybrid_agent_single_mode(benchmark):
+    agent = HybridAgent(name="bench-hybrid", tools=["calculator"])
+    agent.mode = "single"
+    benchmark(agent.execute, "Calculate 257 * 89")
+
+def bench_hybrid_agent_multi_mode(benchmark):
+    agent = HybridAgent(name="bench-hybrid", tools=["calculator"])
+    agent.mode = "multi"
+    result = benchmark(agent.execute, "Research and compare the options")
+    assert result["mode"] == "multi"
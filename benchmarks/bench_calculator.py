@@ -0,0 +1,29 @@
+"""
+Benchmarks for the calculator tool.
+"""
+
+import itertools
+
+from anus.tools.calculator import CalculatorTool
+
+def bench_calculator_scalar_cached(benchmark):
+    calculator = CalculatorTool()
+    result = benchmark(calculator.execute, "sqrt(2) * (3 + 4) ** 2 / 7")
+    assert result["status"] == "success"
+
+def bench_calculator_scalar_uncached(benchmark):
+    calculator = CalculatorTool()
+    counter = itertools.count()
+    
+    def evaluate():
+        # A new expression every call, so every call parses and compiles
+        n = next(counter)
+        return calculator.execute(f"({n} + 3) * {n % 97} - sqrt({n})")
+    
+    benchmark(evaluate)
+
+def bench_calculator_batch(benchmark):
+    calculator = CalculatorTool()
+    expressions = [f"({n} + 3) * {n % 97} - sqrt({n})" for n in range(1000)]
+    results = benchmark(calculator.execute_batch, expressions)
+    assert len(results) == 1000
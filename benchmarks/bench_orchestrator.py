@@ -0,0 +1,17 @@
+"""
+Benchmarks for the agent orchestrator.
+"""
+
+import os
+
+from anus.core.orchestrator import AgentOrchestrator
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.yaml")
+
+def bench_orchestrator_construction(benchmark):
+    benchmark.pedantic(AgentOrchestrator, kwargs={"config_path": CONFIG_PATH, "use_cache": False}, rounds=20, warmup_rounds=1)
+
+def bench_orchestrator_execute_task(benchmark):
+    orchestrator = AgentOrchestrator(config_path=CONFIG_PATH, use_cache=False)
+    result = benchmark(orchestrator.execute_task, "Calculate 257 * 89")
+    assert result["answer"] == "22873"
@@ -0,0 +1,19 @@
+"""
+Benchmarks for the command-line cold start.
+"""
+
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_HELP_SCRIPT = "import sys; sys.argv = ['anus', '--help']; import anus.main; anus.main.main()"
+
+def _run_help():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    subprocess.run([sys.executable, "-c", _HELP_SCRIPT], cwd=REPO_ROOT, env=env, check=True, capture_output=True)
+
+def bench_cli_cold_start(benchmark):
+    benchmark.pedantic(_run_help, rounds=10, warmup_rounds=1)
@@ -0,0 +1,287 @@
+"""
+Benchmark runner for ANUS.
+
+Collects the `bench_*` functions from the `bench_*.py` modules in this
+directory, runs each with a `benchmark` fixture compatible with
+pytest-benchmark, and writes the results as JSON. Results can be compared
+against a stored baseline; the run fails when any benchmark's median is
+slower than the baseline by more than the threshold.
+
+The same functions also run under pytest-benchmark, e.g.:
+
+    pytest benchmarks -o python_files='bench_*.py' -o python_functions='bench_*' --benchmark-only
+
+Usage:
+    python benchmarks/run.py [-k FILTER] [--json results.json]
+        [--baseline benchmarks/baseline.json] [--save-baseline]
+        [--threshold 0.25]
+
+The import-time budget of the `anus` command is checked by
+tests/test_startup.py, which runs with the rest of the test suite.
+"""
+
+import argparse
+import gc
+import importlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARKS_DIR)
+
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+class Benchmark:
+    """
+    A minimal stand-in for the pytest-benchmark `benchmark` fixture.
+    
+    Calling it times a function over enough rounds to fill `min_time`;
+    `pedantic` gives explicit control over rounds and iterations.
+    """
+    
+    def __init__(self, name: str, min_time: float = 0.2, max_rounds: int = 1000, min_rounds: int = 5):
+        """
+        Initialize a Benchmark instance.
+        
+        Args:
+            name: The name of the benchmark.
+            min_time: Minimum total measuring time in seconds.
+            max_rounds: Maximum number of rounds.
+            min_rounds: Minimum number of rounds.
+        """
+        self.name = name
+        self.min_time = min_time
+        self.max_rounds = max_rounds
+        self.min_rounds = min_rounds
+        self.stats: Optional[Dict[str, Any]] = None
+    
+    def _run(
+        self,
+        target: Callable,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        setup: Optional[Callable],
+        rounds: int,
+        iterations: int
+    ) -> Any:
+        """Time `rounds` rounds of `iterations` calls and record the statistics."""
+        timings = []
+        result = None
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                call_args, call_kwargs = args, kwargs
+                if setup is not None:
+                    prepared = setup()
+                    if prepared is not None:
+                        call_args, call_kwargs = prepared
+                started = time.perf_counter()
+                for _ in range(iterations):
+                    result = target(*call_args, **call_kwargs)
+                timings.append((time.perf_counter() - started) / iterations)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        self.stats = {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": statistics.fmean(timings),
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": rounds,
+            "iterations": iterations
+        }
+        return result
+    
+    def __call__(self, target: Callable, *args, **kwargs) -> Any:
+        """
+        Benchmark a function, calibrating rounds and iterations automatically.
+        
+        Args:
+            target: The function to time.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+            
+        Returns:
+            The function's return value.
+        """
+        # Warm up caches and measure a single call
+        started = time.perf_counter()
+        target(*args, **kwargs)
+        single = max(time.perf_counter() - started, 1e-7)
+        
+        # Aim for rounds of at least a millisecond to limit timer noise
+        iterations = max(1, int(0.001 / single))
+        rounds = int(self.min_time / (single * iterations))
+        rounds = min(self.max_rounds, max(self.min_rounds, rounds))
+        return self._run(target, args, kwargs, None, rounds, iterations)
+    
+    def pedantic(
+        self,
+        target: Callable,
+        args: Tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        setup: Optional[Callable] = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0
+    ) -> Any:
+        """
+        Benchmark a function with explicit rounds and iterations.
+        
+        Args:
+            target: The function to time.
+            args: Positional arguments for the function.
+            kwargs: Keyword arguments for the function.
+            setup: Optional function run before each round; it may return
+                an (args, kwargs) tuple to call the target with.
+            rounds: Number of rounds.
+            iterations: Calls per round.
+            warmup_rounds: Untimed rounds run first.
+            
+        Returns:
+            The function's return value.
+        """
+        kwargs = kwargs or {}
+        for _ in range(warmup_rounds):
+            prepared = setup() if setup is not None else None
+            call_args, call_kwargs = prepared if prepared is not None else (args, kwargs)
+            target(*call_args, **call_kwargs)
+        return self._run(target, args, kwargs, setup, rounds, iterations)
+
+def collect(name_filter: Optional[str] = None) -> List[Tuple[str, str, Callable]]:
+    """
+    Find the benchmark functions.
+    
+    Args:
+        name_filter: Optional substring the benchmark name must contain.
+        
+    Returns:
+        A list of (group, name, function) tuples, in file and definition order.
+    """
+    found = []
+    for filename in sorted(os.listdir(BENCHMARKS_DIR)):
+        if not (filename.startswith("bench_") and filename.endswith(".py")):
+            continue
+        module = importlib.import_module(filename[:-3])
+        group = filename[len("bench_"):-3]
+        functions = [
+            (name, fn) for name, fn in vars(module).items()
+            if name.startswith("bench_") and inspect.isfunction(fn) and fn.__module__ == module.__name__
+        ]
+        functions.sort(key=lambda item: item[1].__code__.co_firstlineno)
+        for name, fn in functions:
+            if name_filter is None or name_filter in name:
+                found.append((group, name, fn))
+    return found
+
+def run_benchmarks(name_filter: Optional[str] = None, min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Run the benchmarks.
+    
+    Args:
+        name_filter: Optional substring the benchmark name must contain.
+        min_time: Minimum measuring time per automatically calibrated benchmark.
+        
+    Returns:
+        A report in the pytest-benchmark JSON layout.
+    """
+    results = []
+    for group, name, fn in collect(name_filter):
+        benchmark = Benchmark(name, min_time=min_time)
+        fn(benchmark)
+        if benchmark.stats is None:
+            raise RuntimeError(f"Benchmark {name} never called the benchmark fixture")
+        results.append({"group": group, "name": name, "stats": benchmark.stats})
+        stats = benchmark.stats
+        print(
+            f"{name:<45} median {stats['median'] * 1e6:12.1f} us  "
+            f"min {stats['min'] * 1e6:12.1f} us  rounds {stats['rounds']}",
+            flush=True
+        )
+    return {
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "python_implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system()
+        },
+        "datetime": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": results
+    }
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Tuple[str, float, float]]:
+    """
+    Compare a report with a baseline.
+    
+    Args:
+        report: The current report.
+        baseline: A report from an earlier run, e.g. from this runner or
+            from `pytest --benchmark-json`.
+        threshold: Allowed relative slowdown of the median, e.g. 0.25.
+        
+    Returns:
+        A list of (name, baseline median, current median) tuples for the
+        benchmarks that regressed.
+    """
+    previous = {entry["name"]: entry["stats"]["median"] for entry in baseline.get("benchmarks", [])}
+    regressions = []
+    for entry in report["benchmarks"]:
+        before = previous.get(entry["name"])
+        after = entry["stats"]["median"]
+        if before is None:
+            continue
+        change = after / before - 1 if before > 0 else 0.0
+        print(f"{entry['name']:<45} {change * 100:+7.1f}% vs baseline")
+        if change > threshold:
+            regressions.append((entry["name"], before, after))
+    return regressions
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="Run the ANUS benchmarks")
+    parser.add_argument("-k", dest="name_filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown, e.g. 0.25")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum measuring time per benchmark in seconds")
+    args = parser.parse_args()
+    
+    sys.path[:0] = [REPO_ROOT, BENCHMARKS_DIR]
+    os.chdir(REPO_ROOT)
+    report = run_benchmarks(args.name_filter, args.min_time)
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    
+    failed = False
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(
+                f"REGRESSION: {name} median {before * 1e6:.1f} us -> {after * 1e6:.1f} us",
+                file=sys.stderr
+            )
+        failed = bool(regressions)
+    
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from anus.core.agent.hybrid_agent import HybridAgent
 from anus.core.utils import ensure_api_keys
+from anus.ui.cli import CLI
 import sys
 
 def create_agent():
@@ -21,6 +22,7 @@ def interactive_mode():
     ensure_api_keys(["OPENAI_API_KEY"])
     
     agent = create_agent()
+    cli = CLI()
     
     # Print welcome message
     print("\n" + "="*50)
@@ -52,16 +54,9 @@ def interactive_mode():
             if not user_input.strip():
                 continue
                 
-            # Process the task
+            # Process the task, showing each step as it happens
             print("\nProcessing your request...\n")
-            result = agent.execute(user_input)
-            
-            # Display the result
-            print("\nResult:")
-            if isinstance(result, dict) and 'answer' in result:
-                print(result['answer'])
-            else:
-                print(result)
+            cli.display_stream(agent.execute_stream(user_input))
                 
         except KeyboardInterrupt:
             print("\nExiting ANUS interface. Goodbye!")
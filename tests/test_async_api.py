@@ -0,0 +1,52 @@
+"""Tests for the asynchronous agent and orchestrator API."""
+
+import asyncio
+import time
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.core.utils.async_utils import run_sync
+
+class SlowTool:
+    """An async tool that takes a fixed time per call."""
+    
+    is_async = True
+    terminal = True
+    
+    async def aexecute(self, expression: str = "", **kwargs):
+        await asyncio.sleep(0.1)
+        return {"status": "success", "result": expression}
+
+def test_runs_share_one_event_loop_concurrently():
+    agent = ToolAgent(tools=[], max_iterations=3)
+    agent.load_tool("calculator", SlowTool())
+    
+    async def run_all():
+        return await asyncio.gather(*(agent.aexecute(f"Calculate {i} + 1") for i in range(10)))
+    
+    started = time.monotonic()
+    results = asyncio.run(run_all())
+    elapsed = time.monotonic() - started
+    
+    assert [result["answer"] for result in results] == [f"{i} + 1" for i in range(10)]
+    # Ten sequential calls would take a second
+    assert elapsed < 0.5
+
+def test_run_sync_inside_running_loop():
+    async def inner():
+        await asyncio.sleep(0)
+        return 42
+    
+    async def outer():
+        # Must not re-enter the running loop
+        return run_sync(inner())
+    
+    assert run_sync(inner()) == 42
+    assert asyncio.run(outer()) == 42
+
+def test_execute_matches_aexecute():
+    agent = ToolAgent(tools=["calculator"], max_iterations=3)
+    
+    sync_result = agent.execute("Calculate 6 * 7")
+    async_result = asyncio.run(agent.aexecute("Calculate 6 * 7"))
+    
+    assert sync_result["answer"] == async_result["answer"] == "42"
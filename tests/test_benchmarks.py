@@ -0,0 +1,69 @@
+"""Tests for the benchmark runner."""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNNER = os.path.join(REPO_ROOT, "benchmarks", "run.py")
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location("benchmark_runner", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def report(**medians):
+    return {"benchmarks": [{"name": name, "stats": {"median": median}} for name, median in medians.items()]}
+
+def test_fixture_records_statistics():
+    runner = load_runner()
+    benchmark = runner.Benchmark("sum", min_time=0.01)
+    
+    assert benchmark(sum, range(10)) == 45
+    stats = benchmark.stats
+    assert stats["min"] <= stats["median"] <= stats["max"]
+    assert stats["rounds"] >= benchmark.min_rounds
+
+def test_pedantic_runs_setup_before_each_round():
+    runner = load_runner()
+    benchmark = runner.Benchmark("pedantic")
+    setups = []
+    
+    def setup():
+        setups.append(1)
+        return (len(setups),), {}
+    
+    result = benchmark.pedantic(lambda n: n * 2, setup=setup, rounds=3, warmup_rounds=1)
+    
+    assert len(setups) == 4
+    assert result == 8
+    assert benchmark.stats["rounds"] == 3
+
+def test_compare_reports_only_regressions_over_the_threshold():
+    runner = load_runner()
+    baseline = report(fast=1.0, slow=1.0, removed=1.0)
+    current = report(fast=1.1, slow=1.5, added=9.0)
+    
+    assert runner.compare(current, baseline, 0.25) == [("slow", 1.0, 1.5)]
+
+def test_runner_fails_on_a_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    command = [
+        sys.executable, RUNNER, "-k", "calculator_scalar_cached", "--min-time", "0.01",
+        "--baseline", str(baseline)
+    ]
+    
+    saved = subprocess.run(command + ["--save-baseline"], capture_output=True, text=True)
+    assert saved.returncode == 0, saved.stderr
+    entries = json.loads(baseline.read_text())["benchmarks"]
+    assert [entry["name"] for entry in entries] == ["bench_calculator_scalar_cached"]
+    
+    # A baseline a thousand times faster than any real run
+    entries[0]["stats"]["median"] /= 1000
+    baseline.write_text(json.dumps({"benchmarks": entries}))
+    regressed = subprocess.run(command, capture_output=True, text=True)
+    assert regressed.returncode == 1
+    assert "REGRESSION: bench_calculator_scalar_cached" in regressed.stderr
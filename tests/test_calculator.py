@@ -0,0 +1,86 @@
+"""Tests for the calculator tool."""
+
+import pytest
+
+from anus.tools.calculator import CalculatorTool, compile_expression
+
+@pytest.fixture
+def calculator():
+    return CalculatorTool()
+
+@pytest.mark.parametrize("expression, expected", [
+    ("2 + 3 * 4", "14"),
+    ("(2 + 3) * 4", "20"),
+    ("7 / 2", "3.5"),
+    ("7 // 2", "3"),
+    ("-7 % 3", "2"),
+    ("2 ** 10", "1024"),
+    ("sqrt(16) + abs(-2)", "6.0"),
+    ("max(1, 5, 3) - min(4, 2)", "3"),
+    ("round(pi, 2)", "3.14"),
+])
+def test_evaluates_arithmetic(calculator, expression, expected):
+    result = calculator.execute(expression)
+    assert result == {"expression": expression, "result": expected, "status": "success"}
+
+@pytest.mark.parametrize("expression", [
+    "__import__('os').system('true')",
+    "(1).__class__",
+    "open('/etc/passwd')",
+    "[1, 2]",
+    "'a' * 3",
+    "lambda: 1",
+    "x if 1 else 2",
+    "True + 1",
+])
+def test_rejects_constructs_outside_whitelist(calculator, expression):
+    result = calculator.execute(expression)
+    assert result["status"] == "error"
+
+def test_unknown_names_are_errors(calculator):
+    assert calculator.execute("x + 1")["error"] == "Unknown name: x"
+    assert calculator.execute("x + 1", {"x": 2})["result"] == "3"
+
+def test_division_by_zero_is_an_error(calculator):
+    assert calculator.execute("1 / 0")["status"] == "error"
+
+def test_compiled_programs_are_cached():
+    program = compile_expression("1 +  2")
+    assert compile_expression("1 +  2") is program
+    # Spelling variants that normalize alike share a program
+    assert compile_expression(" 1 + 2 ") is program
+    assert compile_expression("1 + 3") is not program
+
+@pytest.mark.parametrize("expression, message", [
+    ("9 ** 9 ** 9", "bits"),
+    ("factorial(100000)", "bits"),
+    ("(10 ** 2000) * (10 ** 2000)", "bits"),
+    ("1 + " * 600 + "1", "steps"),
+    ("-" * 5000 + "1", "nested"),
+], ids=["power", "factorial", "product", "steps", "depth"])
+def test_rejects_expensive_expressions(calculator, expression, message):
+    result = calculator.execute(expression)
+    assert result["status"] == "error"
+    assert message in result["error"]
+
+def test_rejects_long_expressions():
+    calculator = CalculatorTool(max_length=10)
+    assert "characters long" in calculator.execute("1 + 2 + 3 + 4")["error"]
+
+def test_budgets_can_be_disabled():
+    assert CalculatorTool().execute("2 ** 20000 % 7")["status"] == "error"
+    assert CalculatorTool(max_bits=None).execute("2 ** 20000 % 7")["result"] == "4"
+
+def test_batch_matches_scalar_results(calculator):
+    expressions = [f"{i} * 3 + {i % 7} / 2" for i in range(40)] + ["1 / 0", "2 ** 70", "sqrt(-1)"]
+    assert calculator.execute_batch(expressions) == [calculator.execute(e) for e in expressions]
+
+def test_batch_keeps_literals_beyond_int64(calculator):
+    expressions = ["99999999999999999999 + %d" % i for i in range(20)]
+    expressions += ["%d + 1" % (2 ** 63 + i) for i in range(20)]
+    
+    results = calculator.execute_batch(expressions)
+    
+    assert results == [calculator.execute(e) for e in expressions]
+    assert results[0]["result"] == "99999999999999999999"
+    assert results[20]["result"] == str(2 ** 63 + 1)
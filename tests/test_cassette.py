@@ -0,0 +1,126 @@
+"""Tests for recording and replaying model and tool calls."""
+
+import asyncio
+
+import pytest
+
+from anus.core.cassette import Cassette, CassetteMiss, CassetteMode, ReplayLatency
+from anus.core.llm.base import LLMError
+from anus.core.orchestrator import AgentOrchestrator
+from anus.tools.registry import ToolRegistry
+
+MESSAGES = [{"role": "user", "content": "Hello"}]
+
+class ScriptedClient:
+    """A model client that answers from a list and fails when it runs out."""
+    
+    model = "scripted"
+    
+    def __init__(self, *texts):
+        self.texts = list(texts)
+    
+    async def acomplete(self, messages, on_token=None, **options):
+        if not self.texts:
+            raise LLMError("rate limited", status=429, retryable=True)
+        return {"text": self.texts.pop(0), "model": self.model, "usage": {}}
+    
+    def close(self):
+        pass
+
+class CountingTool:
+    """A terminal tool that counts its calls."""
+    
+    terminal = True
+    calls = 0
+    
+    def execute(self, query: str = ""):
+        CountingTool.calls += 1
+        return {"status": "success", "result": query.upper()}
+
+def record_llm(path, *texts):
+    cassette = Cassette(path, mode=CassetteMode.RECORD)
+    client = cassette.wrap_llm(ScriptedClient(*texts))
+    for _ in range(len(texts)):
+        asyncio.run(client.acomplete(MESSAGES))
+    with pytest.raises(LLMError):
+        asyncio.run(client.acomplete(MESSAGES))
+    cassette.close()
+
+def test_replay_answers_in_recorded_order(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    record_llm(path, "first", "second")
+    
+    client = Cassette(path, latency=ReplayLatency.NONE).wrap_llm(None)
+    tokens = []
+    
+    assert asyncio.run(client.acomplete(MESSAGES, on_token=tokens.append))["text"] == "first"
+    assert client.complete(MESSAGES)["text"] == "second"
+    with pytest.raises(LLMError) as error:
+        client.complete(MESSAGES)
+    assert (error.value.status, error.value.retryable) == (429, True)
+    # Repeated requests start over after the last recorded response
+    assert client.complete(MESSAGES)["text"] == "first"
+    assert tokens == ["first"]
+    with pytest.raises(CassetteMiss):
+        client.complete([{"role": "user", "content": "Goodbye"}])
+
+def test_unfinished_recording_can_be_replayed(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    recorder = Cassette(path, mode=CassetteMode.RECORD)
+    recording = recorder.wrap_llm(ScriptedClient("first", "second"))
+    try:
+        recording.complete(MESSAGES)
+        recording.complete(MESSAGES)
+        
+        # The recorder is still open, as after a crash
+        client = Cassette(path, latency=ReplayLatency.NONE).wrap_llm(None)
+        
+        assert [client.complete(MESSAGES)["text"] for _ in range(3)] == ["first", "second", "first"]
+    finally:
+        recorder.close()
+
+def test_replayed_tools_are_not_created(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    CountingTool.calls = 0
+    recorder = Cassette(path, mode=CassetteMode.RECORD)
+    registry = ToolRegistry({"count": CountingTool}, discover=False)
+    recorder.wrap_tools(registry, ["count", "unknown"])
+    assert registry.get("count").execute(query="abc") == {"status": "success", "result": "ABC"}
+    recorder.close()
+    
+    player = Cassette(path, latency=ReplayLatency.NONE)
+    registry = ToolRegistry({"count": CountingTool}, discover=False)
+    player.wrap_tools(registry, ["count"])
+    tool = registry.get("count")
+    
+    assert tool.execute(query="abc") == {"status": "success", "result": "ABC"}
+    assert tool.terminal
+    assert CountingTool.calls == 1
+    with pytest.raises(CassetteMiss):
+        tool.execute(query="xyz")
+
+def test_unsupported_settings_are_rejected(tmp_path):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    with pytest.raises(ValueError):
+        Cassette(path, mode=CassetteMode.OFF)
+    with pytest.raises(ValueError):
+        Cassette(path, mode=CassetteMode.RECORD, latency="slow")
+
+def test_orchestrator_replays_a_recorded_run(tmp_path):
+    cassette = tmp_path / "cassette.jsonl.gz"
+    path = tmp_path / "config.yaml"
+    settings = (
+        "agent: {{mode: single, max_iterations: 3, memory_capacity: 0}}\n"
+        "tools: {{enabled: [calculator]}}\n"
+        "cassette: {{mode: {}, path: '{}', latency: none}}\n"
+    )
+    results = []
+    for mode in (CassetteMode.RECORD, CassetteMode.REPLAY):
+        path.write_text(settings.format(mode, cassette))
+        orchestrator = AgentOrchestrator(str(path))
+        try:
+            results.append(orchestrator.execute_task("Calculate 6 * 7", refresh=True))
+        finally:
+            orchestrator.close()
+    
+    assert [result["answer"] for result in results] == ["42", "42"]
@@ -0,0 +1,116 @@
+"""Tests for checkpointed runs and resuming them."""
+
+import asyncio
+
+import pytest
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.core.checkpoint import CheckpointStore, RunStatus
+from anus.core.orchestrator import AgentOrchestrator
+from anus.tools.calculator import CalculatorTool
+from anus.tools.registry import ToolRegistry
+
+class InterruptedCalculator(CalculatorTool):
+    """A calculator that interrupts the process on a chosen call."""
+    
+    calls = 0
+    interrupt_at = None
+    
+    def execute(self, **kwargs):
+        InterruptedCalculator.calls += 1
+        if InterruptedCalculator.calls == InterruptedCalculator.interrupt_at:
+            raise KeyboardInterrupt
+        return super().execute(**kwargs)
+
+@pytest.fixture
+def store(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.sqlite"))
+    yield store
+    store.close()
+
+def step(iteration):
+    return {"iteration": iteration, "thought": None, "action": {"name": "noop", "input": {}}, "tokens": 0}
+
+def test_store_logs_runs_until_they_finish(store):
+    assert store.begin_run("run", "agent", "task") == []
+    store.append_step("run", 0, step(0))
+    store.append_step("run", 1, step(1))
+    
+    assert store.begin_run("run", "agent", "task") == [step(0), step(1)]
+    assert [run["run_id"] for run in store.unfinished_runs()] == ["run"]
+    assert store.get_run("run")["steps"] == 2
+    
+    store.finish_run("run", {"answer": "done"})
+    run = store.get_run("run")
+    assert (run["status"], run["result"]) == (RunStatus.FINISHED, {"answer": "done"})
+    assert store.unfinished_runs() == []
+    with pytest.raises(ValueError):
+        store.begin_run("run", "agent", "task")
+    
+    store.compact()
+    assert store.get_run("run")["steps"] == 0
+    assert store.get_run("missing") is None
+
+def test_runs_survive_reopening_the_store(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    store = CheckpointStore(path)
+    store.begin_run("run", "agent", "task")
+    store.append_step("run", 0, step(0))
+    store.close()
+    
+    store = CheckpointStore(path)
+    try:
+        assert store.begin_run("run", "agent", "task") == [step(0)]
+    finally:
+        store.close()
+
+def test_interrupted_run_resumes_after_its_last_step(store):
+    registry = ToolRegistry({"calculator": InterruptedCalculator}, discover=False)
+    agent = ToolAgent(name="calc", tools=["calculator"], registry=registry, max_iterations=5, checkpoints=store)
+    InterruptedCalculator.calls, InterruptedCalculator.interrupt_at = 0, 2
+    
+    with pytest.raises(KeyboardInterrupt):
+        asyncio.run(agent.aexecute("Calculate 1 / 0", run_id="run"))
+    assert store.get_run("run")["steps"] == 1
+    
+    result = agent.resume("run")
+    
+    # Only the interrupted iteration runs again
+    assert InterruptedCalculator.calls == 3
+    assert result["context"]["resumed_from"] == 1
+    assert (result["iterations"], result["stop_reason"]) == (2, "loop_detected")
+    assert store.get_run("run")["result"]["stop_reason"] == "loop_detected"
+    with pytest.raises(KeyError):
+        agent.resume("missing")
+
+def test_orchestrator_resumes_unfinished_runs(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "agent: {mode: single, max_iterations: 5, memory_capacity: 0}\n"
+        "tools: {enabled: [calculator]}\n"
+        f"checkpoints: {{enabled: true, path: '{tmp_path / 'checkpoints.sqlite'}'}}\n"
+    )
+    orchestrator = AgentOrchestrator(str(path))
+    try:
+        orchestrator.checkpoints.begin_run("run", "primary-agent", "Calculate 6 * 7")
+        assert [run["task"] for run in orchestrator.unfinished_runs()] == ["Calculate 6 * 7"]
+        
+        result = orchestrator.resume_task("run")
+        
+        assert result["answer"] == "42"
+        assert orchestrator.unfinished_runs() == []
+        with pytest.raises(ValueError):
+            orchestrator.resume_task("run")
+    finally:
+        orchestrator.close()
+
+def test_resuming_needs_checkpoints(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("agent: {memory_capacity: 0}\n")
+    orchestrator = AgentOrchestrator(str(path))
+    try:
+        assert orchestrator.unfinished_runs() == []
+        with pytest.raises(RuntimeError):
+            orchestrator.resume_task("run")
+    finally:
+        orchestrator.close()
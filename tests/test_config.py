@@ -0,0 +1,137 @@
+"""Tests for config loading, validation and reload."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from anus.core.config import ConfigError, ConfigWatcher, freeze, load_config
+from anus.core.orchestrator import AgentOrchestrator
+
+def write(path, text):
+    path.write_text(text)
+    return str(path)
+
+def test_environment_variables_are_expanded(monkeypatch):
+    monkeypatch.setenv("ANUS_TEST_ITERATIONS", "7")
+    monkeypatch.delenv("ANUS_TEST_UNSET", raising=False)
+    config = freeze({
+        "iterations": "${ANUS_TEST_ITERATIONS}",
+        "name": "agent-${ANUS_TEST_ITERATIONS}",
+        "fallback": "${ANUS_TEST_UNSET:-none}",
+        "unset": "${ANUS_TEST_UNSET}"
+    })
+    
+    assert config == {"iterations": 7, "name": "agent-7", "fallback": "none", "unset": "${ANUS_TEST_UNSET}"}
+
+def test_environment_changes_are_seen_by_later_loads(tmp_path, monkeypatch):
+    path = write(tmp_path / "config.yaml", "agent: {max_iterations: '${ANUS_TEST_ITERATIONS:-3}'}\n")
+    monkeypatch.setenv("ANUS_TEST_ITERATIONS", "7")
+    first = load_config(path)
+    
+    assert load_config(path) is first
+    monkeypatch.setenv("ANUS_TEST_ITERATIONS", "9")
+    assert load_config(path)["agent"]["max_iterations"] == 9
+    monkeypatch.delenv("ANUS_TEST_ITERATIONS")
+    assert load_config(path)["agent"]["max_iterations"] == 3
+
+def test_config_is_immutable(tmp_path):
+    config = load_config(write(tmp_path / "config.yaml", "agent: {max_iterations: 3}\ntools: {enabled: [calculator]}\n"))
+    
+    with pytest.raises(TypeError):
+        config["agent"]["max_iterations"] = 5
+    assert config["tools"]["enabled"] == ("calculator",)
+
+@pytest.mark.parametrize("text, setting", [
+    ("agent: {mode: solo}\n", "agent.mode"),
+    ("agent: {max_iterations: 0}\n", "agent.max_iterations"),
+    ("agent: {memory_capacity: -1}\n", "agent.memory_capacity"),
+    ("tools: {enabled: calculator}\n", "tools.enabled"),
+    ("cache: {backend: redis}\n", "cache.backend"),
+    ("cassette: {mode: rewind}\n", "cassette.mode"),
+])
+def test_invalid_settings_are_reported_by_name(tmp_path, text, setting):
+    with pytest.raises(ConfigError, match=setting):
+        load_config(write(tmp_path / "config.yaml", text))
+
+def test_loading_does_not_import_the_cassette(tmp_path):
+    path = write(tmp_path / "config.yaml", "cassette: {mode: replay, latency: none}\n")
+    code = (
+        "import sys\n"
+        "from anus.core.config import load_config\n"
+        f"load_config({path!r})\n"
+        "print('anus.core.cassette' in sys.modules)\n"
+    )
+    
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True).stdout
+    
+    assert output.strip() == "False"
+
+def test_watcher_skips_invalid_edits(tmp_path):
+    path = write(tmp_path / "config.yaml", "agent: {max_iterations: 3}\n")
+    applied = []
+    watcher = ConfigWatcher(path, applied.append)
+    
+    write(tmp_path / "config.yaml", "agent: {max_iterations: -10}\n")
+    assert not watcher.check()
+    write(tmp_path / "config.yaml", "agent: {max_iterations: 12}\n")
+    assert watcher.check()
+    assert [config["agent"]["max_iterations"] for config in applied] == [12]
+
+def test_reload_keeps_running_tasks_on_the_old_agent(tmp_path):
+    path = write(tmp_path / "config.yaml", "agent: {max_iterations: 3, memory_capacity: 0}\n")
+    orchestrator = AgentOrchestrator(path)
+    try:
+        config, agent = orchestrator._acquire()
+        write(tmp_path / "config.yaml", "agent: {max_iterations: 12, memory_capacity: 0}\n")
+        assert orchestrator.reload_config()
+        assert not orchestrator.reload_config()
+        
+        assert config["agent"]["max_iterations"] == agent.max_iterations == 3
+        assert orchestrator.primary_agent.max_iterations == 12
+        orchestrator._release(agent)
+    finally:
+        orchestrator.close()
+
+def test_replaced_memory_is_closed_after_its_tasks(tmp_path):
+    settings = "agent: {{memory_capacity: 10, memory_path: '{}'}}\n"
+    path = write(tmp_path / "config.yaml", settings.format(tmp_path / "first"))
+    orchestrator = AgentOrchestrator(path)
+    try:
+        _, agent = orchestrator._acquire()
+        old_memory = agent.memory
+        old_memory.add("remembered before the reload")
+        
+        write(tmp_path / "config.yaml", settings.format(tmp_path / "second"))
+        orchestrator.reload_config()
+        assert orchestrator.primary_agent.memory is not old_memory
+        # A task still running on the old agent keeps a working store
+        old_memory.add("remembered during the reload")
+        assert old_memory._log is not None
+        
+        orchestrator._release(agent)
+        assert old_memory._log is None
+        assert len(orchestrator.primary_agent.memory) == 0
+    finally:
+        orchestrator.close()
+    
+    assert (tmp_path / "first" / "items.jsonl").read_text().count("remembered") == 2
+
+def test_persisted_memory_is_kept_when_only_its_capacity_changes(tmp_path):
+    settings = "agent: {{memory_capacity: {}, memory_path: '{}'}}\n"
+    path = write(tmp_path / "config.yaml", settings.format(10, tmp_path / "memory"))
+    orchestrator = AgentOrchestrator(path)
+    try:
+        memory = orchestrator.primary_agent.memory
+        memory.add("remembered")
+        write(tmp_path / "config.yaml", settings.format(20, tmp_path / "memory"))
+        orchestrator.reload_config()
+        
+        assert orchestrator.primary_agent.memory is memory
+        assert memory._log is not None
+    finally:
+        orchestrator.close()
+    
+    assert memory._log is None
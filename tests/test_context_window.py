@@ -0,0 +1,64 @@
+"""Tests for the token-budgeted context window."""
+
+import pytest
+
+from anus.core.agent.context_window import SUMMARY_HEADER, CompactionStrategy, ContextWindow
+from anus.core.agent.termination import estimate_tokens
+
+def fill(window, count=10, size=200):
+    for i in range(count):
+        window.append("user", f"step {i} " + "x" * size)
+
+def counted_tokens(window):
+    return sum(estimate_tokens(message["content"]) for message in window.messages())
+
+def test_unbounded_window_keeps_everything():
+    window = ContextWindow()
+    fill(window)
+    
+    assert len(window) == 10
+    assert window.tokens == counted_tokens(window)
+    assert window.stats()["compactions"] == 0
+
+@pytest.mark.parametrize("strategy", CompactionStrategy.ALL)
+def test_window_fits_its_budget_and_keeps_recent_entries(strategy):
+    window = ContextWindow(max_tokens=300, strategy=strategy, keep_recent=4)
+    fill(window)
+    messages = window.messages()
+    
+    assert window.tokens <= 300
+    assert window.tokens == counted_tokens(window)
+    assert [message["content"][:6] for message in messages[-4:]] == ["step 6", "step 7", "step 8", "step 9"]
+    assert all(message["content"].endswith("x" * 200) for message in messages[-4:])
+    stats = window.stats()
+    assert stats["tokens_saved"] > 0
+    assert stats["compactions"] > 0
+
+def test_truncation_shortens_old_entries():
+    window = ContextWindow(max_tokens=400, strategy=CompactionStrategy.TRUNCATE, keep_recent=2, truncate_tokens=8)
+    fill(window)
+    messages = window.messages()
+    
+    assert len(messages) == 10
+    assert messages[0]["content"] == "step 0 " + "x" * 25 + "..."
+    assert window.tokens <= 400
+
+def test_summary_replaces_old_entries():
+    window = ContextWindow(max_tokens=350, strategy=CompactionStrategy.SUMMARIZE, keep_recent=4)
+    fill(window)
+    messages = window.messages()
+    
+    assert len(messages) == 5
+    assert messages[0]["role"] == "system"
+    assert messages[0]["content"].startswith(SUMMARY_HEADER)
+    assert "step 5" in messages[0]["content"]
+
+def test_drop_removes_oldest_entries():
+    window = ContextWindow(max_tokens=300, strategy=CompactionStrategy.DROP, keep_recent=2)
+    fill(window)
+    
+    assert [message["content"][:6] for message in window.messages()] == ["step 5", "step 6", "step 7", "step 8", "step 9"]
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        ContextWindow(strategy="forget")
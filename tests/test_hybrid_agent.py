@@ -0,0 +1,116 @@
+"""Tests for the multi-agent mode of HybridAgent."""
+
+import asyncio
+
+import pytest
+
+from anus.core.agent.hybrid_agent import HybridAgent
+from anus.core.agent.task_graph import Subtask, TaskGraph, plan_task, run_graph
+from anus.core.orchestrator import AgentOrchestrator
+
+def _graph(task):
+    return TaskGraph([
+        Subtask("research", "research it", role="researcher"),
+        Subtask("step-1", "do it", depends_on=["research"]),
+        Subtask("side", "do something else")
+    ])
+
+def test_timed_out_subtask_is_cancelled_and_reported():
+    agent = HybridAgent(tools=[], role_timeout=0.05, planner=_graph)
+    agent.mode = "multi"
+    state = {"cancelled": False}
+    
+    async def slow(task, run_id=None):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+    
+    agent.specialized_agents["researcher"].aexecute = slow
+    result = agent.execute("research and do it")
+    
+    results = result["agent_results"]
+    assert results["research"]["status"] == "timed_out"
+    assert "timed out" in results["research"]["error"]
+    assert results["step-1"]["status"] == "skipped"
+    assert "answer" in results["side"]
+    assert result["status"] == "error"
+    assert result["failed_subtasks"] == ["research", "step-1"]
+    assert state["cancelled"]
+
+def test_review_does_not_replace_a_subtask_named_critic():
+    def planner(task):
+        return TaskGraph([Subtask("critic", "calculate 2 + 2")])
+    
+    agent = HybridAgent(tools=["calculator"], planner=planner, mode="multi")
+    result = agent.execute("check the numbers")
+    
+    assert "calculate 2 + 2" in result["agent_results"]["critic"]["task"]
+    assert "Review the result of" in result["review"]["task"]
+
+def test_plan_follows_the_wording_of_the_task():
+    graph = plan_task("Research solar panels, then calculate 3 * 4 and summarize the costs; write a report")
+    
+    assert [(subtask.id, subtask.role, list(subtask.depends_on)) for subtask in graph] == [
+        ("research", "researcher", []),
+        ("step-1", "executor", ["research"]),
+        ("step-2", "executor", ["step-1"]),
+        ("step-3", "executor", ["step-1"]),
+        ("step-4", "executor", ["step-2", "step-3"])
+    ]
+    assert graph.sinks() == ["step-4"]
+
+def test_cyclic_graphs_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        TaskGraph([Subtask("a", "a", depends_on=["b"]), Subtask("b", "b", depends_on=["a"])])
+
+def test_scheduling_follows_the_dependency_graph():
+    graph = TaskGraph([
+        Subtask("a", "a"),
+        Subtask("b", "b", depends_on=["a"]),
+        Subtask("c", "c", depends_on=["a"]),
+        Subtask("d", "d", depends_on=["a"]),
+        Subtask("e", "e", depends_on=["b", "c", "d"]),
+        Subtask("f", "f")
+    ])
+    events = []
+    running = set()
+    peak = [0]
+    
+    async def run_subtask(subtask, inputs):
+        assert set(inputs) == set(subtask.depends_on)
+        events.append(("start", subtask.id))
+        running.add(subtask.id)
+        peak[0] = max(peak[0], len(running))
+        await asyncio.sleep(0.01)
+        running.discard(subtask.id)
+        events.append(("end", subtask.id))
+        return {"answer": subtask.id}
+    
+    results = asyncio.run(run_graph(graph, run_subtask, max_concurrency=2))
+    
+    assert list(results) == graph.order
+    for subtask in graph:
+        start = events.index(("start", subtask.id))
+        for dependency in subtask.depends_on:
+            assert events.index(("end", dependency)) < start
+    # Independent subtasks overlap, up to the concurrency limit
+    assert peak[0] == 2
+
+def test_orchestrator_mode_selects_the_agent_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("agent: {mode: single, max_iterations: 5, memory_capacity: 0}\ntools: {enabled: [calculator]}\n")
+    orchestrator = AgentOrchestrator(str(path))
+    try:
+        single = orchestrator.execute_task("Calculate 6 * 7")
+        multi = orchestrator.execute_task("Calculate 6 * 7", mode="multi")
+    finally:
+        orchestrator.close()
+    
+    assert single["answer"] == "42"
+    assert "plan" not in single
+    assert multi["mode"] == "multi"
+    assert [subtask["id"] for subtask in multi["plan"]] == ["research", "step-1"]
+    assert set(multi["agent_results"]) == {"research", "step-1"}
+    assert "answer" in multi["review"]
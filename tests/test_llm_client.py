@@ -0,0 +1,193 @@
+"""Tests for the OpenAI-compatible client against a local stub server."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from anus.core.llm.base import LLMError
+from anus.core.llm.openai_client import OpenAIClient
+from anus.core.llm.providers import get_client, release_client
+from anus.core.orchestrator import AgentOrchestrator
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers chat completions, failing the first `failures` requests."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def _reply(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append(payload)
+            server.connections.add(self.client_address)
+            fail = server.failures > 0
+            server.failures -= 1
+        time.sleep(server.delay)
+        if fail:
+            self._reply(503, b'{"error": "overloaded"}')
+            return
+        
+        text = "echo: " + payload["messages"][-1]["content"]
+        if not payload.get("stream"):
+            body = {"model": payload["model"], "choices": [{"message": {"content": text}}], "usage": {"total_tokens": 3}}
+            self._reply(200, json.dumps(body).encode())
+            return
+        
+        words = text.split(" ")
+        chunks = [word + " " for word in words[:-1]] + words[-1:]
+        events = [{"model": payload["model"], "choices": [{"delta": {"content": chunk}}]} for chunk in chunks]
+        events.append({"model": payload["model"], "choices": [], "usage": {"total_tokens": 3}})
+        body = b"".join(b"data: " + json.dumps(event).encode() + b"\n\n" for event in events) + b"data: [DONE]\n\n"
+        self._reply(200, body, "text/event-stream")
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.connections = set()
+    server.failures = 0
+    server.delay = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def make_client(server, **kwargs):
+    host, port = server.server_address
+    return OpenAIClient(model="stub", base_url=f"http://{host}:{port}/v1", backoff=0.001, **kwargs)
+
+def message(text):
+    return [{"role": "user", "content": text}]
+
+def test_completion(server):
+    client = make_client(server)
+    try:
+        response = client.complete(message("hi"), temperature=0)
+    finally:
+        client.close()
+    
+    assert response == {"text": "echo: hi", "model": "stub", "usage": {"total_tokens": 3}}
+    assert server.requests[0]["temperature"] == 0
+
+def test_server_errors_are_retried(server):
+    server.failures = 2
+    client = make_client(server, max_retries=3)
+    try:
+        response = client.complete(message("hi"))
+    finally:
+        client.close()
+    
+    assert response["text"] == "echo: hi"
+    assert len(server.requests) == 3
+
+def test_retries_are_bounded(server):
+    server.failures = 10
+    client = make_client(server, max_retries=1)
+    try:
+        with pytest.raises(LLMError) as info:
+            client.complete(message("hi"))
+    finally:
+        client.close()
+    
+    assert info.value.status == 503
+    assert len(server.requests) == 2
+
+def test_connections_are_kept_alive(server):
+    client = make_client(server, max_concurrency=1)
+    try:
+        for i in range(5):
+            client.complete(message(str(i)))
+    finally:
+        client.close()
+    
+    assert len(server.requests) == 5
+    assert len(server.connections) == 1
+    assert client.pool.created == 1
+
+def test_connections_in_flight_are_closed_after_close(server):
+    server.delay = 0.3
+    client = make_client(server)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(client.complete(message("hi"))))
+    thread.start()
+    while not server.requests:
+        time.sleep(0.01)
+    
+    client.close()
+    thread.join(5)
+    
+    assert results[0]["text"] == "echo: hi"
+    assert client.pool._idle.empty()
+
+def test_streamed_tokens(server):
+    client = make_client(server)
+    tokens = []
+    try:
+        response = client.complete(message("one two"), on_token=tokens.append)
+    finally:
+        client.close()
+    
+    assert tokens == ["echo: ", "one ", "two"]
+    assert response["text"] == "echo: one two"
+    assert response["usage"] == {"total_tokens": 3}
+    assert server.requests[0]["stream"] is True
+
+def test_identical_concurrent_requests_are_coalesced(server):
+    client = make_client(server, coalesce_size=4, coalesce_wait=0.05)
+    try:
+        futures = [client.submit(client._build_request(message("same"), {})) for _ in range(3)]
+        futures.append(client.submit(client._build_request(message("other"), {})))
+        responses = [future.result(timeout=5) for future in futures]
+    finally:
+        client.close()
+    
+    assert [response["text"] for response in responses] == ["echo: same"] * 3 + ["echo: other"]
+    assert len(server.requests) == 2
+
+def test_shared_clients_close_after_last_release():
+    model_config = {"provider": "openai", "name": "stub", "base_url": "http://127.0.0.1:9/v1"}
+    client = get_client(model_config)
+    assert get_client(dict(model_config)) is client
+    
+    release_client(client)
+    assert not client._executor._shutdown
+    release_client(client)
+    assert client._executor._shutdown
+    
+    fresh = get_client(model_config)
+    assert fresh is not client
+    release_client(fresh)
+
+def test_reload_closes_the_replaced_client_after_its_tasks(tmp_path):
+    path = tmp_path / "config.yaml"
+    settings = "agent: {{memory_capacity: 0}}\nmodel: {{enabled: true, name: {}, base_url: 'http://127.0.0.1:9/v1'}}\n"
+    path.write_text(settings.format("first"))
+    orchestrator = AgentOrchestrator(str(path))
+    old_client = orchestrator.primary_agent.llm
+    
+    _, agent = orchestrator._acquire()
+    path.write_text(settings.format("second"))
+    assert orchestrator.reload_config()
+    new_client = orchestrator.primary_agent.llm
+    assert not old_client._executor._shutdown
+    
+    orchestrator._release(agent)
+    assert old_client._executor._shutdown
+    
+    orchestrator.close()
+    assert new_client._executor._shutdown
@@ -0,0 +1,65 @@
+"""Tests for queue-based logging."""
+
+import logging
+import queue
+
+import pytest
+
+from anus.core.utils.logging_utils import LazyQueueHandler, SamplingFilter, configure_logging, shutdown_logging
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    shutdown_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+def record(name, level=logging.DEBUG, msg="message", args=None):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+def test_sampling_keeps_a_fixed_fraction_of_debug_records():
+    sampler = SamplingFilter({"anus.core.agent": 0.1, "anus.core.agent.quiet": 0})
+    kept = [sampler.filter(record("anus.core.agent.react_agent")) for _ in range(30)]
+    
+    assert sum(kept) == 3
+    assert kept[0] and kept[10] and kept[20]
+    assert not any(sampler.filter(record("anus.core.agent.quiet")) for _ in range(10))
+    assert all(sampler.filter(record("anus.tools")) for _ in range(10))
+    assert sampler.filter(record("anus.core.agent.quiet", level=logging.WARNING))
+
+def test_mutable_arguments_are_formatted_when_queued():
+    log_queue = queue.SimpleQueue()
+    handler = LazyQueueHandler(log_queue)
+    items = ["a"]
+    handler.emit(record("test", msg="items %s", args=(items,)))
+    handler.emit(record("test", msg="count %d", args=(3,)))
+    items.append("b")
+    
+    first, second = log_queue.get_nowait(), log_queue.get_nowait()
+    assert (first.msg, first.args) == ("items ['a']", None)
+    assert (second.msg, second.args) == ("count %d", (3,))
+    assert second.getMessage() == "count 3"
+
+def test_records_reach_the_log_file(tmp_path, restore_root_logger):
+    path = tmp_path / "logs" / "anus.log"
+    configure_logging({
+        "level": "DEBUG",
+        "file": str(path),
+        "format": "%(levelname)s %(name)s %(message)s",
+        "sample": {"noisy": 0.5}
+    })
+    logging.getLogger("anus.test").info("hello %s", "world")
+    for i in range(4):
+        logging.getLogger("noisy").debug("debug %d", i)
+    shutdown_logging()
+    
+    assert path.read_text().splitlines() == [
+        "INFO anus.test hello world",
+        "DEBUG noisy debug 0",
+        "DEBUG noisy debug 2"
+    ]
@@ -0,0 +1,84 @@
+"""Tests for the `anus` command."""
+
+import gzip
+import io
+import json
+import sys
+
+from anus import main as anus_main
+from anus.core.batch import BatchRunner
+from anus.core.orchestrator import AgentOrchestrator
+
+def _write_config(tmp_path):
+    cassette = tmp_path / "cassette.jsonl.gz"
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "agent: {mode: single, max_iterations: 3, memory_capacity: 0}\n"
+        "tools: {enabled: [calculator]}\n"
+        f"cassette: {{mode: record, path: '{cassette}'}}\n"
+    )
+    return str(config), cassette
+
+def _read_cassette(path):
+    # Reading to the end fails with EOFError unless the file was closed
+    with gzip.open(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+def test_task_closes_orchestrator(tmp_path, monkeypatch, capsys):
+    config, cassette = _write_config(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(sys, "argv", ["anus", "--config", config, "--task", "Calculate 6 * 7"])
+    # Leave the process-wide logging setup to pytest
+    monkeypatch.setattr(anus_main, "setup_logging", lambda config_path: None)
+    closed = []
+    close = AgentOrchestrator.close
+    monkeypatch.setattr(AgentOrchestrator, "close", lambda self: closed.append(self) or close(self))
+    
+    anus_main.main()
+    
+    assert "42" in capsys.readouterr().out
+    assert len(closed) == 1
+    entries = _read_cassette(cassette)
+    assert [entry["name"] for entry in entries] == ["calculator"]
+
+def test_replay_needs_no_api_key(tmp_path, monkeypatch, capsys):
+    config, cassette = _write_config(tmp_path)
+    monkeypatch.setattr(anus_main, "setup_logging", lambda config_path: None)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(sys, "argv", ["anus", "--config", config, "--task", "Calculate 6 * 7"])
+    anus_main.main()
+    capsys.readouterr()
+    
+    replay = tmp_path / "replay.yaml"
+    with open(config) as f:
+        replay.write_text(f.read().replace("mode: record", "mode: replay"))
+    monkeypatch.delenv("OPENAI_API_KEY")
+    monkeypatch.setattr(sys, "argv", ["anus", "--config", str(replay), "--task", "Calculate 6 * 7"])
+    anus_main.main()
+    
+    assert "42" in capsys.readouterr().out
+
+def test_batch_threads_close_orchestrator(tmp_path):
+    config, cassette = _write_config(tmp_path)
+    output = io.StringIO()
+    
+    stats = BatchRunner(config_path=config, workers=2).run(io.StringIO("Calculate 1 + 2\nCalculate 2 + 3\n"), output)
+    
+    assert stats["tasks"] == 2
+    answers = sorted(json.loads(line)["result"]["answer"] for line in output.getvalue().splitlines())
+    assert answers == ["3", "5"]
+    assert len(_read_cassette(cassette)) == 2
+
+def test_config_mode_is_used_without_mode_option(tmp_path, monkeypatch, capsys):
+    config = tmp_path / "config.yaml"
+    config.write_text("agent: {mode: multi, max_iterations: 3, memory_capacity: 0}\ntools: {enabled: [calculator]}\n")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(sys, "argv", ["anus", "--config", str(config), "--task", "Calculate 6 * 7"])
+    monkeypatch.setattr(anus_main, "setup_logging", lambda config_path: None)
+    
+    anus_main.main()
+    
+    # Only the multi-agent graph runs the role agents
+    output = capsys.readouterr().out
+    assert "[executor]" in output and "[critic]" in output
+    assert "[primary-agent]" not in output
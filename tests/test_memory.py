@@ -0,0 +1,96 @@
+"""Tests for the bounded memory store."""
+
+import subprocess
+import sys
+
+import pytest
+
+from anus.core.memory import MemoryStore
+
+def test_search_ranks_related_items_first():
+    store = MemoryStore(capacity=10)
+    store.add("the capital of japan is tokyo", {"id": 1})
+    store.add("calculate the square root of nine", {"id": 2})
+    store.add("paris is the capital of france", {"id": 3})
+    
+    results = store.search("what is the capital of japan", k=2)
+    
+    assert [result["metadata"]["id"] for result in results] == [1, 3]
+    assert results[0]["score"] > results[1]["score"] > 0
+    assert store.search("unrelated words entirely") == []
+
+def test_least_recently_used_item_is_evicted():
+    store = MemoryStore(capacity=2)
+    store.add("alpha apples")
+    store.add("beta bananas")
+    # Using the first item makes the second the least recently used
+    assert store.search("alpha", k=1)[0]["text"] == "alpha apples"
+    store.add("gamma grapes")
+    
+    assert len(store) == 2
+    assert store.search("beta") == []
+    assert store.search("alpha")[0]["text"] == "alpha apples"
+
+def test_batch_search_matches_single_searches():
+    store = MemoryStore(capacity=5)
+    for text in ["red fox", "blue whale", "red panda", "green frog"]:
+        store.add(text)
+    queries = ["red", "whale", "frog"]
+    
+    assert store.search_batch(queries, k=2) == [store.search(query, k=2) for query in queries]
+
+def test_persisted_store_reloads(tmp_path):
+    store = MemoryStore(capacity=3, path=str(tmp_path))
+    for i in range(5):
+        store.add(f"task number {i}", {"i": i})
+    store.close()
+    
+    reloaded = MemoryStore(capacity=3, path=str(tmp_path))
+    try:
+        assert len(reloaded) == 3
+        assert sorted(result["metadata"]["i"] for result in reloaded.search("task number", k=5)) == [2, 3, 4]
+    finally:
+        reloaded.close()
+
+def test_items_added_before_a_crash_can_be_found(tmp_path):
+    code = (
+        "import os\n"
+        "from anus.core.memory import MemoryStore\n"
+        f"store = MemoryStore(capacity=3, path={str(tmp_path)!r})\n"
+        "store.add('blue whale')\n"
+        "store.add('red fox')\n"
+        "os._exit(1)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=False)
+    
+    reloaded = MemoryStore(capacity=3, path=str(tmp_path))
+    try:
+        assert [result["text"] for result in reloaded.search("whale")] == ["blue whale"]
+    finally:
+        reloaded.close()
+
+def test_closed_store_cannot_change(tmp_path):
+    store = MemoryStore(capacity=3, path=str(tmp_path))
+    store.add("blue whale")
+    store.close()
+    
+    with pytest.raises(RuntimeError):
+        store.add("red fox")
+    with pytest.raises(RuntimeError):
+        store.clear()
+    assert [result["text"] for result in store.search("whale")] == ["blue whale"]
+
+def test_orchestrator_start_does_not_import_numpy(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text("agent: {memory_capacity: 2000}\ntools: {enabled: [calculator]}\n")
+    code = (
+        "import sys\n"
+        "from anus.core.orchestrator import AgentOrchestrator\n"
+        f"orchestrator = AgentOrchestrator({str(config)!r})\n"
+        "assert orchestrator.primary_agent.memory is not None\n"
+        "print('numpy' in sys.modules)\n"
+        "orchestrator.close()\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    
+    assert output.strip() == "False"
@@ -0,0 +1,50 @@
+"""Tests for run hooks and metrics."""
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.core.metrics import MetricsCollector
+from anus.core.orchestrator import AgentOrchestrator
+
+class Recorder:
+    """A hook that keeps every task end event."""
+    
+    def __init__(self):
+        self.ends = []
+    
+    def on_task_end(self, event):
+        self.ends.append(event)
+
+def test_orchestrator_and_agent_statuses_agree(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("agent: {mode: single, max_iterations: 5, memory_capacity: 0}\ntools: {enabled: [calculator]}\n")
+    orchestrator = AgentOrchestrator(str(path))
+    recorder = Recorder()
+    orchestrator.add_hook(recorder)
+    try:
+        orchestrator.execute_task("Calculate 6 * 7")
+        orchestrator.execute_task("Write a poem")
+    finally:
+        orchestrator.close()
+    
+    statuses = {}
+    for event in recorder.ends:
+        statuses.setdefault(event["agent"], []).append(event["status"])
+    assert statuses == {"primary-agent": ["success", "incomplete"], "orchestrator": ["success", "incomplete"]}
+
+def test_prometheus_export():
+    metrics = MetricsCollector()
+    agent = ToolAgent(name="calc", tools=["calculator"], max_iterations=5)
+    agent.add_hook(metrics)
+    agent.execute("Calculate 6 * 7")
+    agent.execute("Calculate 1 / 0")
+    
+    text = metrics.to_prometheus()
+    
+    # Dividing by zero fails twice before loop detection ends the run
+    assert 'anus_tasks_total{agent="calc",status="success"} 1' in text
+    assert 'anus_tasks_total{agent="calc",status="incomplete"} 1' in text
+    assert 'anus_task_duration_seconds_count{agent="calc"} 2' in text
+    assert 'anus_tool_call_duration_seconds_count{agent="calc",tool="calculator"} 3' in text
+    assert 'anus_errors_total{agent="calc",source="tool"} 2' in text
+    
+    metrics.reset()
+    assert metrics.to_prometheus().strip() == ""
@@ -0,0 +1,39 @@
+"""Tests for the orchestrator's result cache."""
+
+import pytest
+
+from anus.core.orchestrator import AgentOrchestrator
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "agent: {mode: single, max_iterations: 5, memory_capacity: 0}\n"
+        "tools: {enabled: [calculator]}\n"
+        f"cache: {{enabled: true, backend: sqlite, path: '{tmp_path / 'cache.sqlite'}'}}\n"
+    )
+    return str(path)
+
+def test_answers_are_cached_across_orchestrators(config_path):
+    orchestrator = AgentOrchestrator(config_path)
+    first = orchestrator.execute_task("Calculate 6 * 7")
+    orchestrator.close()
+    
+    orchestrator = AgentOrchestrator(config_path)
+    second = orchestrator.execute_task("Calculate  6 * 7")
+    refreshed = orchestrator.execute_task("Calculate 6 * 7", refresh=True)
+    orchestrator.close()
+    
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert second["answer"] == first["answer"] == "42"
+    assert "cached" not in refreshed
+
+def test_incomplete_runs_are_not_cached(config_path):
+    orchestrator = AgentOrchestrator(config_path)
+    first = orchestrator.execute_task("Write a poem")
+    second = orchestrator.execute_task("Write a poem")
+    orchestrator.close()
+    
+    assert first["stop_reason"] == "loop_detected"
+    assert "cached" not in second
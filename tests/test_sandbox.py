@@ -0,0 +1,162 @@
+"""Tests for the tool sandbox."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from anus.core.orchestrator import AgentOrchestrator
+from anus.tools.registry import ToolRegistry
+from anus.tools.sandbox import SandboxedTool, SandboxPool, _recv, _send, create_sandbox
+
+# Workers import the tools below from this module by name
+SPECS = {
+    "pid": "test_sandbox:PidTool",
+    "sleep": "test_sandbox:SleepTool",
+    "exit": "test_sandbox:ExitTool"
+}
+
+class PidTool:
+    """A tool that reports the process it runs in."""
+    
+    deterministic = True
+    
+    def execute(self):
+        return {"status": "success", "result": os.getpid()}
+
+class SleepTool:
+    """A tool that sleeps for a while."""
+    
+    def execute(self, seconds: float = 0):
+        time.sleep(seconds)
+        return {"status": "success", "result": seconds}
+
+class ExitTool:
+    """A tool that kills the process it runs in."""
+    
+    def execute(self):
+        os._exit(3)
+
+@pytest.fixture
+def pool():
+    pool = SandboxPool(SPECS, workers=1, timeout=5, max_cpu_seconds=None, max_calls=None)
+    yield pool
+    pool.close()
+
+def pid(pool):
+    return pool.call("pid", {})["result"]
+
+def test_calls_run_in_a_worker_process(pool):
+    first = pid(pool)
+    
+    assert first != os.getpid()
+    assert pid(pool) == first
+    assert pool.call("sleep", {"seconds": 0}) == {"status": "success", "result": 0}
+    assert pool.call("missing", {}) == {"status": "error", "error": "Unknown tool: missing"}
+
+def test_timed_out_worker_is_replaced(pool):
+    first = pid(pool)
+    
+    result = pool.call("sleep", {"seconds": 30}, timeout=0.5)
+    
+    assert result == {"status": "error", "error": "Tool sleep timed out after 0.5 seconds"}
+    assert pid(pool) != first
+
+def test_crashed_worker_is_replaced(pool):
+    first = pid(pool)
+    
+    result = pool.call("exit", {})
+    
+    assert result == {"status": "error", "error": "Tool exit crashed its worker (exit code 3)"}
+    assert pid(pool) != first
+
+def test_workers_are_recycled_after_max_calls():
+    pool = SandboxPool(SPECS, workers=1, max_cpu_seconds=None, max_calls=2)
+    try:
+        pids = [pid(pool) for _ in range(4)]
+    finally:
+        pool.close()
+    
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+
+def test_closed_pool_rejects_calls():
+    pool = SandboxPool(SPECS, workers=1)
+    pool.close()
+    
+    with pytest.raises(RuntimeError):
+        pool.call("pid", {})
+
+def test_close_wakes_calls_waiting_for_a_worker():
+    pool = SandboxPool(SPECS, workers=1, max_cpu_seconds=None)
+    results = {}
+    
+    def call(name, **kwargs):
+        try:
+            results[name] = pool.call(name, kwargs)
+        except RuntimeError as e:
+            results[name] = e
+    
+    busy = threading.Thread(target=call, args=("sleep",), kwargs={"seconds": 0.5}, daemon=True)
+    busy.start()
+    time.sleep(0.1)
+    waiting = threading.Thread(target=call, args=("pid",), daemon=True)
+    waiting.start()
+    time.sleep(0.1)
+    pool.close()
+    busy.join(5)
+    waiting.join(5)
+    
+    assert results["sleep"] == {"status": "success", "result": 0.5}
+    assert isinstance(results["pid"], RuntimeError)
+    assert pool._workers == []
+
+def test_large_buffers_are_sent_out_of_band():
+    numpy = pytest.importorskip("numpy")
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    array = numpy.arange(100000, dtype=numpy.float32)
+    
+    # The pipe holds less than the array, so it is read while being sent
+    thread = threading.Thread(target=_send, args=(sender, {"vectors": array}))
+    thread.start()
+    received = _recv(receiver)["vectors"]
+    thread.join()
+    
+    assert numpy.array_equal(received, array)
+    # Only buffers received on their own are used in place, read-only
+    assert not received.flags.writeable
+
+def test_create_sandbox_replaces_registered_tools():
+    registry = ToolRegistry({"pid": SPECS["pid"], "echo": lambda: PidTool()}, discover=False)
+    pool = create_sandbox(registry, ["pid", "unknown"], workers=1, max_cpu_seconds=None)
+    try:
+        tool = registry.get("pid")
+        
+        assert isinstance(tool, SandboxedTool)
+        assert tool.deterministic and not tool.terminal
+        assert asyncio.run(tool.aexecute())["result"] != os.getpid()
+    finally:
+        pool.close()
+    
+    with pytest.raises(ValueError, match="echo"):
+        create_sandbox(registry, ["echo"])
+
+def test_orchestrator_runs_sandboxed_tools(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "agent: {mode: single, max_iterations: 5, memory_capacity: 0}\n"
+        "tools: {enabled: [calculator], sandbox: {enabled: true, tools: [calculator], workers: 1}}\n"
+    )
+    orchestrator = AgentOrchestrator(str(path))
+    try:
+        result = orchestrator.execute_task("Calculate 6 * 7")
+        pool = orchestrator.tool_sandbox
+        
+        assert (result["answer"], result["stop_reason"]) == ("42", "tool_success")
+        assert isinstance(orchestrator._tool_registry.get("calculator"), SandboxedTool)
+    finally:
+        orchestrator.close()
+    
+    assert pool._workers == []
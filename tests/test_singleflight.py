@@ -0,0 +1,81 @@
+"""Tests for single-flight coalescing."""
+
+import asyncio
+
+import pytest
+
+from anus.core.orchestrator import AgentOrchestrator
+from anus.core.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+    
+    async def main():
+        return await asyncio.gather(*(flight.ado("key", work) for _ in range(5)))
+    
+    results = asyncio.run(main())
+    
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["result"] * 5
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert flight.in_flight() == 0
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+    
+    async def work():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+    
+    async def main():
+        return await asyncio.gather(*(flight.ado("key", work) for _ in range(3)), return_exceptions=True)
+    
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+def test_execution_is_cancelled_with_its_last_waiter():
+    flight = SingleFlight()
+    state = {"cancelled": False}
+    
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+    
+    async def main():
+        first = asyncio.ensure_future(flight.ado("key", work))
+        second = asyncio.ensure_future(flight.ado("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        await asyncio.sleep(0.01)
+        assert not state["cancelled"]
+        second.cancel()
+        await asyncio.sleep(0.01)
+        with pytest.raises(asyncio.CancelledError):
+            await second
+    
+    asyncio.run(main())
+    assert state["cancelled"]
+    assert flight.in_flight() == 0
+
+def test_orchestrator_coalesces_identical_tasks(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("agent: {mode: single, memory_capacity: 0}\ntools: {enabled: [calculator]}\n")
+    orchestrator = AgentOrchestrator(str(path))
+    
+    async def main():
+        return await asyncio.gather(*(orchestrator.execute_task_async("Calculate 6 * 7") for _ in range(3)))
+    
+    results = asyncio.run(main())
+    orchestrator.close()
+    
+    assert [result["answer"] for result in results] == ["42"] * 3
+    assert sum(bool(result.get("coalesced")) for result in results) == 2
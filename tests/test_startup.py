@@ -0,0 +1,71 @@
+"""
+Import-time budget for the `anus` command.
+
+Importing `anus.main` must stay cheap: heavy dependencies are imported only
+after arguments are parsed, so that `anus --help` and argument errors return
+at once. The budget can be raised on slow machines with the
+ANUS_STARTUP_BUDGET_MS environment variable.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# Budget for the cumulative import time of anus.main, in milliseconds
+STARTUP_BUDGET_MS = float(os.environ.get("ANUS_STARTUP_BUDGET_MS", 30.0))
+
+# Measurements taken; the best one is compared with the budget
+RUNS = 5
+
+# Modules that must not be imported before arguments are parsed
+HEAVY_MODULES = ("anus.core.orchestrator", "anus.core.agent.tool_agent", "anus.ui.cli", "numpy", "yaml")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+def measure_import_time() -> Tuple[float, Dict[str, float]]:
+    """
+    Import anus.main once in a fresh interpreter under -X importtime.
+    
+    Returns:
+        A tuple of the cumulative import time of anus.main in milliseconds and
+        the self time in milliseconds of every module it imported.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import anus.main"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    cumulative = None
+    modules: Dict[str, float] = {}
+    for line in process.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, _, module = match.groups()
+        modules[module] = int(self_us) / 1000
+        if module == "anus.main":
+            cumulative = int(cumulative_us) / 1000
+    assert cumulative is not None, "anus.main did not appear in the import-time report"
+    return cumulative, modules
+
+def test_import_time_is_within_budget():
+    cumulative, modules = min((measure_import_time() for _ in range(RUNS)), key=lambda run: run[0])
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:10]
+    report = "\n".join(f"  {ms:7.2f} ms  {module}" for module, ms in slowest)
+    assert cumulative <= STARTUP_BUDGET_MS, (
+        f"Importing anus.main took {cumulative:.1f} ms, over the budget of {STARTUP_BUDGET_MS:.1f} ms. "
+        f"Slowest modules (self time):\n{report}"
+    )
+
+def test_heavy_modules_are_not_imported():
+    _, modules = measure_import_time()
+    assert [module for module in HEAVY_MODULES if module in modules] == []
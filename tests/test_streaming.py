@@ -0,0 +1,96 @@
+"""Tests for streamed agent and orchestrator runs."""
+
+import asyncio
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.core.llm.base import LLMClient
+from anus.core.orchestrator import AgentOrchestrator
+
+class StreamingClient(LLMClient):
+    """A model client that streams a fixed thought in two tokens."""
+    
+    def _send(self, request):
+        return {"text": "I should calculate", "model": self.model, "usage": {"total_tokens": 4}}
+    
+    def _send_stream(self, request, on_token):
+        on_token("I should ")
+        on_token("calculate")
+        return self._send(request)
+
+class HangingTool:
+    """An async tool that never finishes unless cancelled."""
+    
+    is_async = True
+    
+    def __init__(self):
+        self.cancelled = asyncio.Event()
+    
+    async def aexecute(self, **kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return {"status": "success", "result": "late"}
+
+def test_agent_events_arrive_in_order():
+    agent = ToolAgent(tools=["calculator"], max_iterations=5)
+    events = list(agent.execute_stream("Calculate 6 * 7"))
+    
+    types = [event["type"] for event in events]
+    assert types[:3] == ["thought", "action", "observation"]
+    assert types[-1] == "final"
+    assert types.count("final") == 1
+    assert events[1]["name"] == "calculator"
+    assert events[-1]["answer"] == "42"
+    assert events[-1]["result"]["answer"] == "42"
+
+def test_model_tokens_are_streamed_before_the_thought():
+    llm = StreamingClient("stub")
+    agent = ToolAgent(name="streamer", tools=["calculator"], max_iterations=5, llm=llm)
+    try:
+        events = list(agent.execute_stream("Calculate 6 * 7"))
+    finally:
+        llm.close()
+    
+    tokens = [event for event in events if event["type"] == "token"]
+    assert [event["text"] for event in tokens[:2]] == ["I should ", "calculate"]
+    assert all(event["agent"] == "streamer" for event in tokens)
+    first_thought = next(i for i, event in enumerate(events) if event["type"] == "thought")
+    assert events.index(tokens[1]) < first_thought
+    assert events[first_thought]["text"] == "I should calculate"
+
+def test_stopping_early_cancels_the_run():
+    tool = HangingTool()
+    agent = ToolAgent(tools=[], max_iterations=3)
+    agent.load_tool("calculator", tool)
+    
+    async def consume():
+        stream = agent.aexecute_stream("Calculate 1 + 1")
+        async for event in stream:
+            if event["type"] == "action":
+                break
+        await stream.aclose()
+        await asyncio.wait_for(tool.cancelled.wait(), 1)
+    
+    asyncio.run(consume())
+    assert tool.cancelled.is_set()
+
+def test_cached_orchestrator_results_stream_only_the_final_event(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "agent: {mode: single, max_iterations: 5, memory_capacity: 0}\n"
+        "tools: {enabled: [calculator]}\n"
+        "cache: {enabled: true, backend: memory}\n"
+    )
+    orchestrator = AgentOrchestrator(str(path))
+    try:
+        first = list(orchestrator.execute_stream("Calculate 6 * 7"))
+        second = list(orchestrator.execute_stream("Calculate 6 * 7"))
+    finally:
+        orchestrator.close()
+    
+    assert len(first) > 1
+    assert first[-1]["answer"] == "42"
+    assert [event["type"] for event in second] == ["final"]
+    assert second[0]["result"]["cached"] is True
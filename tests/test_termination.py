@@ -0,0 +1,39 @@
+"""Tests for how agent runs end."""
+
+import pytest
+
+from anus.core.agent.react_agent import ReactAgent
+from anus.core.agent.termination import RunBudget, StopReason
+from anus.core.agent.tool_agent import ToolAgent
+
+def test_react_agent_stops_on_final_answer():
+    result = ReactAgent(max_iterations=10).execute("Write a poem")
+    assert result["stop_reason"] == StopReason.FINAL_ANSWER
+    assert result["iterations"] == 2
+
+def test_terminal_tool_success_ends_run():
+    result = ToolAgent(tools=["calculator"], max_iterations=10).execute("Calculate 2 + 2")
+    assert result["stop_reason"] == StopReason.TOOL_SUCCESS
+    assert result["iterations"] == 1
+    assert result["answer"] == "4"
+
+def test_repeated_action_and_observation_ends_run():
+    result = ToolAgent(max_iterations=10).execute("Write a poem")
+    assert result["stop_reason"] == StopReason.LOOP_DETECTED
+    assert result["iterations"] == 2
+
+@pytest.mark.parametrize("options, reason", [
+    ({"max_iterations": 1}, StopReason.MAX_ITERATIONS),
+    ({"max_tokens": 5}, StopReason.TOKEN_BUDGET),
+    ({"max_time": 0.0}, StopReason.TIME_BUDGET),
+])
+def test_budgets_end_run(options, reason):
+    result = ToolAgent(**options).execute("Write a poem")
+    assert result["stop_reason"] == reason
+
+def test_budget_detects_repeats():
+    budget = RunBudget(max_iterations=5)
+    action, observation = {"name": "a", "input": {}}, {"status": "error"}
+    assert not budget.is_repeat(action, observation)
+    assert budget.is_repeat(action, dict(observation))
+    assert not budget.is_repeat(action, {"status": "success"})
@@ -0,0 +1,44 @@
+"""Tests for memoization of deterministic tool calls."""
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.core.cache import LRUCache
+
+class CountingTool:
+    """A tool that counts its calls."""
+    
+    def __init__(self, deterministic):
+        self.deterministic = deterministic
+        self.calls = 0
+    
+    def execute(self, **kwargs):
+        self.calls += 1
+        return {"status": "success", "result": "done"}
+
+def _agent(tool, **options):
+    agent = ToolAgent(max_iterations=5, **options)
+    # The simulated agent calls "dummy_action" with the same input every iteration
+    agent.load_tool("dummy_action", tool)
+    return agent
+
+def test_deterministic_calls_are_memoized_within_a_run():
+    tool = CountingTool(deterministic=True)
+    result = _agent(tool).execute("Write a poem")
+    
+    assert result["iterations"] == 2
+    assert tool.calls == 1
+    assert result["context"]["tool_cache"] == {"hits": 1, "misses": 1}
+
+def test_other_calls_are_not_memoized():
+    tool = CountingTool(deterministic=False)
+    _agent(tool).execute("Write a poem")
+    assert tool.calls == 2
+
+def test_session_cache_is_shared_across_runs():
+    tool = CountingTool(deterministic=True)
+    agent = _agent(tool, tool_cache=LRUCache(maxsize=16))
+    
+    agent.execute("Write a poem")
+    result = agent.execute("Write a poem")
+    
+    assert tool.calls == 1
+    assert result["context"]["tool_cache"] == {"hits": 2, "misses": 0}
@@ -0,0 +1,44 @@
+"""Tests for the lazy tool registry."""
+
+import sys
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.tools.registry import ToolRegistry
+
+class EchoTool:
+    """A tool that returns its input."""
+    
+    instances = 0
+    
+    def __init__(self):
+        EchoTool.instances += 1
+    
+    def execute(self, query: str = ""):
+        return {"status": "success", "result": query}
+
+def test_tools_are_created_on_first_use():
+    EchoTool.instances = 0
+    registry = ToolRegistry({"echo": EchoTool}, discover=False)
+    agent = ToolAgent(tools=["echo"], registry=registry)
+    
+    assert EchoTool.instances == 0
+    assert agent.tools == {"echo": None}
+    
+    tool = registry.get("echo")
+    assert registry.get("echo") is tool
+    assert EchoTool.instances == 1
+
+def test_import_paths_are_imported_lazily():
+    sys.modules.pop("anus.tools.calculator", None)
+    registry = ToolRegistry(discover=False)
+    
+    assert registry.has("calculator")
+    assert "anus.tools.calculator" not in sys.modules
+    assert registry.get("calculator").execute("1 + 1")["result"] == "2"
+    assert "anus.tools.calculator" in sys.modules
+
+def test_unknown_tools_are_not_loaded():
+    registry = ToolRegistry({}, discover=False)
+    agent = ToolAgent(tools=["missing"], registry=registry)
+    assert agent.tools == {}
+    assert not agent.load_tool("missing")
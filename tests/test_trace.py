@@ -0,0 +1,55 @@
+"""Tests for agent run traces."""
+
+import json
+
+import pytest
+
+from anus.core.agent.tool_agent import ToolAgent
+from anus.core.agent.trace import Trace, TraceLevel
+from anus.core.utils.serialization import json_default
+
+def _record(trace):
+    trace.record_thought(None)
+    trace.record_action({"name": "calculator", "input": {"expression": "1 + 1"}})
+    trace.record_observation({"status": "success", "result": "2"})
+
+def test_full_trace_renders_dictionary_view():
+    trace = Trace("task", TraceLevel.FULL, thought_template="Thinking about {task} ({iteration})")
+    _record(trace)
+    trace["tool_cache"] = {"hits": 0}
+    
+    assert trace.to_dict() == {
+        "task": "task",
+        "thoughts": ["Thinking about task (0)"],
+        "actions": [{"name": "calculator", "input": {"expression": "1 + 1"}}],
+        "observations": [{"status": "success", "result": "2"}],
+        "tool_cache": {"hits": 0}
+    }
+
+def test_summary_trace_keeps_names_and_statuses_only():
+    trace = Trace("task", TraceLevel.SUMMARY)
+    _record(trace)
+    assert trace["thoughts"] == []
+    assert trace["actions"] == [{"name": "calculator"}]
+    assert trace["observations"] == [{"status": "success"}]
+
+def test_off_trace_only_counts_steps():
+    trace = Trace("task", TraceLevel.OFF)
+    _record(trace)
+    assert trace.steps == 1
+    assert trace["actions"] == trace["observations"] == []
+    assert trace.last_observation == {"status": "success", "result": "2"}
+
+def test_recorded_fields_are_read_only():
+    trace = Trace("task")
+    with pytest.raises(KeyError):
+        trace["actions"] = []
+    with pytest.raises(ValueError):
+        Trace("task", "verbose")
+
+def test_agent_results_serialize_at_every_level():
+    for level in TraceLevel.ALL:
+        result = ToolAgent(tools=["calculator"], trace_level=level).execute("Calculate 2 + 2")
+        data = json.loads(json.dumps(result, default=json_default))
+        assert data["answer"] == "4"
+        assert data["context"]["task"] == "Calculate 2 + 2"